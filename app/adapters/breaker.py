@@ -0,0 +1,87 @@
+"""
+Consecutive-failure circuit breaker.
+
+    closed     calls go through; `failure_threshold` failures in a row open it
+    open       calls are refused until `reset_timeout_s` has passed
+    half-open  one trial call goes through: success closes the breaker,
+               failure opens it for another `reset_timeout_s`
+
+A trial that never reports back (its caller was cancelled) stops blocking
+new trials after `reset_timeout_s`.  Every trip starts a new `generation`;
+a caller passes the one its call started in when reporting, so a slow call
+from before the trip can neither close nor re-open the breaker.  Single event loop only, like the
+other in-process helpers here.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_s: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        self._threshold = failure_threshold
+        self._reset_timeout_s = reset_timeout_s
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_at: Optional[float] = None
+        self.opened = 0  # times the breaker tripped
+        # bumped on every (re)open; reports from older calls are stale
+        self.generation = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if self._clock() - self._opened_at < self._reset_timeout_s:
+            return OPEN
+        return HALF_OPEN
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        now = self._clock()
+        if (
+            self._trial_at is not None
+            and now - self._trial_at < self._reset_timeout_s
+        ):
+            return False  # a trial is already in flight
+        self._trial_at = now
+        return True
+
+    def record_success(self, generation: Optional[int] = None) -> None:
+        if self._stale(generation):
+            return
+        self._failures = 0
+        self._opened_at = self._trial_at = None
+
+    def record_failure(self, generation: Optional[int] = None) -> None:
+        if self._stale(generation):
+            return
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self._threshold:
+            if self._opened_at is None:
+                self.opened += 1
+            # (re)open; a failed half-open trial restarts the wait
+            self._opened_at = self._clock()
+            self._trial_at = None
+            self.generation += 1
+
+    def _stale(self, generation: Optional[int]) -> bool:
+        """Reported by a call that started before the last trip?"""
+        return generation is not None and generation != self.generation
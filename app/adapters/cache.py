@@ -0,0 +1,60 @@
+"""
+Small bounded LRU with per-entry TTL, shared by the caching decorators.
+
+Single event-loop use only (no locking): every operation is synchronous and
+never awaits, so it cannot be interleaved inside one loop.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLLRUCache(Generic[V]):
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_s: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max = max_entries
+        self._ttl = ttl_s
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[V, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default=None):
+        """Return the live value (refreshing its LRU position) or `default`."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        value, expires_at = entry  # type: ignore[misc]
+        if expires_at <= self._clock():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl_s: Optional[float] = None) -> None:
+        ttl = self._ttl if ttl_s is None else ttl_s
+        self._data[key] = (value, self._clock() + ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
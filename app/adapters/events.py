@@ -0,0 +1,138 @@
+"""
+In-process change bus feeding GET /tickets/events.
+
+Published changes go into ONE bounded ring buffer.  Subscribers don't get
+their own queues.  Each one keeps a cursor (the last `seq` it has seen) and
+reads from the ring at its own pace.  Publishing is therefore O(1) and
+never blocks, however many clients are connected.  A client that falls
+further behind than the ring holds (or presents a cursor from another
+process lifetime) is told to `reset`, i.e. to re-fetch its list.
+
+With several worker processes, each one's bus follows the shared change
+log instead (see share() and Container.apply_remote_changes): events keep
+the log's seq and ids carry the log's epoch, so a cursor issued by one
+worker can be resumed on any other.
+
+Single event-loop use only, like app.adapters.cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import secrets
+from collections import deque
+from dataclasses import replace
+from typing import Deque, List, Optional, Set, Tuple
+
+from app.core.models import ChangeEvent, Ticket
+
+
+class ChangeBus:
+    """Implements ChangeBusPort."""
+
+    def __init__(self, buffer_size: int = 1024) -> None:
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be >= 1")
+        self._events: Deque[ChangeEvent] = deque(maxlen=buffer_size)
+        self._seq = 0
+        # cursors below this have missed events (overwritten or reset)
+        self._floor = 0
+        self._waiters: Set[asyncio.Future] = set()
+        # event ids are "<epoch>-<seq>": a restart invalidates old cursors
+        self.epoch = secrets.token_hex(4)
+        self.shared = False
+
+    def share(self, epoch: str, seq: int) -> None:
+        """
+        Number events like a change log shared with other processes, whose
+        newest entry is `seq`: from now on every publish() passes the
+        entry's seq, and ids are valid on every bus following the log.
+        """
+        self.epoch = epoch
+        self.shared = True
+        self._seq = self._floor = seq
+        self._events.clear()
+        self._wake()
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def publish(
+        self, kind: str, ticket: Ticket, seq: Optional[int] = None
+    ) -> None:
+        """`seq` (shared buses only) must be newer than the last one."""
+        if seq is None:
+            seq = self._seq + 1
+        elif seq <= self._seq:
+            raise ValueError(f"seq {seq} is not after {self._seq}")
+        if len(self._events) == self._events.maxlen:
+            self._floor = self._events[0].seq  # about to be overwritten
+        self._seq = seq
+        # snapshot: the caller may keep mutating its Ticket
+        self._events.append(ChangeEvent(seq, kind, replace(ticket)))
+        self._wake()
+
+    def reset(self, seq: Optional[int] = None) -> None:
+        """
+        Changes were missed (up to `seq`, on a shared bus): every
+        subscriber has to re-fetch its list.
+        """
+        if seq is None:
+            seq = self._seq + 1
+        # every cursor is now behind an empty ring
+        self._seq = self._floor = max(seq, self._seq)
+        self._events.clear()
+        self._wake()
+
+    def _wake(self) -> None:
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    def since(self, seq: Optional[int]) -> Tuple[List[ChangeEvent], bool]:
+        """
+        Events after `seq`, oldest first.  The flag is True when they can't
+        be replayed (no cursor, unknown cursor, or overwritten in the ring);
+        the caller then restarts from `last_seq` with an empty list.  On a
+        shared bus a cursor ahead of `last_seq` comes from a process that
+        read the log first: its events will arrive here too.
+        """
+        if seq is None or (seq > self._seq and not self.shared):
+            return [], True
+        if seq >= self._seq:
+            return [], False
+        if seq < self._floor:
+            return [], True
+        events = list(self._events)
+        start = bisect.bisect_right(events, seq, key=lambda e: e.seq)
+        return events[start:], False
+
+    async def wait(self, seq: int, timeout: float) -> bool:
+        """Wait until something newer than `seq` is published (or timeout)."""
+        if self._seq > seq:
+            return True
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._waiters.discard(waiter)
+        return True
+
+    # ----------------------------- event ids --------------------------------
+    def event_id(self, seq: int) -> str:
+        return f"{self.epoch}-{seq}"
+
+    def parse_event_id(self, event_id: Optional[str]) -> Optional[int]:
+        """`seq` of a Last-Event-ID issued by this bus; None otherwise."""
+        if not event_id:
+            return None
+        epoch, _, seq = event_id.strip().partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
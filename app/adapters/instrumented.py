@@ -0,0 +1,88 @@
+"""
+Timing decorators around the ports, wired in app/adaptors_stub.py.
+
+They only add a perf_counter pair and a histogram update per call, so they
+are safe to keep enabled in production.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from typing import Any, Dict
+
+from app.core.models import Priority
+from app.core.ports import PriorityClassifierPort
+from app.observability.metrics import (
+    CLASSIFIER_LATENCY,
+    CLASSIFIER_OUTCOMES,
+    REPO_LATENCY,
+)
+
+
+class InstrumentedTicketRepository:
+    """
+    Transparent proxy for any TicketRepositoryPort: every coroutine method
+    is timed into `ticket_repository_call_duration_seconds{method,outcome}`.
+    New port methods are picked up automatically.
+    """
+
+    def __init__(self, inner: Any) -> None:
+        self._inner = inner
+        self._wrapped: Dict[str, Any] = {}
+
+    @property
+    def inner(self) -> Any:
+        return self._inner
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._inner, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+        wrapped = self._wrapped.get(name)
+        if wrapped is None:
+            wrapped = self._wrapped[name] = _timed(name, attr)
+        return wrapped
+
+
+def _timed(method: str, fn):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await fn(*args, **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            REPO_LATENCY.observe(
+                time.perf_counter() - start, method=method, outcome=outcome
+            )
+
+    return wrapper
+
+
+class InstrumentedPriorityClassifier(PriorityClassifierPort):
+    """Times `classify` and counts its outcomes under a layer label."""
+
+    def __init__(self, inner: PriorityClassifierPort, *, layer: str) -> None:
+        self._inner = inner
+        self._layer = layer
+
+    def __getattr__(self, name: str) -> Any:
+        # expose the wrapped classifier's extras (cache_version, stats, …)
+        return getattr(self._inner, name)
+
+    async def classify(self, title: str, description: str) -> Priority:
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            priority = await self._inner.classify(title, description)
+            outcome = priority.value
+            return priority
+        finally:
+            CLASSIFIER_LATENCY.observe(
+                time.perf_counter() - start, classifier=self._layer
+            )
+            CLASSIFIER_OUTCOMES.inc(classifier=self._layer, outcome=outcome)
@@ -0,0 +1,75 @@
+"""
+Generic micro-batcher: coalesce concurrent single-item calls into one bulk
+call, then fan the results back out to the waiting callers.
+
+A batch is flushed as soon as `max_batch_size` items are waiting or
+`max_wait_ms` has passed since the first item of the batch arrived,
+whichever comes first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Optional, Sequence
+from typing import Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    def __init__(
+        self,
+        flush: Callable[[List[T]], Awaitable[Sequence[R]]],
+        *,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 20.0,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self._flush_fn = flush
+        self._max_batch_size = max_batch_size
+        self._max_wait_s = max_wait_ms / 1000.0
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future = loop.create_future()
+        self._pending.append((item, fut))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush_now()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait_s, self._flush_now)
+        return await fut
+
+    # ───────────────────────── internals ────────────────────────
+    def _flush_now(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        # keep a strong reference until the batch is done
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        try:
+            results = await self._flush_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"batch returned {len(results)} results for "
+                    f"{len(batch)} items"
+                )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for (_, fut), result in zip(batch, results):
+            if not fut.done():  # caller may have been cancelled
+                fut.set_result(result)
@@ -0,0 +1,164 @@
+"""
+Content-addressed cache in front of any PriorityClassifierPort.
+
+The key is a SHA-256 over the classifier version (prompt + model) and the
+normalised ticket text, so "Checkout is DOWN!!" and "checkout is down" share
+one LLM call.  Identical misses that arrive concurrently are coalesced onto a
+single in-flight call, which runs as a task of its own: a caller that gives
+up does not cancel it for the others.  Priority.TBD (the failure fallback) is
+never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import time
+import unicodedata
+from typing import Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.adapters.cache import TTLLRUCache
+from app.core.models import Priority
+from app.core.ports import PriorityClassifierPort
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalise(value: str) -> str:
+    """Case-, accent-width-, punctuation- and whitespace-insensitive form."""
+    value = unicodedata.normalize("NFKC", value).casefold()
+    return _NON_WORD.sub(" ", value).strip()
+
+
+def cache_key(version: str, title: str, description: str) -> str:
+    payload = "\x1f".join((version, normalise(title), normalise(description)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SQLiteClassificationCacheStore:
+    """Persistence for the cache in the `classification_cache` side table."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+
+    async def get(self, key: str) -> Optional[Priority]:
+        q = text(
+            "SELECT priority FROM classification_cache "
+            "WHERE key = :key AND expires_at > :now"
+        )
+        async with self._engine.connect() as conn:
+            row = (
+                await conn.execute(q, {"key": key, "now": time.time()})
+            ).fetchone()
+        return Priority(row[0]) if row else None
+
+    async def put(self, key: str, priority: Priority, ttl_s: float) -> None:
+        q = text(
+            """
+            INSERT INTO classification_cache (key, priority, expires_at)
+            VALUES (:key, :priority, :expires_at)
+            ON CONFLICT(key) DO UPDATE SET
+              priority   = excluded.priority,
+              expires_at = excluded.expires_at
+            """
+        )
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                q,
+                {
+                    "key": key,
+                    "priority": priority.value,
+                    "expires_at": time.time() + ttl_s,
+                },
+            )
+
+    async def purge_expired(self) -> int:
+        q = text("DELETE FROM classification_cache WHERE expires_at <= :now")
+        async with self._engine.begin() as conn:
+            return (await conn.execute(q, {"now": time.time()})).rowcount
+
+
+class CachingPriorityClassifier(PriorityClassifierPort):
+    """Decorator: LRU+TTL in memory, optionally backed by SQLite."""
+
+    def __init__(
+        self,
+        inner: PriorityClassifierPort,
+        *,
+        max_entries: int = 10_000,
+        ttl_s: float = 3600.0,
+        version: Optional[str] = None,
+        store: Optional[SQLiteClassificationCacheStore] = None,
+    ) -> None:
+        self._inner = inner
+        self._ttl_s = ttl_s
+        self._version = version or getattr(
+            inner, "cache_version", type(inner).__qualname__
+        )
+        self._memory: TTLLRUCache[Priority] = TTLLRUCache(max_entries, ttl_s)
+        self._store = store
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._memory),
+        }
+
+    async def classify(self, title: str, description: str) -> Priority:
+        key = cache_key(self._version, title, description)
+
+        cached = self._memory.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:  # same text already being classified
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        # a task of its own: cancelling the caller that started it must not
+        # cancel the call for everyone else waiting on the same text
+        task = asyncio.ensure_future(
+            self._lookup_or_classify(key, title, description)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._settled(key, t))
+        return await asyncio.shield(task)
+
+    def _settled(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved when nobody else waits
+
+    async def _lookup_or_classify(
+        self, key: str, title: str, description: str
+    ) -> Priority:
+        if self._store is not None:
+            stored = await self._store.get(key)
+            if stored is not None:
+                self.hits += 1
+                self.persistent_hits += 1
+                self._memory.set(key, stored)
+                return stored
+
+        self.misses += 1
+        priority = await self._inner.classify(title, description)
+        if priority != Priority.TBD:
+            self._memory.set(key, priority)
+            if self._store is not None:
+                await self._store.put(key, priority, self._ttl_s)
+        return priority
@@ -0,0 +1,104 @@
+"""
+Config-driven choice of the priority classifier (CLASSIFIER env var).
+
+    auto       LangGraph when OPENAI_API_KEY is set, otherwise TBD
+    langgraph  the LLM classifier (TBD if it cannot be built)
+    fake       keyword heuristics, no network (demos, load tests)
+    tbd        every ticket stays TBD
+
+The LangGraph adapter is wrapped in LazyPriorityClassifier: nothing from
+LangChain is imported until the first classification or the warm-up.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import List, Optional
+
+from app.adapters.llm.fake_classifier import FakePriorityClassifier
+from app.adapters.llm.lazy import LazyPriorityClassifier
+from app.adapters.llm.prompts import prompt_version
+from app.adapters.llm.rules import KeywordRules, ReloadingKeywordRules
+from app.adapters.llm.tbd_classifier import TbdPriorityClassifier
+from app.config import Settings
+from app.core.ports import PriorityClassifierPort
+
+log = logging.getLogger(__name__)
+
+CLASSIFIERS = ("auto", "langgraph", "fake", "tbd")
+FALLBACKS = ("tbd", "fake")
+
+
+def build_classifier(settings: Settings) -> PriorityClassifierPort:
+    kind = settings.classifier
+    if kind not in CLASSIFIERS:
+        raise ValueError(
+            f"CLASSIFIER must be one of {CLASSIFIERS}, got {kind!r}"
+        )
+    if kind == "fake":
+        return FakePriorityClassifier(build_keyword_rules(settings))
+    if kind == "tbd":
+        return TbdPriorityClassifier()
+    if kind == "auto" and not os.getenv("OPENAI_API_KEY"):
+        log.warning(
+            "OPENAI_API_KEY is not set – defaulting all tickets to "
+            "priority=TBD."
+        )
+        return TbdPriorityClassifier()
+
+    def _langgraph() -> PriorityClassifierPort:
+        from app.adapters.llm.langgraph_classifier import (
+            LangGraphPriorityClassifier,
+        )
+
+        return LangGraphPriorityClassifier(
+            model_name=settings.llm_model,
+            batch_max_size=settings.llm_batch_max_size,
+            batch_max_wait_ms=settings.llm_batch_max_wait_ms,
+        )
+
+    return LazyPriorityClassifier(
+        _langgraph, cache_version=prompt_version(settings.llm_model)
+    )
+
+
+def is_remote(classifier: PriorityClassifierPort) -> bool:
+    """Whether build_classifier chose the (network) LLM classifier."""
+    return isinstance(classifier, LazyPriorityClassifier)
+
+
+def build_fallback(settings: Settings) -> Optional[PriorityClassifierPort]:
+    """The local classifier answering when the real one cannot (or None)."""
+    kind = settings.classify_fallback
+    if kind not in FALLBACKS:
+        raise ValueError(
+            f"CLASSIFY_FALLBACK must be one of {FALLBACKS}, got {kind!r}"
+        )
+    if kind == "fake":
+        return FakePriorityClassifier(build_keyword_rules(settings))
+    return None
+
+
+def build_keyword_rules(
+    settings: Settings,
+) -> KeywordRules | ReloadingKeywordRules:
+    """Built-in rules, or CLASSIFY_RULES_PATH kept up to date."""
+    if not settings.classify_rules_path:
+        return KeywordRules()
+    return ReloadingKeywordRules(
+        settings.classify_rules_path,
+        check_interval_s=settings.classify_rules_reload_s,
+    )
+
+
+def build_local_stages(settings: Settings) -> List:
+    """Keyword rules, then the trained model if CLASSIFY_LOCAL_MODEL is set."""
+    stages: List = [build_keyword_rules(settings)]
+    if settings.classify_local_model:
+        from app.adapters.llm.local_model import NaiveBayesPriorityModel
+
+        stages.append(
+            NaiveBayesPriorityModel.load(settings.classify_local_model)
+        )
+    return stages
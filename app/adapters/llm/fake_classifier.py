@@ -1,19 +1,23 @@
+from typing import Optional
+
+from app.adapters.llm.rules import KeywordRules, ReloadingKeywordRules
 from app.core.models import Priority
 from app.core.ports import PriorityClassifierPort
 
 
 class FakePriorityClassifier(PriorityClassifierPort):
     """
-    Fake Classifier.
+    Fake Classifier: the most severe tier with a keyword match (see
+    app/adapters/llm/rules.py), LOW when no keyword matches.
     """
 
-    KEYWORDS_HIGH = ("urgent", "asap", "immediately", "fail", "error", "crash")
-    KEYWORDS_MEDIUM = ("slow", "delay", "later", "problem")
+    def __init__(
+        self, rules: Optional[KeywordRules | ReloadingKeywordRules] = None
+    ) -> None:
+        self._rules = rules if rules is not None else KeywordRules()
 
     async def classify(self, title: str, description: str) -> Priority:
-        text = f"{title} {description}".lower()
-        if any(w in text for w in self.KEYWORDS_HIGH):
-            return Priority.HIGH
-        if any(w in text for w in self.KEYWORDS_MEDIUM):
-            return Priority.MEDIUM
-        return Priority.LOW
+        scores = self._rules.scores(title, description)
+        if not scores:
+            return Priority.LOW
+        return next(iter(scores))  # most severe first
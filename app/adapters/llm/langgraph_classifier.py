@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import operator
 from uuid import uuid4
-from typing import Annotated, Dict, List, Literal
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
@@ -11,6 +13,12 @@ from langgraph.graph import END, START, StateGraph
 from pydantic import BaseModel, Field, ValidationError
 from typing_extensions import TypedDict
 
+from app.adapters.llm.batching import MicroBatcher
+from app.adapters.llm.prompts import (
+    BATCH_INSTRUCTIONS,
+    SYSTEM_PROMPT,
+    prompt_version,
+)
 from app.core.models import Priority
 from app.core.ports import PriorityClassifierPort
 
@@ -23,6 +31,21 @@ class PrioritySchema(BaseModel):
     )
 
 
+class TicketVerdict(BaseModel):
+    id: str = Field(..., description="The ticket's id, as given")
+    priority: Literal["HIGH", "MEDIUM", "LOW"] = Field(
+        ..., description="Ticket priority"
+    )
+
+
+class PriorityBatchSchema(BaseModel):
+    """Structured-output contract for a micro-batch: one entry per ticket."""
+
+    verdicts: List[TicketVerdict] = Field(
+        ..., description="Exactly one verdict per ticket id"
+    )
+
+
 class ClassifierState(TypedDict):
     title: str
     description: str
@@ -30,32 +53,37 @@ class ClassifierState(TypedDict):
     priority: str
 
 
-SYSTEM_PROMPT = """
-You are an automated support-ticket triage assistant for our engineering team.
-
-TASK
-1. Read the ticket title and description.
-2. Decide the priority according to the POLICY below.
-3. Reply with ONE WORD ONLY—exactly HIGH, MEDIUM, or LOW—uppercase, with no
-   other text, punctuation, or line breaks.
-
-POLICY
-HIGH   - Full production outage, data loss, security breach, payment failure,
-         or any issue that blocks customers from using a core feature or urgency highlighted in the message.
-MEDIUM - Partial outage, severe performance degradation, significant bug with a
-         workaround, or time-sensitive issue that is not mission-critical.
-LOW    - Cosmetic defect, minor usability issue, documentation request, feature
-         idea, or general question that can be scheduled for later.
-""".strip()
-
-
 class LangGraphPriorityClassifier(PriorityClassifierPort):
     """Concrete adapter with a ONE-node LangGraph."""
 
-    def __init__(self, *, model_name: str = "gpt-4.1") -> None:
-        self._llm = ChatOpenAI(
+    def __init__(
+        self,
+        *,
+        model_name: str = "gpt-4.1",
+        llm: Optional[Any] = None,
+        batch_max_size: int = 1,
+        batch_max_wait_ms: float = 20.0,
+    ) -> None:
+        """
+        `llm` lets tests inject any LangChain-style chat model.
+        `batch_max_size > 1` enables micro-batching: concurrent `classify`
+        calls are coalesced (up to `batch_max_size` tickets or
+        `batch_max_wait_ms`) into ONE structured-output request.
+        """
+        # changes whenever the prompt or the model does → cache keys rotate
+        self.cache_version = prompt_version(model_name)
+        self._llm = llm or ChatOpenAI(
             model=model_name, temperature=0.0, streaming=False
         )
+        self._single_llm = self._llm.with_structured_output(PrioritySchema)
+        self._batch_llm = self._llm.with_structured_output(PriorityBatchSchema)
+        self._batcher: Optional[MicroBatcher[Tuple[str, str], Priority]] = None
+        if batch_max_size > 1:
+            self._batcher = MicroBatcher(
+                self._classify_batch,
+                max_batch_size=batch_max_size,
+                max_wait_ms=batch_max_wait_ms,
+            )
 
         # build once, reuse forever
         graph = StateGraph(ClassifierState)
@@ -66,19 +94,60 @@ class LangGraphPriorityClassifier(PriorityClassifierPort):
 
     async def classify(self, title: str, description: str) -> Priority:
         """
-        Called by the Service Layer.  Runs the graph and converts the string
-        returned by the LLM into the domain Priority enum, falling back to
-        Priority.TBD on any problem.
+        Called by the Service Layer.  Runs the graph (or joins the current
+        micro-batch) and converts the string returned by the LLM into the
+        domain Priority enum, falling back to Priority.TBD on any problem.
         """
         try:
-            result = await self._graph.ainvoke(
-                {"title": title, "description": description, "messages": []}  # type: ignore
-            )
-            raw = result["priority"]  # HIGH | MEDIUM | LOW
-            return Priority(raw)
+            if self._batcher is not None:
+                return await self._batcher.submit((title, description))
+            return await self._classify_one(title, description)
         except Exception:  # pylint: disable=broad-exception-caught
             return Priority.TBD
 
+    async def _classify_one(self, title: str, description: str) -> Priority:
+        result = await self._graph.ainvoke(
+            {"title": title, "description": description, "messages": []}  # type: ignore
+        )
+        raw = result["priority"]  # HIGH | MEDIUM | LOW
+        return Priority(raw)
+
+    async def _classify_batch(
+        self, tickets: List[Tuple[str, str]]
+    ) -> List[Priority]:
+        """
+        Flush callback of the micro-batcher: ONE request for the whole batch.
+        A single ticket goes through the regular graph.  Tickets are sent as
+        a JSON array, so no ticket text can pose as the start of another
+        ticket; unless the model answers every id exactly once we fall back
+        to one call per ticket.
+        """
+        if len(tickets) == 1:
+            return [await self._classify_one(*tickets[0])]
+
+        ids = [str(i) for i in range(1, len(tickets) + 1)]
+        body = json.dumps(
+            [
+                {"id": i, "title": title, "description": description}
+                for i, (title, description) in zip(ids, tickets)
+            ],
+            ensure_ascii=False,
+            indent=1,
+        )
+        messages = [
+            SystemMessage(content=f"{SYSTEM_PROMPT}\n\n{BATCH_INSTRUCTIONS}"),
+            HumanMessage(content=body),
+        ]
+        response: PriorityBatchSchema = await self._batch_llm.ainvoke(
+            messages
+        )  # type: ignore
+        answers = {v.id: v.priority for v in response.verdicts}
+        if len(response.verdicts) == len(ids) and answers.keys() == set(ids):
+            return [Priority(answers[i]) for i in ids]
+        return list(
+            await asyncio.gather(*(self._classify_one(*t) for t in tickets))
+        )
+
     async def _priority_agent(self, state: ClassifierState):
         """
         Single node that asks the LLM for a structured answer and pushes it
@@ -90,9 +159,7 @@ class LangGraphPriorityClassifier(PriorityClassifierPort):
                 content=f"TITLE: {state['title']}\n\nDESCRIPTION:\n{state['description']}"
             ),
         ]
-        response: PrioritySchema = await self._llm.with_structured_output(
-            PrioritySchema
-        ).ainvoke(
+        response: PrioritySchema = await self._single_llm.ainvoke(
             messages
         )  # type: ignore
         print(f"LLM response was: {response}")
@@ -0,0 +1,81 @@
+"""
+Deferred construction of an expensive classifier.
+
+Importing LangChain/LangGraph and building the chat model plus the
+compiled graph takes seconds.  LazyPriorityClassifier postpones all of it
+until the first `classify` call, or until `warm_up()`, which the lifespan
+can start in the background.  The build runs in a worker thread, so the
+event loop keeps serving requests meanwhile.  Concurrent first calls share
+one build.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Optional
+
+from app.adapters.llm.tbd_classifier import TbdPriorityClassifier
+from app.core.models import Priority
+from app.core.ports import PriorityClassifierPort
+
+log = logging.getLogger(__name__)
+
+Factory = Callable[[], PriorityClassifierPort]
+
+
+class LazyPriorityClassifier(PriorityClassifierPort):
+    def __init__(
+        self,
+        factory: Factory,
+        *,
+        cache_version: Optional[str] = None,
+        fallback: Factory = TbdPriorityClassifier,
+    ) -> None:
+        """
+        `cache_version` stands in for the real classifier's until it
+        exists, so the classification cache can key entries without
+        forcing the build.  If `factory` raises, `fallback` is used.
+        """
+        self._factory = factory
+        self._fallback = fallback
+        self._inner: Optional[PriorityClassifierPort] = None
+        self._building: Optional[asyncio.Future] = None
+        if cache_version is not None:
+            self.cache_version = cache_version
+
+    @property
+    def loaded(self) -> bool:
+        return self._inner is not None
+
+    def __getattr__(self, name: str) -> Any:
+        # extras of the real classifier, once it exists
+        inner = self.__dict__.get("_inner")
+        if inner is None:
+            raise AttributeError(name)
+        return getattr(inner, name)
+
+    async def warm_up(self) -> PriorityClassifierPort:
+        if self._inner is not None:
+            return self._inner
+        if self._building is None or self._building.cancelled():
+            self._building = asyncio.ensure_future(self._build())
+        # a caller giving up must not abort the build for everyone else
+        return await asyncio.shield(self._building)
+
+    async def classify(self, title: str, description: str) -> Priority:
+        inner = self._inner or await self.warm_up()
+        return await inner.classify(title, description)
+
+    async def _build(self) -> PriorityClassifierPort:
+        try:
+            inner = await asyncio.to_thread(self._factory)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log.warning(
+                "Classifier unavailable (%s) – defaulting all tickets to "
+                "priority=TBD.",
+                exc,
+            )
+            inner = self._fallback()
+        self._inner = inner
+        return inner
@@ -0,0 +1,214 @@
+"""
+Offline-trained naive Bayes priority model: the optional second local
+stage of the tiered classifier (app/adapters/llm/tiered.py).
+
+It is trained from tickets that already carry a priority, so it learns
+whatever the LLM (or a human) decided before.  It is stored as a small
+JSON file, and prediction is one NumPy gather-and-sum, with no network
+and no GPU:
+
+    python -m app.adapters.llm.local_model --out data/priority_model.json
+
+The command reads the tickets from DATABASE_URL.  It holds back a share of
+them to print the accuracy and the coverage (the share of tickets that
+would be settled locally) at the chosen confidence, which is what
+CLASSIFY_LOCAL_MIN_CONFIDENCE should be tuned against.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.adapters.repos.text_index import tokenize
+from app.core.models import Priority
+
+Sample = Tuple[str, str, Priority]
+
+FORMAT_VERSION = 1
+
+
+def _tokens(title: str, description: str) -> List[str]:
+    # title words count twice, as in the other text features here
+    title_tokens = tokenize(title)
+    return title_tokens + title_tokens + tokenize(description)
+
+
+class NaiveBayesPriorityModel:
+    def __init__(
+        self,
+        priorities: Sequence[Priority],
+        vocabulary: Sequence[str],
+        log_prior: np.ndarray,
+        log_likelihood: np.ndarray,
+    ) -> None:
+        """log_likelihood has one row per vocabulary word."""
+        self._priorities = tuple(priorities)
+        self._vocabulary = list(vocabulary)
+        self._index = {w: i for i, w in enumerate(self._vocabulary)}
+        self._log_prior = log_prior
+        self._log_likelihood = log_likelihood
+
+    def __len__(self) -> int:
+        return len(self._vocabulary)
+
+    @classmethod
+    def fit(
+        cls,
+        samples: Iterable[Sample],
+        *,
+        min_count: int = 2,
+        alpha: float = 1.0,
+    ) -> "NaiveBayesPriorityModel":
+        """Multinomial NB with Laplace smoothing; TBD samples are ignored."""
+        docs = [(_tokens(t, d), p) for t, d, p in samples if p != Priority.TBD]
+        if not docs:
+            raise ValueError("no labelled tickets to train on")
+        priorities = sorted({p for _, p in docs}, key=list(Priority).index)
+        totals = Counter(w for tokens, _ in docs for w in tokens)
+        vocabulary = sorted(w for w, n in totals.items() if n >= min_count)
+        index = {w: i for i, w in enumerate(vocabulary)}
+        column = {p: j for j, p in enumerate(priorities)}
+
+        counts = np.zeros((len(vocabulary), len(priorities)))
+        class_docs = np.zeros(len(priorities))
+        for tokens, priority in docs:
+            j = column[priority]
+            class_docs[j] += 1
+            for w in tokens:
+                i = index.get(w)
+                if i is not None:
+                    counts[i, j] += 1
+        smoothed = counts + alpha
+        log_likelihood = np.log(smoothed / smoothed.sum(axis=0))
+        log_prior = np.log(class_docs / class_docs.sum())
+        return cls(priorities, vocabulary, log_prior, log_likelihood)
+
+    def predict(
+        self, title: str, description: str
+    ) -> Optional[Tuple[Priority, float]]:
+        """(priority, tempered posterior); None without a known word."""
+        rows = [
+            i
+            for i in map(self._index.get, _tokens(title, description))
+            if i is not None
+        ]
+        if not rows:
+            return None
+        # words in a ticket are far from independent; dividing the evidence
+        # by sqrt(n) tempers NB's notorious overconfidence on long texts
+        evidence = self._log_likelihood[rows].sum(axis=0)
+        scores = self._log_prior + evidence / math.sqrt(len(rows))
+        scores = np.exp(scores - scores.max())
+        best = int(scores.argmax())
+        return self._priorities[best], float(scores[best] / scores.sum())
+
+    # ------------------------------------------------------------ storage --
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(
+            json.dumps(
+                {
+                    "format": FORMAT_VERSION,
+                    "priorities": [p.value for p in self._priorities],
+                    "vocabulary": self._vocabulary,
+                    "log_prior": self._log_prior.tolist(),
+                    "log_likelihood": self._log_likelihood.tolist(),
+                }
+            )
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "NaiveBayesPriorityModel":
+        data = json.loads(Path(path).read_text())
+        if data.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported model format")
+        return cls(
+            [Priority(p) for p in data["priorities"]],
+            data["vocabulary"],
+            np.asarray(data["log_prior"]),
+            np.asarray(data["log_likelihood"]).reshape(
+                len(data["vocabulary"]), len(data["priorities"])
+            ),
+        )
+
+
+def evaluate(
+    model: NaiveBayesPriorityModel,
+    samples: Sequence[Sample],
+    min_confidence: float,
+) -> dict:
+    """Accuracy overall, and coverage/accuracy above `min_confidence`."""
+    correct = covered = covered_correct = 0
+    for title, description, priority in samples:
+        verdict = model.predict(title, description)
+        if verdict is None:
+            continue
+        hit = verdict[0] == priority
+        correct += hit
+        if verdict[1] >= min_confidence:
+            covered += 1
+            covered_correct += hit
+    n = len(samples) or 1
+    return {
+        "samples": len(samples),
+        "accuracy": round(correct / n, 4),
+        "coverage": round(covered / n, 4),
+        "accuracy_when_confident": round(covered_correct / (covered or 1), 4),
+    }
+
+
+async def _labelled_tickets() -> List[Sample]:
+    from app.adapters.repos.sqlite_repo import SQLiteTicketRepository
+    from app.config import get_settings
+    from app.db.engine import build_engine
+
+    settings = get_settings()
+    engine = build_engine(settings.database_url, settings)
+    try:
+        repo = SQLiteTicketRepository(engine)
+        return [
+            (t.title, t.description, t.priority)
+            async for batch in repo.iter_batches()
+            for t in batch
+            if t.priority != Priority.TBD
+        ]
+    finally:
+        await engine.dispose()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--out", default="data/priority_model.json")
+    p.add_argument("--holdout", type=float, default=0.2)
+    p.add_argument("--min-confidence", type=float, default=0.9)
+    p.add_argument("--min-count", type=int, default=2)
+    p.add_argument("--seed", type=int, default=42)
+    opts = p.parse_args(argv)
+
+    samples = asyncio.run(_labelled_tickets())
+    random.Random(opts.seed).shuffle(samples)
+    cut = int(len(samples) * (1 - opts.holdout))
+    report = {"labelled_tickets": len(samples)}
+    if opts.holdout > 0 and cut < len(samples):
+        model = NaiveBayesPriorityModel.fit(
+            samples[:cut], min_count=opts.min_count
+        )
+        report["holdout"] = evaluate(model, samples[cut:], opts.min_confidence)
+    # the shipped model learns from everything
+    model = NaiveBayesPriorityModel.fit(samples, min_count=opts.min_count)
+    model.save(opts.out)
+    report["vocabulary"] = len(model)
+    report["out"] = opts.out
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Keeping a slow or failing LLM provider from taking the API down with it.
+
+ResilientPriorityClassifier wraps the real classifier:
+
+  * every call has a deadline (`timeout_s`), which includes waiting for a
+    slot, so a slow provider costs a request at most that long;
+  * at most `max_concurrency` provider calls are in flight; the rest queue
+    on a semaphore instead of piling onto the provider;
+  * a CircuitBreaker counts failures (exceptions, timeouts and TBD, which
+    is how the LangGraph adapter reports its own errors).  While it is open
+    calls return TBD at once, without touching the provider;
+  * optionally, an attempt still running after `hedge_after_s` gets a
+    second one alongside (if a slot is free), and a failed attempt is
+    retried.  The first real answer wins and the others are cancelled.
+
+Its "no answer" is TBD, which the classification cache never stores.
+FallbackPriorityClassifier, outside the cache, then turns TBD into the
+answer of a fast local classifier (e.g. FakePriorityClassifier).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import Any, Optional, Set
+
+from app.adapters.breaker import OPEN, CircuitBreaker
+from app.core.models import Priority
+from app.core.ports import PriorityClassifierPort
+
+log = logging.getLogger(__name__)
+
+
+class ResilientPriorityClassifier(PriorityClassifierPort):
+    def __init__(
+        self,
+        inner: PriorityClassifierPort,
+        *,
+        timeout_s: Optional[float] = 10.0,
+        max_concurrency: Optional[int] = 16,
+        breaker: Optional[CircuitBreaker] = None,
+        hedge_after_s: Optional[float] = None,
+        max_hedges: int = 1,
+    ) -> None:
+        """`None` (or 0) disables the deadline, the cap or hedging."""
+        self._inner = inner
+        self._timeout_s = timeout_s or None
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+        self._breaker = breaker
+        self._hedge_after_s = hedge_after_s or None
+        self._max_hedges = max_hedges if self._hedge_after_s else 0
+        self.in_flight = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.short_circuits = 0
+        self.hedges = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # expose the wrapped classifier's extras (cache_version, …)
+        return getattr(self._inner, name)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "short_circuits": self.short_circuits,
+            "hedges": self.hedges,
+            "breaker_open": float(
+                self._breaker is not None and self._breaker.state == OPEN
+            ),
+            "breaker_trips": self._breaker.opened if self._breaker else 0,
+        }
+
+    async def classify(self, title: str, description: str) -> Priority:
+        if self._breaker is not None and not self._breaker.allow():
+            self.short_circuits += 1
+            return Priority.TBD
+        generation = self._breaker.generation if self._breaker else 0
+        try:
+            async with asyncio.timeout(self._timeout_s):
+                priority = await self._race(title, description)
+        except TimeoutError:
+            self.timeouts += 1
+            priority = Priority.TBD
+        if self._breaker is not None:
+            if priority == Priority.TBD:
+                self._breaker.record_failure(generation)
+            else:
+                self._breaker.record_success(generation)
+        if priority == Priority.TBD:
+            self.failures += 1
+        return priority
+
+    async def _race(self, title: str, description: str) -> Priority:
+        pending: Set[asyncio.Task] = {self._launch(title, description)}
+        hedges = 0
+        try:
+            while pending:
+                can_hedge = hedges < self._max_hedges
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self._hedge_after_s if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                failed = False
+                for task in done:
+                    priority = _outcome(task)
+                    if priority != Priority.TBD:
+                        return priority
+                    failed = True
+                if not can_hedge:
+                    continue
+                if failed:  # retry right away
+                    hedges += 1
+                    self.hedges += 1
+                    pending.add(self._launch(title, description))
+                elif not done:  # slow: hedge only with spare capacity
+                    hedges += 1
+                    if self._semaphore is None or not self._semaphore.locked():
+                        self.hedges += 1
+                        pending.add(self._launch(title, description))
+            return Priority.TBD
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _launch(self, title: str, description: str) -> asyncio.Task:
+        return asyncio.create_task(self._attempt(title, description))
+
+    async def _attempt(self, title: str, description: str) -> Priority:
+        slot = self._semaphore or contextlib.nullcontext()
+        async with slot:
+            self.in_flight += 1
+            try:
+                return await self._inner.classify(title, description)
+            finally:
+                self.in_flight -= 1
+
+
+def _outcome(task: asyncio.Task) -> Priority:
+    if task.cancelled():
+        return Priority.TBD
+    exc = task.exception()
+    if exc is not None:
+        log.warning("Classifier call failed: %r", exc)
+        return Priority.TBD
+    return task.result()
+
+
+class FallbackPriorityClassifier(PriorityClassifierPort):
+    """Answers with `fallback` whenever `primary` has none (TBD)."""
+
+    def __init__(
+        self, primary: PriorityClassifierPort, fallback: PriorityClassifierPort
+    ) -> None:
+        self._primary = primary
+        self._fallback = fallback
+        self.fallbacks = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._primary, name)
+
+    async def classify(self, title: str, description: str) -> Priority:
+        priority = await self._primary.classify(title, description)
+        if priority != Priority.TBD:
+            return priority
+        self.fallbacks += 1
+        return await self._fallback.classify(title, description)
@@ -0,0 +1,283 @@
+"""
+Weighted keyword rules: FakePriorityClassifier's heuristics and the first,
+microsecond stage of the tiered classifier (app/adapters/llm/tiered.py).
+
+Every priority tier has a list of (keyword, weight) pairs.  A keyword
+matches at the start of a word and as a prefix, so "fail" also matches
+"failed" and "failure" but not "nofail".  A trailing "$" makes it match a
+whole word only: "down$" matches "down" but not "download".  Spaces in a
+keyword match any whitespace.  A tier's score is the weight of its
+distinct keywords found in the ticket.  The verdict is the most severe
+tier with a match, whatever the scores (so "error, then slow" is HIGH),
+and its confidence is
+
+    share of the total score  ×  min(1, score / SATURATION)
+
+So a single unopposed weight-2 keyword is certain, a lone weight-1 keyword
+is a coin flip, and mixed signals ("urgent typo") are never confident.
+
+All keywords of all tiers are compiled into ONE regex shaped like a trie
+("fail(?:ure)?|crash"), so a ticket is scanned once whatever the number
+of rules, and each position costs at most one keyword's length.  Where
+keywords overlap, the longest wins.
+
+Rules can come from a JSON file (CLASSIFY_RULES_PATH):
+
+    {"HIGH": {"outage": 2, "crash": 2}, "MEDIUM": ["slow", "delay"]}
+
+A list gives every keyword weight 1.  ReloadingKeywordRules picks up
+edits to the file without a restart.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.core.models import Priority
+
+log = logging.getLogger(__name__)
+
+# unopposed keyword weight at which a verdict is fully confident
+SATURATION = 2.0
+
+Rules = Mapping[Priority, Sequence[Tuple[str, float]]]
+
+_SEVERITY = (Priority.HIGH, Priority.MEDIUM, Priority.LOW)
+
+DEFAULT_RULES: Rules = {
+    Priority.HIGH: (
+        ("urgent", 2.0),
+        ("asap", 2.0),
+        ("immediately", 1.0),
+        ("crash", 2.0),
+        ("outage", 2.0),
+        ("data loss", 2.0),
+        ("security", 1.0),
+        ("fail", 1.0),
+        ("error", 1.0),
+        ("down$", 1.0),
+    ),
+    Priority.MEDIUM: (
+        ("slow", 1.5),
+        ("delay", 1.0),
+        ("later", 0.5),
+        ("problem", 1.0),
+        ("intermittent", 1.5),
+        ("timeout", 1.0),
+    ),
+    Priority.LOW: (
+        ("typo", 2.0),
+        ("cosmetic", 2.0),
+        ("glitch", 1.0),
+        ("misaligned", 1.5),
+        ("feature request", 2.0),
+        ("nice to have", 2.0),
+        ("wording", 1.5),
+    ),
+}
+
+
+class KeywordRules:
+    def __init__(self, rules: Rules = DEFAULT_RULES) -> None:
+        self._tiers = tuple(p for p in _SEVERITY if rules.get(p))
+        # normalised keyword → [(tier, weight)]; a keyword may sit in several
+        self._keywords: Dict[str, List[Tuple[Priority, float]]] = {}
+        # normalised keyword → whole word only (every spelling ends in "$")
+        whole: Dict[str, bool] = {}
+        for priority in self._tiers:
+            for keyword, weight in rules[priority]:
+                ends_word = keyword.rstrip().endswith("$")
+                key = _normalise(keyword.rstrip().removesuffix("$"))
+                if key:
+                    self._keywords.setdefault(key, []).append(
+                        (priority, float(weight))
+                    )
+                    whole[key] = whole.get(key, True) and ends_word
+        self._pattern = (
+            re.compile(r"\b" + _trie_pattern(whole))
+            if self._keywords
+            else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "KeywordRules":
+        return cls(parse_rules(json.loads(Path(path).read_text())))
+
+    def scores(self, title: str, description: str) -> Dict[Priority, float]:
+        """Score per matched tier, most severe first."""
+        if self._pattern is None:
+            return {}
+        text = f"{title}\n{description}".lower()
+        found = set(self._pattern.findall(text))
+        totals: Dict[Priority, float] = {}
+        for match in found:
+            hits = self._keywords.get(match)
+            if hits is None:  # a multi-word match with unusual whitespace
+                hits = self._keywords[_normalise(match)]
+            for priority, weight in hits:
+                totals[priority] = totals.get(priority, 0.0) + weight
+        return {p: totals[p] for p in self._tiers if p in totals}
+
+    def predict(
+        self, title: str, description: str
+    ) -> Optional[Tuple[Priority, float]]:
+        """(priority, confidence in [0, 1]); None when no keyword matches."""
+        return _verdict(self.scores(title, description))
+
+
+class ReloadingKeywordRules:
+    """
+    KeywordRules kept in sync with a rules file.  The file's mtime and size
+    are checked at most every `check_interval_s`, on use.  An edit that
+    does not parse is logged, and the previous rules stay in force.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        check_interval_s: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._path = Path(path)
+        self._interval = check_interval_s
+        self._clock = clock
+        self._signature = _signature(self._path)
+        self._rules = KeywordRules.from_file(self._path)  # fail fast
+        self._checked_at = clock()
+        self.reloads = 0
+
+    def __len__(self) -> int:
+        return len(self.current())
+
+    def current(self) -> KeywordRules:
+        now = self._clock()
+        if now - self._checked_at >= self._interval:
+            self._checked_at = now
+            self._maybe_reload()
+        return self._rules
+
+    def scores(self, title: str, description: str) -> Dict[Priority, float]:
+        return self.current().scores(title, description)
+
+    def predict(
+        self, title: str, description: str
+    ) -> Optional[Tuple[Priority, float]]:
+        return self.current().predict(title, description)
+
+    def _maybe_reload(self) -> None:
+        try:
+            signature = _signature(self._path)
+        except OSError:
+            log.warning(
+                "Rules file %s is gone; keeping the old rules", self._path
+            )
+            return
+        if signature == self._signature:
+            return
+        self._signature = signature
+        try:
+            rules = KeywordRules.from_file(self._path)
+        except (OSError, ValueError):
+            log.exception(
+                "Cannot reload %s; keeping the old rules", self._path
+            )
+            return
+        self._rules = rules
+        self.reloads += 1
+        log.info("Reloaded %d keyword rule(s) from %s", len(rules), self._path)
+
+
+def parse_rules(data: Mapping) -> Rules:
+    """The JSON rules format (see the module docstring) → Rules."""
+    if not isinstance(data, Mapping):
+        raise ValueError("rules must be an object keyed by priority")
+    rules: Dict[Priority, Sequence[Tuple[str, float]]] = {}
+    for name, keywords in data.items():
+        try:
+            priority = Priority(str(name).upper())
+        except ValueError:
+            priority = Priority.TBD
+        if priority == Priority.TBD:
+            raise ValueError(f"unknown priority {name!r} in rules")
+        if isinstance(keywords, Mapping):
+            pairs = [
+                (str(k), _weight(name, k, w)) for k, w in keywords.items()
+            ]
+        elif isinstance(keywords, list):
+            pairs = [(str(k), 1.0) for k in keywords]
+        else:
+            raise ValueError(f"keywords for {name} must be a list or object")
+        rules[priority] = pairs
+    return rules
+
+
+def _weight(name, keyword, weight) -> float:
+    # bool is an int subclass, but `true` is not a weight
+    if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+        raise ValueError(
+            f"weight of {keyword!r} in {name} must be a number, "
+            f"not {weight!r}"
+        )
+    return float(weight)
+
+
+def _verdict(
+    scores: Dict[Priority, float]
+) -> Optional[Tuple[Priority, float]]:
+    if not scores:
+        return None
+    priority = next(iter(scores))  # the most severe tier matched
+    top = scores[priority]
+    confidence = top / sum(scores.values()) * min(1.0, top / SATURATION)
+    return priority, confidence
+
+
+def _normalise(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+# trie keys marking where a keyword ends: as a prefix, or as a whole word
+_PREFIX_END = ""
+_WORD_END = "\0"
+
+
+def _trie_pattern(words: Mapping[str, bool]) -> str:
+    trie: dict = {}
+    for word, whole in words.items():
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[_WORD_END if whole else _PREFIX_END] = {}
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: dict) -> str:
+    branches = [
+        (r"\s+" if ch == " " else re.escape(ch)) + _node_pattern(child)
+        for ch, child in sorted(node.items())
+        if ch not in (_PREFIX_END, _WORD_END)
+    ]
+    ends_here = _PREFIX_END in node
+    if _WORD_END in node and not ends_here:
+        # last, so that longer keywords are tried first
+        branches.append(r"(?!\w)")
+    if not branches:
+        return ""
+    if len(branches) == 1 and not ends_here:
+        return branches[0]
+    # greedy "?": a longer keyword wins over its own prefix
+    return "(?:" + "|".join(branches) + ")" + ("?" if ends_here else "")
+
+
+def _signature(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,128 @@
+"""
+Cascading classifier: cheap local stages first, the LLM only when unsure.
+
+    KeywordRules             weighted keyword rules, microseconds
+    NaiveBayesPriorityModel  optional, trained offline from labelled tickets
+    the LLM chain            cache, guards, fallback (see adaptors_stub.py)
+
+Each local stage returns (priority, confidence) or None.  The first stage
+at or above `min_confidence` settles the ticket.  Anything else is
+escalated, and the most confident local guess is compared with the LLM's
+answer.
+
+Escalated tickets are the hard ones, so an `audit_rate` share of the
+tickets settled locally is also sent to the LLM in the background.  This
+measures the agreement where the cascade is actually used, without making
+the caller wait; `aclose()` cancels the audits still running at shutdown.
+`stats()` reports the escalation rate and both agreement rates.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from typing import Any, Callable, Optional, Protocol, Sequence, Set, Tuple
+
+from app.core.models import Priority
+from app.core.ports import PriorityClassifierPort
+
+log = logging.getLogger(__name__)
+
+Verdict = Tuple[Priority, float]
+
+
+class LocalStage(Protocol):
+    def predict(self, title: str, description: str) -> Optional[Verdict]: ...
+
+
+class TieredPriorityClassifier(PriorityClassifierPort):
+    def __init__(
+        self,
+        stages: Sequence[LocalStage],
+        escalate_to: PriorityClassifierPort,
+        *,
+        min_confidence: float = 0.9,
+        audit_rate: float = 0.0,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        self._stages = tuple(stages)
+        self._llm = escalate_to
+        self._min_confidence = min_confidence
+        self._audit_rate = audit_rate
+        self._rand = rand
+        self._audits: Set[asyncio.Task] = set()
+        self.local = 0
+        self.escalated = 0
+        # escalated tickets that had a local guess
+        self.compared = self.agreed = 0
+        # locally settled tickets double-checked by the LLM
+        self.audited = self.audit_agreed = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # the LLM chain's extras (cache_version, …)
+        return getattr(self._llm, name)
+
+    def stats(self) -> dict:
+        total = self.local + self.escalated
+        return {
+            "local": self.local,
+            "escalated": self.escalated,
+            "escalation_rate": self.escalated / total if total else 0.0,
+            "agreement_escalated": _ratio(self.agreed, self.compared),
+            "agreement_local": _ratio(self.audit_agreed, self.audited),
+            "audited": self.audited,
+        }
+
+    def predict(self, title: str, description: str) -> Optional[Verdict]:
+        """The most confident local verdict (None if no stage has one)."""
+        best: Optional[Verdict] = None
+        for stage in self._stages:
+            verdict = stage.predict(title, description)
+            if verdict is None:
+                continue
+            if verdict[1] >= self._min_confidence:
+                return verdict
+            if best is None or verdict[1] > best[1]:
+                best = verdict
+        return best
+
+    async def classify(self, title: str, description: str) -> Priority:
+        verdict = self.predict(title, description)
+        if verdict is not None and verdict[1] >= self._min_confidence:
+            self.local += 1
+            if self._audit_rate and self._rand() < self._audit_rate:
+                self._audit(title, description, verdict[0])
+            return verdict[0]
+
+        self.escalated += 1
+        priority = await self._llm.classify(title, description)
+        if verdict is not None and priority != Priority.TBD:
+            self.compared += 1
+            self.agreed += priority == verdict[0]
+        return priority
+
+    def _audit(self, title: str, description: str, local: Priority) -> None:
+        async def _check() -> None:
+            try:
+                priority = await self._llm.classify(title, description)
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.warning("Audit classification failed", exc_info=True)
+                return
+            if priority != Priority.TBD:
+                self.audited += 1
+                self.audit_agreed += priority == local
+
+        task = asyncio.create_task(_check())
+        self._audits.add(task)
+        task.add_done_callback(self._audits.discard)
+
+    async def aclose(self) -> None:
+        """Cancel the audits still waiting on the LLM."""
+        for task in self._audits:
+            task.cancel()
+        await asyncio.gather(*self._audits, return_exceptions=True)
+
+
+def _ratio(part: int, whole: int) -> float:
+    return part / whole if whole else 0.0
@@ -0,0 +1,166 @@
+"""
+Read-through cache for single-ticket lookups, around any repository.
+
+`get` is served from a bounded LRU with TTL; misses (unknown ids) are cached
+too, for a much shorter time.  Every write through this decorator
+invalidates the affected id.  Callers get their own copy of the cached
+Ticket, so mutating a returned object never corrupts the cache.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, AsyncIterator, List, Mapping, Optional, Sequence
+from uuid import UUID
+
+from app.adapters.cache import TTLLRUCache
+from app.core.models import (
+    PageCursor,
+    Priority,
+    Status,
+    Ticket,
+    TicketStats,
+)
+from app.core.ports import TicketRepositoryPort
+
+_NOT_FOUND = object()  # negative-cache marker
+
+
+class CachingTicketRepository(TicketRepositoryPort):
+    def __init__(
+        self,
+        inner: TicketRepositoryPort,
+        *,
+        max_entries: int = 10_000,
+        ttl_s: float = 30.0,
+        negative_ttl_s: float = 2.0,
+    ) -> None:
+        self._inner = inner
+        self._cache: TTLLRUCache[object] = TTLLRUCache(max_entries, ttl_s)
+        self._negative_ttl_s = negative_ttl_s
+        # bumped by every write: a read that raced with a write is not cached
+        self._write_epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._cache),
+        }
+
+    def invalidate(self, ticket_id: Optional[UUID] = None) -> None:
+        """Drop one id, or everything when called without an id."""
+        self._write_epoch += 1
+        if ticket_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(ticket_id)
+
+    # ───────────────────────── reads ────────────────────────────
+    async def get(self, ticket_id: UUID) -> Optional[Ticket]:
+        cached = self._cache.get(ticket_id)
+        if cached is not None:
+            self.hits += 1
+            return None if cached is _NOT_FOUND else _copy(cached)
+
+        self.misses += 1
+        epoch = self._write_epoch
+        ticket = await self._inner.get(ticket_id)
+        if epoch == self._write_epoch:
+            if ticket is None:
+                self._cache.set(ticket_id, _NOT_FOUND, self._negative_ttl_s)
+            else:
+                self._cache.set(ticket_id, _copy(ticket))
+        return ticket
+
+    async def list(
+        self,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Ticket]:
+        return await self._inner.list(
+            status=status, priority=priority, limit=limit, after=after
+        )
+
+    def iter_batches(
+        self,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[Ticket]]:
+        return self._inner.iter_batches(
+            status=status, priority=priority, batch_size=batch_size
+        )
+
+    async def search(
+        self,
+        query: str,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Ticket]:
+        return await self._inner.search(
+            query, status, priority, limit=limit, offset=offset
+        )
+
+    async def aggregate(self) -> TicketStats:
+        return await self._inner.aggregate()
+
+    # ───────────────────────── writes ───────────────────────────
+    async def add(self, ticket: Ticket) -> None:
+        try:
+            await self._inner.add(ticket)
+        finally:
+            self.invalidate(ticket.id)  # clears a cached "not found"
+
+    async def add_many(self, tickets: Sequence[Ticket]) -> None:
+        try:
+            await self._inner.add_many(tickets)
+        finally:
+            self._write_epoch += 1
+            for ticket in tickets:
+                self._cache.pop(ticket.id)
+
+    async def update(self, ticket: Ticket) -> None:
+        try:
+            await self._inner.update(ticket)
+        finally:
+            self.invalidate(ticket.id)
+
+    async def update_fields(
+        self,
+        ticket_id: UUID,
+        changes: Mapping[str, Any],
+        *,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Ticket]:
+        try:
+            return await self._inner.update_fields(
+                ticket_id, changes, expected_version=expected_version
+            )
+        finally:
+            self.invalidate(ticket_id)
+
+    async def delete(
+        self, ticket_id: UUID, *, expected_version: Optional[int] = None
+    ) -> Optional[Ticket]:
+        try:
+            return await self._inner.delete(
+                ticket_id, expected_version=expected_version
+            )
+        finally:
+            self.invalidate(ticket_id)
+
+
+def _copy(ticket: Ticket) -> Ticket:
+    return dataclasses.replace(ticket)
@@ -0,0 +1,205 @@
+"""
+Ticket writes made by the worker processes sharing the SQLite file.
+
+With several uvicorn workers, each process has its own ticket cache, stats
+counters, near-duplicate index and SSE change bus.  SQLiteTicketRepository
+(with a `change_origin`) appends every write to the `ticket_changes` table
+in the write's own transaction.  Each process follows that log here and
+replays the other processes' entries into its in-memory state (see
+Container.apply_remote_changes).  Its own entries come back too: they feed
+its SSE change bus, whose event ids are the log's seqs under the log's
+`epoch` (a random name stored with the log), valid on every process.
+
+Polling is cheap when nothing happened: `PRAGMA data_version` on a
+dedicated connection changes only when another connection has committed,
+so an idle poll is one pragma and no table read.  Entries older than
+`retention_s` are pruned by whichever process gets there first (the job
+worker, which only writes, calls prune() itself).  A process
+that fell further behind than that has missed writes it can't replay:
+poll() then says so, and the caller drops everything it derived from the
+log (see Container.apply_remote_changes).
+
+Single event-loop use only, like app.adapters.events.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import time
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.adapters.repos.sqlite_repo import ticket_from_payload
+from app.core.models import ChangeEvent
+
+log = logging.getLogger(__name__)
+
+# log entries read per query; a burst is drained over several polls
+BATCH_SIZE = 500
+# how often (at most) this process prunes expired entries
+PRUNE_INTERVAL_S = 60.0
+
+_SINCE = text(
+    """
+    SELECT seq, kind, origin, payload
+    FROM ticket_changes
+    WHERE seq > :after
+    ORDER BY seq
+    LIMIT :limit
+    """
+)
+
+# the first process to start names the log; later ones read that name
+_CLAIM_EPOCH = text(
+    "INSERT OR IGNORE INTO ticket_changes_epoch (id, epoch) "
+    "VALUES (1, :epoch)"
+)
+_EPOCH = text("SELECT epoch FROM ticket_changes_epoch WHERE id = 1")
+
+_PRUNE = text("DELETE FROM ticket_changes WHERE at < :cutoff")
+
+# the newest seq ever written, even if pruned since (AUTOINCREMENT)
+_NEWEST = text(
+    "SELECT COALESCE(MAX(seq), 0) FROM sqlite_sequence "
+    "WHERE name = 'ticket_changes'"
+)
+
+
+def new_origin() -> str:
+    """Identifies this process in the change log; unique per start."""
+    return f"{os.getpid()}-{secrets.token_hex(4)}"
+
+
+class ChangeFeed:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        origin: str,
+        *,
+        retention_s: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._engine = engine
+        self.origin = origin
+        self._retention_s = retention_s
+        self._clock = clock
+        self._conn: Optional[AsyncConnection] = None
+        self._data_version: Optional[int] = None
+        self._last_seq = 0
+        self._pruned_at = 0.0
+        # names the log in event ids; read by start()
+        self.epoch = ""
+        # applied entries from other processes
+        self.received = 0
+        # polls that found unread entries already pruned
+        self.resets = 0
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    def stats(self) -> dict:
+        return {
+            "last_seq": self._last_seq,
+            "received": self.received,
+            "resets": self.resets,
+        }
+
+    async def start(self) -> None:
+        """Open the polling connection; only later writes are reported."""
+        async with self._engine.begin() as conn:
+            await conn.execute(_CLAIM_EPOCH, {"epoch": secrets.token_hex(4)})
+            self.epoch = (await conn.execute(_EPOCH)).scalar_one()
+        self._conn = await self._engine.connect()
+        self._data_version = await self._read_data_version()
+        self._last_seq = (await self._conn.execute(_NEWEST)).scalar_one()
+        await self._conn.rollback()  # don't pin a WAL snapshot
+
+    async def aclose(self) -> None:
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    async def poll(self) -> Tuple[List[ChangeEvent], bool]:
+        """
+        Entries written since the last poll, oldest first (at most
+        BATCH_SIZE; call again while it returns a full one), this
+        process's own included: check `origin`.  The flag is True when
+        entries were pruned before this process read them: whatever it
+        derived from the log has to be reloaded.
+        """
+        if self._conn is None:
+            raise RuntimeError("change feed is not started")
+        try:
+            version = await self._read_data_version()
+            if version == self._data_version:
+                return [], False
+            rows = (
+                await self._conn.execute(
+                    _SINCE,
+                    {"after": self._last_seq, "limit": BATCH_SIZE},
+                )
+            ).fetchall()
+            # seqs have no holes, so a jump means pruned before read
+            first = (
+                rows[0][0]
+                if rows
+                else (await self._conn.execute(_NEWEST)).scalar_one() + 1
+            )
+            reset = first > self._last_seq + 1
+            if len(rows) < BATCH_SIZE:
+                # caught up: until someone commits again, nothing is new
+                self._data_version = version
+            await self._prune()
+        finally:
+            await self._conn.rollback()
+        if reset:
+            self.resets += 1
+            log.warning(
+                "Change log entries %d-%d were pruned before this process "
+                "read them; reloading",
+                self._last_seq + 1,
+                first - 1,
+            )
+            self._last_seq = first - 1
+        events = [
+            ChangeEvent(seq, kind, ticket_from_payload(payload), origin)
+            for seq, kind, origin, payload in rows
+        ]
+        if rows:
+            self._last_seq = rows[-1][0]
+        self.received += sum(e.origin != self.origin for e in events)
+        return events, reset
+
+    async def _read_data_version(self) -> int:
+        assert self._conn is not None
+        res = await self._conn.execute(text("PRAGMA data_version"))
+        return res.scalar_one()
+
+    async def _prune(self) -> None:
+        now = self._clock()
+        if now - self._pruned_at < PRUNE_INTERVAL_S:
+            return
+        self._pruned_at = now
+        assert self._conn is not None
+        res = await self._conn.execute(
+            _PRUNE, {"cutoff": now - self._retention_s}
+        )
+        await self._conn.commit()
+        if res.rowcount:
+            log.debug("Pruned %d change log entries", res.rowcount)
+
+    async def prune(self) -> int:
+        """
+        Delete the entries past the retention now, for a process that
+        writes to the log but never polls it (the job worker).
+        """
+        async with self._engine.begin() as conn:
+            res = await conn.execute(
+                _PRUNE, {"cutoff": self._clock() - self._retention_s}
+            )
+        return res.rowcount
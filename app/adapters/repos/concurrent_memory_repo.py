@@ -0,0 +1,433 @@
+"""
+Thread- and task-safe in-memory repository with snapshot reads.
+
+All state lives in an immutable _Snapshot.  Writers serialise on one lock.
+Each builds the next snapshot by copying only what it touches: one shard
+of the id map and one chunk of each affected sorted index.  It then
+publishes the snapshot with a single attribute assignment.  Readers never
+take the lock; they work on whichever snapshot is current when they start.
+A list page, an export or an aggregate therefore sees one consistent state,
+however many writes land meanwhile, and never holds a writer up.
+
+Stored Tickets are private copies, never mutated once published.  `get`
+and the write methods hand out copies, so callers may still mutate them
+and then call update().  Lists and searches return the shared objects:
+treat those as read-only.
+
+`search` is the exception to lock-free reads.  The inverted index is
+mutable, so scoring and indexing exclude each other on a second lock.
+Indexing happens after the snapshot is published, outside the write lock,
+and reads each ticket's text back from the current snapshot, so writers
+may index in any order.
+
+The locks are threading locks, since OS threads share the repository too,
+but a coroutine never blocks its event loop on one held by another
+thread: it waits in a helper thread instead.  Large batches (add_many of
+more than OFFLOAD_THRESHOLD tickets) are built and indexed in a helper
+thread, in chunks, so the loop and searches keep going meanwhile.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import dataclasses
+import threading
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from uuid import UUID
+
+from app.adapters.repos.in_memory_repo import _bucket, _buckets_for
+from app.adapters.repos.text_index import InvertedIndex
+from app.core.models import PageCursor, Priority, Status, Ticket
+from app.core.models import TicketStats
+from app.core.ports import TicketRepositoryPort
+from app.core.stats import count_ticket
+
+# id map shards: a write copies 1/SHARDS of the tickets, not all of them
+SHARDS = 64
+# sorted index chunks are split beyond twice this many keys
+CHUNK_SIZE = 256
+# a write touching more keys of a bucket rebuilds it instead (add_many)
+MERGE_THRESHOLD = 64
+# add_many of more tickets runs in a helper thread, off the event loop
+OFFLOAD_THRESHOLD = 1000
+# tickets indexed per hold of the text lock; searches run in between
+INDEX_CHUNK_SIZE = 500
+
+# (created_at, id-as-text, id): ordered like the SQLite adapter; the id
+# itself rides along so a key resolves to its ticket without a lookup map
+SortKey = Tuple[datetime, str, UUID]
+
+
+class _SortedKeys:
+    """Immutable sorted sequence kept in chunks; updates copy one chunk."""
+
+    __slots__ = ("_chunks", "_maxes", "_len")
+
+    def __init__(
+        self,
+        chunks: Tuple[Tuple[SortKey, ...], ...] = (),
+        maxes: Tuple[SortKey, ...] = (),
+        length: int = 0,
+    ) -> None:
+        self._chunks = chunks
+        self._maxes = maxes  # last key of every chunk, for bisect
+        self._len = length
+
+    @classmethod
+    def from_sorted(cls, keys: Sequence[SortKey]) -> "_SortedKeys":
+        chunks = tuple(
+            tuple(keys[i : i + CHUNK_SIZE])
+            for i in range(0, len(keys), CHUNK_SIZE)
+        )
+        return cls(chunks, tuple(c[-1] for c in chunks), len(keys))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def insert(self, key: SortKey) -> "_SortedKeys":
+        if not self._chunks:
+            return _SortedKeys(((key,),), (key,), 1)
+        i = min(bisect.bisect_left(self._maxes, key), len(self._chunks) - 1)
+        chunk = list(self._chunks[i])
+        bisect.insort(chunk, key)
+        if len(chunk) > 2 * CHUNK_SIZE:
+            parts = (tuple(chunk[:CHUNK_SIZE]), tuple(chunk[CHUNK_SIZE:]))
+        else:
+            parts = (tuple(chunk),)
+        return self._replace(i, parts, self._len + 1)
+
+    def remove(self, key: SortKey) -> "_SortedKeys":
+        i = bisect.bisect_left(self._maxes, key)
+        if i == len(self._chunks):
+            return self
+        chunk = self._chunks[i]
+        j = bisect.bisect_left(chunk, key)
+        if j == len(chunk) or chunk[j] != key:
+            return self
+        rest = chunk[:j] + chunk[j + 1 :]
+        return self._replace(i, (rest,) if rest else (), self._len - 1)
+
+    def merge(self, add: List[SortKey], remove: set) -> "_SortedKeys":
+        """Many changes at once: one O(n) rebuild instead of n copies."""
+        keys = [k for k in self if k not in remove] if remove else list(self)
+        keys.extend(add)
+        keys.sort()  # two sorted runs: timsort merges them in O(n)
+        return _SortedKeys.from_sorted(keys)
+
+    def _replace(self, i: int, parts: tuple, length: int) -> "_SortedKeys":
+        return _SortedKeys(
+            self._chunks[:i] + parts + self._chunks[i + 1 :],
+            self._maxes[:i]
+            + tuple(c[-1] for c in parts)
+            + self._maxes[i + 1 :],
+            length,
+        )
+
+    def newest(
+        self, limit: Optional[int], before: Optional[tuple] = None
+    ) -> List[SortKey]:
+        """Up to `limit` keys below `before`, largest first."""
+        chunks = self._chunks
+        i, end = len(chunks) - 1, None
+        if before is not None:
+            i = bisect.bisect_left(self._maxes, before)
+            if i == len(chunks):
+                i -= 1
+            else:
+                end = bisect.bisect_left(chunks[i], before)
+        out: List[SortKey] = []
+        while i >= 0 and (limit is None or len(out) < limit):
+            chunk = chunks[i]
+            stop = len(chunk) if end is None else end
+            start = 0 if limit is None else max(0, stop - limit + len(out))
+            out.extend(reversed(chunk[start:stop]))
+            i, end = i - 1, None
+        return out
+
+
+class _Snapshot(NamedTuple):
+    shards: Tuple[Dict[UUID, Ticket], ...]
+    buckets: Dict[Hashable, _SortedKeys]
+
+
+class ConcurrentInMemoryTicketRepository(TicketRepositoryPort):
+    """
+    Drop-in for InMemoryTicketRepository that may be shared by asyncio
+    tasks and OS threads (e.g. code offloaded with asyncio.to_thread).
+    """
+
+    def __init__(self) -> None:
+        self._snapshot = _Snapshot(tuple({} for _ in range(SHARDS)), {})
+        self._write_lock = threading.Lock()
+        self._text = InvertedIndex()
+        self._text_lock = threading.Lock()
+
+    # ───────────────────────── reads (lock-free) ────────────────
+    async def get(self, ticket_id: UUID) -> Optional[Ticket]:
+        ticket = self._snapshot.shards[_shard(ticket_id)].get(ticket_id)
+        return _copy(ticket) if ticket is not None else None
+
+    async def list(
+        self,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Ticket]:
+        return _page(self._snapshot, status, priority, limit, after)
+
+    async def iter_batches(
+        self,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[Ticket]]:
+        snap = self._snapshot  # the whole export sees one state
+        after = None
+        while True:
+            batch = _page(snap, status, priority, batch_size, after)
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            after = PageCursor(batch[-1].created_at, batch[-1].id)
+
+    async def search(
+        self,
+        query: str,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Ticket]:
+        async with _hold(self._text_lock):
+            scored = self._text.search(query)
+        shards = self._snapshot.shards
+        hits = []
+        for ticket_id, score in scored:
+            ticket = shards[_shard(ticket_id)].get(ticket_id)
+            if ticket is None:  # deleted after it was scored
+                continue
+            if status not in (None, ticket.status):
+                continue
+            if priority not in (None, ticket.priority):
+                continue
+            hits.append((score, ticket))
+        hits.sort(key=lambda h: (h[0], _sort_key(h[1])), reverse=True)
+        return [t for _, t in hits[offset : offset + limit]]
+
+    async def aggregate(self) -> TicketStats:
+        stats = TicketStats()
+        for shard in self._snapshot.shards:
+            for ticket in shard.values():
+                count_ticket(stats, ticket)
+        return stats
+
+    # ───────────────────────── writes (serialised) ──────────────
+    async def add(self, ticket: Ticket) -> None:
+        async with _hold(self._write_lock):
+            self._commit([_copy(ticket)], ())
+        await self._reindex([ticket.id])
+
+    async def add_many(self, tickets: Sequence[Ticket]) -> None:
+        if len(tickets) > OFFLOAD_THRESHOLD:
+            await asyncio.to_thread(self._add_many_blocking, tickets)
+            return
+        async with _hold(self._write_lock):
+            self._commit([_copy(t) for t in tickets], ())
+        await self._reindex([t.id for t in tickets])
+
+    async def update(self, ticket: Ticket) -> None:
+        async with _hold(self._write_lock):
+            if self._current(ticket.id) is not None:
+                ticket.version += 1
+            self._commit([_copy(ticket)], ())
+        await self._reindex([ticket.id])
+
+    async def update_fields(
+        self,
+        ticket_id: UUID,
+        changes: Mapping[str, Any],
+        *,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Ticket]:
+        async with _hold(self._write_lock):
+            current = self._current(ticket_id)
+            if current is None or expected_version not in (
+                None,
+                current.version,
+            ):
+                return None
+            updated = dataclasses.replace(
+                current, **changes, version=current.version + 1
+            )
+            self._commit([updated], ())
+        await self._reindex([ticket_id])
+        return _copy(updated)
+
+    async def delete(
+        self, ticket_id: UUID, *, expected_version: Optional[int] = None
+    ) -> Optional[Ticket]:
+        async with _hold(self._write_lock):
+            current = self._current(ticket_id)
+            if current is None or expected_version not in (
+                None,
+                current.version,
+            ):
+                return None
+            self._commit((), [current])
+        await self._reindex([ticket_id])
+        return _copy(current)
+
+    def _current(self, ticket_id: UUID) -> Optional[Ticket]:
+        return self._snapshot.shards[_shard(ticket_id)].get(ticket_id)
+
+    def _add_many_blocking(self, tickets: Sequence[Ticket]) -> None:
+        copies = [_copy(t) for t in tickets]
+        with self._write_lock:
+            self._commit(copies, ())
+        ids = [t.id for t in copies]
+        for start in range(0, len(ids), INDEX_CHUNK_SIZE):
+            with self._text_lock:
+                self._index_current(ids[start : start + INDEX_CHUNK_SIZE])
+
+    async def _reindex(self, ticket_ids: Sequence[UUID]) -> None:
+        async with _hold(self._text_lock):
+            self._index_current(ticket_ids)
+
+    def _index_current(self, ticket_ids: Iterable[UUID]) -> None:
+        """Bring the text index in line with the current snapshot."""
+        shards = self._snapshot.shards
+        for ticket_id in ticket_ids:
+            ticket = shards[_shard(ticket_id)].get(ticket_id)
+            if ticket is None:
+                self._text.remove(ticket_id)
+            else:
+                self._text.index(ticket_id, ticket.title, ticket.description)
+
+    def _commit(
+        self, puts: Sequence[Ticket], deletes: Sequence[Ticket]
+    ) -> None:
+        """
+        Build and publish the next snapshot.  Caller holds the lock, and
+        reindexes the text of the tickets afterwards.
+        """
+        snap = self._snapshot
+        shards = list(snap.shards)
+        copied = set()
+        # bucket → (keys to add, keys to remove); adds keep their order
+        changes: Dict[Hashable, Tuple[Dict[SortKey, None], set]] = {}
+
+        def _own(ticket_id: UUID) -> Dict[UUID, Ticket]:
+            s = _shard(ticket_id)
+            if s not in copied:
+                shards[s] = dict(shards[s])
+                copied.add(s)
+            return shards[s]
+
+        def _move(old: Optional[Ticket], new: Optional[Ticket]) -> None:
+            if old is not None:
+                if new is not None and _entry(old) == _entry(new):
+                    return
+                key = _sort_key(old)
+                for b in _buckets_for(old.status, old.priority):
+                    add, remove = changes.setdefault(b, ({}, set()))
+                    # added earlier in this same commit: just take it back
+                    if add.pop(key, False) is False:
+                        remove.add(key)
+            if new is not None:
+                key = _sort_key(new)
+                for b in _buckets_for(new.status, new.priority):
+                    changes.setdefault(b, ({}, set()))[0][key] = None
+
+        for ticket in puts:
+            shard = _own(ticket.id)
+            _move(shard.get(ticket.id), ticket)
+            shard[ticket.id] = ticket
+        for ticket in deletes:
+            _move(_own(ticket.id).pop(ticket.id), None)
+
+        buckets = dict(snap.buckets)
+        for b, (add, remove) in changes.items():
+            keys = buckets.get(b, _EMPTY)
+            if len(add) + len(remove) > MERGE_THRESHOLD:
+                keys = keys.merge(list(add), remove)
+            else:
+                for key in remove:
+                    keys = keys.remove(key)
+                for key in add:
+                    keys = keys.insert(key)
+            buckets[b] = keys
+
+        self._snapshot = _Snapshot(tuple(shards), buckets)
+
+
+_EMPTY = _SortedKeys()
+
+
+@asynccontextmanager
+async def _hold(lock: threading.Lock):
+    """`with lock`, but waiting for another thread off the event loop."""
+    if not lock.acquire(blocking=False):
+        waiter = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+        try:
+            await asyncio.shield(waiter)
+        except asyncio.CancelledError:
+            # the helper thread still gets the lock: hand it straight back
+            waiter.add_done_callback(lambda _: lock.release())
+            raise
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def _page(
+    snap: _Snapshot,
+    status: Optional[Status],
+    priority: Optional[Priority],
+    limit: Optional[int],
+    after: Optional[PageCursor],
+) -> List[Ticket]:
+    keys = snap.buckets.get(_bucket(status, priority), _EMPTY)
+    before = None if after is None else (after.created_at, str(after.id))
+    shards = snap.shards
+    return [shards[_shard(k[2])][k[2]] for k in keys.newest(limit, before)]
+
+
+def _shard(ticket_id: UUID) -> int:
+    return ticket_id.int % SHARDS
+
+
+def _sort_key(t: Ticket) -> SortKey:
+    return (t.created_at, str(t.id), t.id)
+
+
+def _entry(t: Ticket):
+    return (t.created_at, t.status, t.priority)
+
+
+def _copy(ticket: Ticket) -> Ticket:
+    return dataclasses.replace(ticket)
@@ -1,20 +1,48 @@
-from typing import Dict, List, Optional
+import bisect
+import dataclasses
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Hashable, List, Mapping
+from typing import Optional, Sequence, Tuple
 from uuid import UUID
 
-from app.core.models import Priority, Status, Ticket
+from app.adapters.repos.text_index import InvertedIndex
+from app.core.models import PageCursor, Priority, Status, Ticket
+from app.core.models import TicketStats
+from app.core.stats import count_ticket
 from app.core.ports import TicketRepositoryPort
 
+# (created_at, id-as-text): the same ordering the SQLite adapter uses
+SortKey = Tuple[datetime, str]
+_IndexEntry = Tuple[SortKey, Status, Priority]
+
 
 class InMemoryTicketRepository(TicketRepositoryPort):
     """
-    Tiny async repository.  **Not** thread-safe — fine for demos/tests only.
+    Tiny async repository.  **Not** thread-safe — fine for demos/tests only
+    (ConcurrentInMemoryTicketRepository is the shareable variant).
+
+    Secondary indexes keep one sorted list of sort keys per bucket (all
+    tickets, per status, per priority, per status×priority), so a filtered,
+    paginated `list` is a bisect plus a slice: O(log N + page size).
+    `search` is served by an inverted index over title and description.
     """
 
     def __init__(self) -> None:
         self._tickets: Dict[UUID, Ticket] = {}
+        # what each ticket was indexed under; callers may mutate the Ticket
+        # object in place before calling update(), so we can't re-read it
+        self._indexed: Dict[UUID, _IndexEntry] = {}
+        self._by_key: Dict[SortKey, UUID] = {}
+        self._buckets: Dict[Hashable, List[SortKey]] = {}
+        self._text = InvertedIndex()
 
+    # ───────────────────────── CRUD ─────────────────────────────
     async def add(self, ticket: Ticket) -> None:
-        self._tickets[ticket.id] = ticket
+        self._store(ticket)
+
+    async def add_many(self, tickets: Sequence[Ticket]) -> None:
+        for ticket in tickets:
+            self._store(ticket)
 
     async def get(self, ticket_id: UUID) -> Optional[Ticket]:
         return self._tickets.get(ticket_id)
@@ -23,16 +51,146 @@ class InMemoryTicketRepository(TicketRepositoryPort):
         self,
         status: Optional[Status] = None,
         priority: Optional[Priority] = None,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Ticket]:
+        keys = self._buckets.get(_bucket(status, priority), [])
+        # newest first: walk the ascending key list backwards
+        stop = len(keys)
+        if after is not None:
+            stop = bisect.bisect_left(keys, (after.created_at, str(after.id)))
+        start = 0 if limit is None else max(0, stop - limit)
+        return [
+            self._tickets[self._by_key[k]] for k in reversed(keys[start:stop])
+        ]
+
+    async def iter_batches(
+        self,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[Ticket]]:
+        after = None
+        while True:
+            batch = await self.list(
+                status, priority, limit=batch_size, after=after
+            )
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            after = PageCursor(batch[-1].created_at, batch[-1].id)
+
+    async def search(
+        self,
+        query: str,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
     ) -> List[Ticket]:
-        items: List[Ticket] = list(self._tickets.values())
-        if status is not None:
-            items = [t for t in items if t.status == status]
-        if priority is not None:
-            items = [t for t in items if t.priority == priority]
-        return items
+        hits = []
+        for ticket_id, score in self._text.search(query):
+            ticket = self._tickets[ticket_id]
+            if status not in (None, ticket.status):
+                continue
+            if priority not in (None, ticket.priority):
+                continue
+            hits.append((score, ticket))
+        # ties: newest first, as in the SQLite adapter
+        hits.sort(key=lambda h: (h[0], _sort_key(h[1])), reverse=True)
+        return [t for _, t in hits[offset : offset + limit]]
+
+    async def aggregate(self) -> TicketStats:
+        stats = TicketStats()
+        for ticket in self._tickets.values():
+            count_ticket(stats, ticket)
+        return stats
 
     async def update(self, ticket: Ticket) -> None:
+        if ticket.id in self._tickets:
+            ticket.version += 1
+        self._store(ticket)
+
+    async def update_fields(
+        self,
+        ticket_id: UUID,
+        changes: Mapping[str, Any],
+        *,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Ticket]:
+        current = self._matching(ticket_id, expected_version)
+        if current is None:
+            return None
+        updated = dataclasses.replace(
+            current, **changes, version=current.version + 1
+        )
+        self._store(updated)
+        return updated
+
+    async def delete(
+        self, ticket_id: UUID, *, expected_version: Optional[int] = None
+    ) -> Optional[Ticket]:
+        if self._matching(ticket_id, expected_version) is None:
+            return None
+        self._unindex(ticket_id)
+        self._text.remove(ticket_id)
+        return self._tickets.pop(ticket_id)
+
+    def _matching(
+        self, ticket_id: UUID, expected_version: Optional[int]
+    ) -> Optional[Ticket]:
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None or expected_version not in (None, ticket.version):
+            return None
+        return ticket
+
+    # ───────────────────────── indexes ──────────────────────────
+    def _store(self, ticket: Ticket) -> None:
+        entry = (_sort_key(ticket), ticket.status, ticket.priority)
+        if self._indexed.get(ticket.id) != entry:
+            self._unindex(ticket.id)
+            self._index(ticket.id, entry)
+        self._text.index(ticket.id, ticket.title, ticket.description)
         self._tickets[ticket.id] = ticket
 
-    async def delete(self, ticket_id: UUID) -> None:
-        self._tickets.pop(ticket_id, None)
+    def _index(self, ticket_id: UUID, entry: _IndexEntry) -> None:
+        key, status, priority = entry
+        for bucket in _buckets_for(status, priority):
+            bisect.insort(self._buckets.setdefault(bucket, []), key)
+        self._by_key[key] = ticket_id
+        self._indexed[ticket_id] = entry
+
+    def _unindex(self, ticket_id: UUID) -> None:
+        entry = self._indexed.pop(ticket_id, None)
+        if entry is None:
+            return
+        key, status, priority = entry
+        for bucket in _buckets_for(status, priority):
+            keys = self._buckets[bucket]
+            i = bisect.bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+        self._by_key.pop(key, None)
+
+
+def _sort_key(t: Ticket) -> SortKey:
+    # ids are compared as text, exactly like the TEXT primary key in SQLite
+    return (t.created_at, str(t.id))
+
+
+def _bucket(status: Optional[Status], priority: Optional[Priority]):
+    return (status, priority)
+
+
+def _buckets_for(status: Status, priority: Priority):
+    """Every listing bucket a ticket with these attributes belongs to."""
+    return (
+        _bucket(None, None),
+        _bucket(status, None),
+        _bucket(None, priority),
+        _bucket(status, priority),
+    )
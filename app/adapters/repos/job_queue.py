@@ -0,0 +1,333 @@
+"""
+Durable classification jobs in the `classification_jobs` SQLite table.
+
+Unlike the in-process WorkerPool, a job survives restarts: it is a row
+until a worker has finished it.
+
+    enqueue   one pending (queued or leased) job per ticket; enqueueing a
+              ticket that already has one is a no-op, and so is a
+              `classify` job for a ticket whose classification is dead
+    lease     a worker takes up to N due jobs, oldest first, for `lease_s`
+              seconds (renewed by `extend` while it works); a job whose
+              lease expires (the worker died) becomes due again
+    complete  done, kept for `stats()` until pruned
+    fail      queued again after an exponential backoff with jitter, or
+              dead (kept for inspection and `retry_dead`) after
+              `max_attempts` leases
+
+Every change is one short write transaction, so any number of API and
+worker processes can share the table.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List
+from uuid import UUID
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# rows per executemany / transaction in enqueue_many
+ENQUEUE_CHUNK_SIZE = 1000
+# what `stats()` counts as recent throughput
+THROUGHPUT_WINDOW_S = 60.0
+# error messages are truncated to this many characters
+MAX_ERROR_LENGTH = 500
+
+_INSERT = text(
+    """
+    INSERT OR IGNORE INTO classification_jobs
+    (ticket_id, kind, state, attempts, run_after, created_at)
+    VALUES (:ticket_id, :kind, 'queued', 0, :now, :now)
+    """
+)
+
+# a dead-lettered ticket stays TBD, so the startup requeue would otherwise
+# revive it on every restart; only retry_dead (or a reclassify) does that
+_INSERT_CLASSIFY = text(
+    """
+    INSERT OR IGNORE INTO classification_jobs
+    (ticket_id, kind, state, attempts, run_after, created_at)
+    SELECT :ticket_id, 'classify', 'queued', 0, :now, :now
+    WHERE NOT EXISTS (
+        SELECT 1 FROM classification_jobs
+        WHERE ticket_id = :ticket_id AND state = 'dead'
+    )
+    """
+)
+
+# expired leases that used their last attempt are not handed out again
+_BURY_EXPIRED = text(
+    """
+    UPDATE classification_jobs
+    SET state = 'dead', finished_at = :now, lease_owner = NULL,
+        leased_until = NULL, last_error = 'lease expired'
+    WHERE state = 'leased' AND leased_until < :now
+      AND attempts >= :max_attempts
+    """
+)
+
+# read-only: an idle worker's poll takes no write lock
+_ANY_DUE = text(
+    """
+    SELECT EXISTS (
+        SELECT 1 FROM classification_jobs
+        WHERE state = 'queued' AND run_after <= :now
+    ) OR EXISTS (
+        SELECT 1 FROM classification_jobs
+        WHERE state = 'leased' AND leased_until < :now
+    )
+    """
+)
+
+# oldest due first; each arm walks the (state, run_after) index and stops
+# after `limit` rows, so only 2 × limit rows are sorted
+_LEASE = text(
+    """
+    UPDATE classification_jobs
+    SET state = 'leased', lease_owner = :owner,
+        leased_until = :now + :lease_s, attempts = attempts + 1
+    WHERE id IN (
+        SELECT id FROM (
+            SELECT * FROM (
+                SELECT id, run_after FROM classification_jobs
+                WHERE state = 'queued' AND run_after <= :now
+                ORDER BY run_after, id
+                LIMIT :limit
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT id, run_after FROM classification_jobs
+                WHERE state = 'leased' AND leased_until < :now
+                ORDER BY run_after, id
+                LIMIT :limit
+            )
+        )
+        ORDER BY run_after, id
+        LIMIT :limit
+    )
+    RETURNING id, ticket_id, kind, attempts
+    """
+)
+
+_EXTEND = text(
+    """
+    UPDATE classification_jobs SET leased_until = :until
+    WHERE id IN :ids AND state = 'leased' AND lease_owner = :owner
+    """
+).bindparams(bindparam("ids", expanding=True))
+
+
+@dataclass(frozen=True)
+class Job:
+    id: int
+    ticket_id: UUID
+    kind: str  # "classify" | "reclassify"
+    attempts: int  # including the current one
+
+
+class SQLiteJobQueue:
+    """Implements ClassificationQueuePort with durable, leased jobs."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        max_attempts: int = 5,
+        backoff_s: float = 2.0,
+        backoff_max_s: float = 300.0,
+        clock: Callable[[], float] = time.time,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self._engine = engine
+        self._max_attempts = max_attempts
+        self._backoff_s = backoff_s
+        self._backoff_max_s = backoff_max_s
+        self._clock = clock
+        self._rand = rand
+
+    # ───────────────────────── producer side ────────────────────
+    async def enqueue(self, ticket_id: UUID) -> None:
+        await self.enqueue_many([ticket_id])
+
+    async def enqueue_many(
+        self, ticket_ids: Iterable[UUID], *, kind: str = "classify"
+    ) -> int:
+        """Queue jobs; returns how many were new (not already pending)."""
+        now = self._clock()
+        rows = [
+            {"ticket_id": str(i), "kind": kind, "now": now} for i in ticket_ids
+        ]
+        insert = _INSERT_CLASSIFY if kind == "classify" else _INSERT
+        added = 0
+        for start in range(0, len(rows), ENQUEUE_CHUNK_SIZE):
+            async with self._engine.begin() as conn:
+                res = await conn.execute(
+                    insert, rows[start : start + ENQUEUE_CHUNK_SIZE]
+                )
+                added += res.rowcount
+        return added
+
+    # ───────────────────────── consumer side ────────────────────
+    async def lease(self, owner: str, limit: int, lease_s: float) -> List[Job]:
+        """Up to `limit` due jobs, now owned by `owner` for `lease_s`."""
+        now = self._clock()
+        async with self._engine.connect() as conn:
+            due = (await conn.execute(_ANY_DUE, {"now": now})).scalar_one()
+        if not due:
+            return []
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                _BURY_EXPIRED,
+                {"now": now, "max_attempts": self._max_attempts},
+            )
+            rows = (
+                await conn.execute(
+                    _LEASE,
+                    {
+                        "owner": owner,
+                        "now": now,
+                        "lease_s": lease_s,
+                        "limit": limit,
+                    },
+                )
+            ).fetchall()
+        return sorted(
+            (Job(row[0], UUID(row[1]), row[2], row[3]) for row in rows),
+            key=lambda job: job.id,
+        )
+
+    async def extend(
+        self, jobs: Iterable[Job], owner: str, lease_s: float
+    ) -> int:
+        """Renew `owner`'s leases on `jobs`; returns how many it still held."""
+        ids = [job.id for job in jobs]
+        if not ids:
+            return 0
+        async with self._engine.begin() as conn:
+            res = await conn.execute(
+                _EXTEND,
+                {
+                    "until": self._clock() + lease_s,
+                    "ids": ids,
+                    "owner": owner,
+                },
+            )
+        return res.rowcount
+
+    async def complete(self, job: Job, owner: str) -> bool:
+        """False if the lease was lost (expired and taken by another)."""
+        return await self._finish(
+            job,
+            owner,
+            "state = 'done', finished_at = :now, last_error = NULL",
+            {"now": self._clock()},
+        )
+
+    async def fail(self, job: Job, owner: str, error: str) -> bool:
+        """Retry later with backoff, or dead-letter on the last attempt."""
+        now = self._clock()
+        error = error[:MAX_ERROR_LENGTH]
+        if job.attempts >= self._max_attempts:
+            return await self._finish(
+                job,
+                owner,
+                "state = 'dead', finished_at = :now, last_error = :error",
+                {"now": now, "error": error},
+            )
+        return await self._finish(
+            job,
+            owner,
+            "state = 'queued', run_after = :run_after, last_error = :error",
+            {"run_after": now + self.backoff(job.attempts), "error": error},
+        )
+
+    def backoff(self, attempts: int) -> float:
+        """Capped exponential delay; half of it fixed, half random."""
+        delay = min(self._backoff_max_s, self._backoff_s * 2 ** (attempts - 1))
+        return delay / 2 + delay / 2 * self._rand()
+
+    async def _finish(
+        self, job: Job, owner: str, assignments: str, params: dict
+    ) -> bool:
+        sql = (
+            f"UPDATE classification_jobs SET {assignments}, "
+            "lease_owner = NULL, leased_until = NULL "
+            "WHERE id = :id AND state = 'leased' AND lease_owner = :owner"
+        )
+        async with self._engine.begin() as conn:
+            res = await conn.execute(
+                text(sql), {**params, "id": job.id, "owner": owner}
+            )
+        return res.rowcount == 1
+
+    # ───────────────────────── operations ───────────────────────
+    async def stats(self) -> dict:
+        """Jobs per state, the oldest due job's age, recent throughput."""
+        now = self._clock()
+        async with self._engine.connect() as conn:
+            counts = dict(
+                (
+                    await conn.execute(
+                        text(
+                            "SELECT state, COUNT(*) FROM classification_jobs "
+                            "GROUP BY state"
+                        )
+                    )
+                ).fetchall()
+            )
+            oldest, recent = (
+                await conn.execute(
+                    text(
+                        """
+                        SELECT
+                          (SELECT MIN(run_after) FROM classification_jobs
+                           WHERE state = 'queued' AND run_after <= :now),
+                          (SELECT COUNT(*) FROM classification_jobs
+                           WHERE state = 'done' AND finished_at >= :since)
+                        """
+                    ),
+                    {"now": now, "since": now - THROUGHPUT_WINDOW_S},
+                )
+            ).one()
+        return {
+            **{
+                s: counts.get(s, 0)
+                for s in ("queued", "leased", "done", "dead")
+            },
+            "oldest_due_age_s": round(now - oldest, 3) if oldest else 0.0,
+            "done_per_s": round(recent / THROUGHPUT_WINDOW_S, 3),
+        }
+
+    async def retry_dead(self) -> int:
+        """Give every dead job a fresh set of attempts."""
+        async with self._engine.begin() as conn:
+            res = await conn.execute(
+                text(
+                    """
+                    UPDATE OR IGNORE classification_jobs
+                    SET state = 'queued', attempts = 0, run_after = :now,
+                        finished_at = NULL
+                    WHERE state = 'dead'
+                    """
+                ),
+                {"now": self._clock()},
+            )
+        return res.rowcount
+
+    async def prune(self, retention_s: float) -> int:
+        """Delete done jobs finished more than `retention_s` ago."""
+        async with self._engine.begin() as conn:
+            res = await conn.execute(
+                text(
+                    "DELETE FROM classification_jobs "
+                    "WHERE state = 'done' AND finished_at < :cutoff"
+                ),
+                {"cutoff": self._clock() - retention_s},
+            )
+        return res.rowcount
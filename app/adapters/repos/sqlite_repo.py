@@ -3,15 +3,70 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import List, Optional
+import time
+from typing import Any, AsyncIterator, List, Mapping, Optional, Sequence
 from uuid import UUID
 
+import orjson
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.ext.asyncio import AsyncEngine
 
-from app.core.models import Priority, Status, Ticket
+from app.adapters.repos.text_index import TITLE_WEIGHT, parse_query
+from app.core.models import (
+    PageCursor,
+    Priority,
+    Status,
+    Ticket,
+    TicketStats,
+)
 from app.core.ports import TicketRepositoryPort
 
+# rows per executemany / transaction in add_many
+BULK_CHUNK_SIZE = 1000
+
+_INSERT = text(
+    """
+    INSERT INTO tickets
+    (id, title, description, priority, status, created_at, updated_at,
+     version, closed_at)
+    VALUES
+    (:id, :title, :description, :priority, :status, :created_at, :updated_at,
+     :version, :closed_at)
+    """
+)
+
+# every SELECT/RETURNING names the columns in this order, so rows are
+# hydrated by position (see _row_to_ticket)
+_COLUMNS = (
+    "id, title, description, priority, status, created_at, updated_at, "
+    "version, closed_at"
+)
+_COLUMN_NAMES = tuple(_COLUMNS.split(", "))
+_TICKET_COLUMNS = ", ".join(f"tickets.{c}" for c in _COLUMN_NAMES)
+
+# see app/db/schema.py: ticket_changes
+_LOG_CHANGE = text(
+    """
+    INSERT INTO ticket_changes (origin, kind, payload, at)
+    VALUES (:origin, :kind, :payload, :at)
+    """
+)
+
+# value → member without going through Enum.__call__
+_PRIORITIES = {p.value: p for p in Priority}
+_STATUSES = {s.value: s for s in Status}
+
+# columns update_fields() may touch; keys are never interpolated otherwise
+_UPDATABLE = (
+    "title",
+    "description",
+    "priority",
+    "status",
+    "updated_at",
+    "closed_at",
+)
+
 
 class SQLiteTicketRepository(TicketRepositoryPort):
     """
@@ -19,39 +74,80 @@ class SQLiteTicketRepository(TicketRepositoryPort):
     The only SQLAlchemy feature used here is the async engine/connection.
     """
 
-    def __init__(self, engine: AsyncEngine) -> None:
+    def __init__(
+        self, engine: AsyncEngine, *, change_origin: Optional[str] = None
+    ) -> None:
         self._engine = engine
+        # set → every write is also appended to ticket_changes, tagged with
+        # this origin, for the other processes' ChangeFeed
+        self._origin = change_origin
 
     # ───────────────────────── helpers ──────────────────────────
     @staticmethod
     def _row_to_ticket(row) -> Ticket:
-        """Convert a DB row into a domain Ticket."""
-        m = row._mapping
+        """Convert a DB row (columns in _COLUMNS order) into a Ticket."""
+        (
+            ticket_id,
+            title,
+            description,
+            priority,
+            status,
+            created_at,
+            updated_at,
+            version,
+            closed_at,
+        ) = row
         return Ticket(
-            id=UUID(m["id"]),
-            title=m["title"],
-            description=m["description"],
-            priority=Priority(m["priority"]),
-            status=Status(m["status"]),
-            created_at=_as_dt(m["created_at"]),
-            updated_at=_as_dt(m["updated_at"]),
+            UUID(ticket_id),
+            title,
+            description,
+            _PRIORITIES[priority],
+            _STATUSES[status],
+            _as_dt(created_at),
+            _as_dt(updated_at),
+            version,
+            _as_dt(closed_at) if closed_at else None,
+        )
+
+    async def _log(
+        self, conn: AsyncConnection, kind: str, rows: Sequence[Sequence]
+    ) -> None:
+        """Record the written rows in the change log, same transaction."""
+        if self._origin is None or not rows:
+            return
+        at = time.time()
+        await conn.execute(
+            _LOG_CHANGE,
+            [
+                {
+                    "origin": self._origin,
+                    "kind": kind,
+                    "payload": _payload(row),
+                    "at": at,
+                }
+                for row in rows
+            ],
         )
 
     # ───────────────────────── CRUD ─────────────────────────────
     async def add(self, ticket: Ticket) -> None:
-        q = text(
-            """
-            INSERT INTO tickets
-            (id, title, description, priority, status, created_at, updated_at)
-            VALUES
-            (:id, :title, :description, :priority, :status, :created_at, :updated_at)
-            """
-        )
+        p = _params(ticket)
         async with self._engine.begin() as conn:
-            await conn.execute(q, _params(ticket))
+            await conn.execute(_INSERT, p)
+            await self._log(conn, "created", [_row(p)])
+
+    async def add_many(self, tickets: Sequence[Ticket]) -> None:
+        # a list of parameter dicts → DBAPI executemany; one commit per chunk
+        for start in range(0, len(tickets), BULK_CHUNK_SIZE):
+            chunk = [
+                _params(t) for t in tickets[start : start + BULK_CHUNK_SIZE]
+            ]
+            async with self._engine.begin() as conn:
+                await conn.execute(_INSERT, chunk)
+                await self._log(conn, "created", [_row(p) for p in chunk])
 
     async def get(self, ticket_id: UUID) -> Optional[Ticket]:
-        q = text("SELECT * FROM tickets WHERE id = :id")
+        q = text(f"SELECT {_COLUMNS} FROM tickets WHERE id = :id")
         async with self._engine.connect() as conn:
             res = await conn.execute(q, {"id": str(ticket_id)})
             row = res.fetchone()
@@ -61,23 +157,116 @@ class SQLiteTicketRepository(TicketRepositoryPort):
         self,
         status: Optional[Status] = None,
         priority: Optional[Priority] = None,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
     ) -> List[Ticket]:
-        sql = "SELECT * FROM tickets"
-        clauses, p = [], {}
-        if status:
-            clauses.append("status = :status")
-            p["status"] = status.value
-        if priority:
-            clauses.append("priority = :priority")
-            p["priority"] = priority.value
-        if clauses:
-            sql += " WHERE " + " AND ".join(clauses)
-        sql += " ORDER BY created_at DESC"
+        clauses, p = _filters(status, priority)
+        if after is not None:
+            # row-value comparison → a range seek on the (…, created_at, id)
+            # indexes instead of OFFSET scanning
+            clauses.append("(created_at, id) < (:after_created_at, :after_id)")
+            p["after_created_at"] = after.created_at
+            p["after_id"] = str(after.id)
+        sql = _select(clauses)
+        if limit is not None:
+            sql += " LIMIT :limit"
+            p["limit"] = limit
 
         async with self._engine.connect() as conn:
             rows = (await conn.execute(text(sql), p)).fetchall()
             return [self._row_to_ticket(r) for r in rows]
 
+    async def iter_batches(
+        self,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[Ticket]]:
+        clauses, p = _filters(status, priority)
+        # server-side cursor: rows are stepped out of SQLite batch by batch
+        # (one read transaction → a consistent snapshot for the whole run)
+        async with self._engine.connect() as conn:
+            result = await conn.stream(text(_select(clauses)), p)
+            async for rows in result.partitions(batch_size):
+                yield [self._row_to_ticket(r) for r in rows]
+
+    async def search(
+        self,
+        query: str,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Ticket]:
+        match = _fts_query(query)
+        if match is None:
+            return []
+        clauses, p = _filters(status, priority)
+        p.update(match=match, limit=limit, offset=offset)
+        rank = f"bm25(tickets_fts, {TITLE_WEIGHT}, 1.0)"
+        # ties: newest row first (rowid follows insertion order)
+        if not clauses:
+            # rank inside the FTS index alone, then fetch only the page
+            sql = f"""
+                SELECT {_TICKET_COLUMNS} FROM (
+                    SELECT rowid AS hit, {rank} AS score FROM tickets_fts
+                    WHERE tickets_fts MATCH :match
+                    ORDER BY score, rowid DESC
+                    LIMIT :limit OFFSET :offset
+                ) AS hits
+                JOIN tickets ON tickets.rowid = hits.hit
+                ORDER BY hits.score, hits.hit DESC
+            """
+        else:
+            # status/priority live in tickets: filter during the join
+            sql = f"""
+                SELECT {_TICKET_COLUMNS} FROM tickets_fts
+                JOIN tickets ON tickets.rowid = tickets_fts.rowid
+                WHERE tickets_fts MATCH :match AND {" AND ".join(clauses)}
+                ORDER BY {rank}, tickets.rowid DESC
+                LIMIT :limit OFFSET :offset
+            """
+        async with self._engine.connect() as conn:
+            rows = (await conn.execute(text(sql), p)).fetchall()
+            return [self._row_to_ticket(r) for r in rows]
+
+    async def aggregate(self) -> TicketStats:
+        stats = TicketStats()
+        async with self._engine.connect() as conn:
+            # served from the (status, priority, …) index, not the table
+            rows = await conn.execute(
+                text(
+                    "SELECT status, priority, COUNT(*) FROM tickets "
+                    "GROUP BY status, priority"
+                )
+            )
+            for status, priority, n in rows:
+                stats.counts[(Status(status), Priority(priority))] = n
+            # date() normalises the stored offset to a UTC day
+            rows = await conn.execute(
+                text(
+                    "SELECT date(created_at), COUNT(*) FROM tickets "
+                    "GROUP BY 1"
+                )
+            )
+            stats.created_per_day = {
+                dt.date.fromisoformat(day): n for day, n in rows
+            }
+            rows = await conn.execute(
+                text(
+                    "SELECT date(closed_at), COUNT(*) FROM tickets "
+                    "WHERE status = 'CLOSED' AND closed_at IS NOT NULL "
+                    "GROUP BY 1"
+                )
+            )
+            stats.closed_per_day = {
+                dt.date.fromisoformat(day): n for day, n in rows
+            }
+        return stats
+
     async def update(self, ticket: Ticket) -> None:
         q = text(
             """
@@ -87,20 +276,93 @@ class SQLiteTicketRepository(TicketRepositoryPort):
               priority    = :priority,
               status      = :status,
               created_at  = :created_at,
-              updated_at  = :updated_at
+              updated_at  = :updated_at,
+              closed_at   = :closed_at,
+              version     = version + 1
             WHERE id = :id
-            """
+            RETURNING """
+            + _COLUMNS
         )
         async with self._engine.begin() as conn:
-            await conn.execute(q, _params(ticket))
+            row = (await conn.execute(q, _params(ticket))).fetchone()
+            if row:
+                await self._log(conn, "updated", [row])
+        if row:
+            ticket.version = row.version
+
+    async def update_fields(
+        self,
+        ticket_id: UUID,
+        changes: Mapping[str, Any],
+        *,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Ticket]:
+        unknown = set(changes) - set(_UPDATABLE)
+        if unknown:
+            raise ValueError(f"cannot update column(s) {sorted(unknown)}")
+        # only the changed columns are written; one statement, no pre-read
+        sets = [f"{col} = :{col}" for col in _UPDATABLE if col in changes]
+        sets.append("version = version + 1")
+        sql = f"UPDATE tickets SET {', '.join(sets)} WHERE id = :id"
+        p = {col: _db_value(v) for col, v in changes.items()}
+        p["id"] = str(ticket_id)
+        if expected_version is not None:
+            sql += " AND version = :expected_version"
+            p["expected_version"] = expected_version
+        sql += f" RETURNING {_COLUMNS}"
+
+        async with self._engine.begin() as conn:
+            row = (await conn.execute(text(sql), p)).fetchone()
+            if row:
+                await self._log(conn, "updated", [row])
+        return self._row_to_ticket(row) if row else None
 
-    async def delete(self, ticket_id: UUID) -> None:
-        q = text("DELETE FROM tickets WHERE id = :id")
+    async def delete(
+        self, ticket_id: UUID, *, expected_version: Optional[int] = None
+    ) -> Optional[Ticket]:
+        sql = "DELETE FROM tickets WHERE id = :id"
+        p: dict = {"id": str(ticket_id)}
+        if expected_version is not None:
+            sql += " AND version = :expected_version"
+            p["expected_version"] = expected_version
+        sql += f" RETURNING {_COLUMNS}"
         async with self._engine.begin() as conn:
-            await conn.execute(q, {"id": str(ticket_id)})
+            row = (await conn.execute(text(sql), p)).fetchone()
+            if row:
+                await self._log(conn, "deleted", [row])
+        return self._row_to_ticket(row) if row else None
 
 
 # ───────────────────────── internal utils ──────────────────────────
+def _filters(status: Optional[Status], priority: Optional[Priority]):
+    clauses, p = [], {}
+    if status:
+        clauses.append("status = :status")
+        p["status"] = status.value
+    if priority:
+        clauses.append("priority = :priority")
+        p["priority"] = priority.value
+    return clauses, p
+
+
+def _fts_query(query: str) -> Optional[str]:
+    """
+    User text → FTS5 MATCH expression.  Every word is quoted, so operators
+    and stray quotes in the input are never parsed as syntax.
+    """
+    terms = parse_query(query)
+    if not terms:
+        return None
+    return " ".join(f'"{t}"*' if prefix else f'"{t}"' for t, prefix in terms)
+
+
+def _select(clauses: List[str]) -> str:
+    sql = f"SELECT {_COLUMNS} FROM tickets"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    return sql + " ORDER BY created_at DESC, id DESC"
+
+
 def _params(t: Ticket) -> dict:
     return {
         "id": str(t.id),
@@ -110,14 +372,39 @@ def _params(t: Ticket) -> dict:
         "status": t.status.value,
         "created_at": t.created_at,
         "updated_at": t.updated_at,
+        "version": t.version,
+        "closed_at": t.closed_at,
     }
 
 
+def _row(p: dict) -> tuple:
+    """_params() → a row in _COLUMNS order."""
+    return tuple(p[c] for c in _COLUMN_NAMES)
+
+
+def _payload(row: Sequence) -> str:
+    # datetimes (or the strings SQLite returned) become ISO-8601 text
+    return orjson.dumps(list(row), default=str).decode()
+
+
+def ticket_from_payload(payload: str | bytes) -> Ticket:
+    """A ticket_changes payload → the Ticket it describes."""
+    return SQLiteTicketRepository._row_to_ticket(orjson.loads(payload))
+
+
+def _db_value(v: Any) -> Any:
+    """Enums are stored by value; everything else as-is."""
+    return v.value if isinstance(v, (Priority, Status)) else v
+
+
+_fromisoformat = dt.datetime.fromisoformat
+
+
 def _as_dt(v) -> dt.datetime:
     """
     SQLite stores DATETIME as str; turn that back into datetime.
     If the driver already returned a datetime instance → no-op.
     """
-    if isinstance(v, dt.datetime):
-        return v
-    return dt.datetime.fromisoformat(v)
+    if isinstance(v, str):
+        return _fromisoformat(v)
+    return v
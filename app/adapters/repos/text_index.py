@@ -0,0 +1,146 @@
+"""
+In-memory inverted index with BM25 ranking, the counterpart of the
+`tickets_fts` FTS5 table for InMemoryTicketRepository.
+
+Tokenisation follows FTS5's `unicode61 remove_diacritics 2` tokenizer:
+casefolded runs of letters/digits, accents stripped.  A query matches a
+ticket when every term occurs in its title or description; a term written
+with a trailing `*` (at least MIN_PREFIX_LEN characters) matches as a
+prefix.  Title hits weigh TITLE_WEIGHT times more, like the column weights
+given to bm25() in the SQLite adapter.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Hashable, List, Set, Tuple
+
+TITLE_WEIGHT = 10.0
+# standard BM25 constants (the same defaults FTS5 uses)
+K1 = 1.2
+B = 0.75
+
+# shorter prefixes expand to too many terms to rank in milliseconds
+MIN_PREFIX_LEN = 3
+
+_WORD = re.compile(r"[^\W_]+")
+_QUERY_TERM = re.compile(r"([^\W_]+)(\*?)")
+
+
+def _fold(text: str) -> str:
+    folded = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(c for c in folded if not unicodedata.combining(c))
+
+
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(_fold(text))
+
+
+def parse_query(query: str) -> List[Tuple[str, bool]]:
+    """Query text → [(term, is_prefix)]; everything but words is dropped."""
+    return [
+        (term, bool(star) and len(term) >= MIN_PREFIX_LEN)
+        for term, star in _QUERY_TERM.findall(_fold(query))
+    ]
+
+
+class InvertedIndex:
+    """Not thread-safe; owned by one repository instance."""
+
+    def __init__(self) -> None:
+        # term → doc → (hits in title, hits in description)
+        self._postings: Dict[str, Dict[Hashable, Tuple[int, int]]] = {}
+        self._terms: List[str] = []  # sorted, for prefix lookups
+        self._docs: Dict[Hashable, Tuple[Counter, Counter]] = {}
+        self._texts: Dict[Hashable, Tuple[str, str]] = {}
+        self._lengths: Dict[Hashable, float] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def index(self, doc: Hashable, title: str, description: str) -> None:
+        if self._texts.get(doc) == (title, description):
+            return  # status/priority changes don't touch the text
+        self.remove(doc)
+        title_tf = Counter(tokenize(title))
+        desc_tf = Counter(tokenize(description))
+        for term in title_tf.keys() | desc_tf.keys():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._terms, term)
+            postings[doc] = (title_tf[term], desc_tf[term])
+        self._docs[doc] = (title_tf, desc_tf)
+        self._texts[doc] = (title, description)
+        length = TITLE_WEIGHT * title_tf.total() + desc_tf.total()
+        self._lengths[doc] = length
+        self._total_length += length
+
+    def remove(self, doc: Hashable) -> None:
+        entry = self._docs.pop(doc, None)
+        if entry is None:
+            return
+        for term in entry[0].keys() | entry[1].keys():
+            postings = self._postings[term]
+            del postings[doc]
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect.bisect_left(self._terms, term)]
+        self._total_length -= self._lengths.pop(doc)
+        del self._texts[doc]
+
+    def search(self, query: str) -> List[Tuple[Hashable, float]]:
+        """(doc, score) for every match, best first."""
+        terms = parse_query(query)
+        if not terms or not self._docs:
+            return []
+        # every term must match: a group is the term or its expansions
+        groups = [self._expand(t) if p else [t] for t, p in terms]
+        if any(not g for g in groups):
+            return []
+        candidates: Set[Hashable] | None = None
+        for group in sorted(groups, key=self._group_size):
+            docs = set().union(*(self._postings.get(t, ()) for t in group))
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return []
+
+        n = len(self._docs)
+        avg = self._total_length / n
+        scores = dict.fromkeys(candidates, 0.0)
+        for group in groups:
+            for term in group:
+                postings = self._postings.get(term, {})
+                idf = math.log(
+                    1 + (n - len(postings) + 0.5) / (len(postings) + 0.5)
+                )
+                # walk whichever side is smaller
+                if len(postings) < len(candidates):
+                    pairs = (
+                        (d, h) for d, h in postings.items() if d in candidates
+                    )
+                else:
+                    pairs = (
+                        (d, postings[d]) for d in candidates if d in postings
+                    )
+                for doc, hits in pairs:
+                    tf = TITLE_WEIGHT * hits[0] + hits[1]
+                    norm = K1 * (1 - B + B * self._lengths[doc] / avg)
+                    scores[doc] += idf * tf * (K1 + 1) / (tf + norm)
+        return sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+
+    def _expand(self, prefix: str) -> List[str]:
+        i = bisect.bisect_left(self._terms, prefix)
+        out = []
+        while i < len(self._terms) and self._terms[i].startswith(prefix):
+            out.append(self._terms[i])
+            i += 1
+        return out
+
+    def _group_size(self, group: List[str]) -> int:
+        return sum(len(self._postings.get(t, ())) for t in group)
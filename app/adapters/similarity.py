@@ -0,0 +1,216 @@
+"""
+Local near-duplicate index over ticket text (NumPy, no network).
+
+Every ticket becomes a DIM-dimensional vector built with the hashing
+trick.  Features are its words plus the character trigrams of each word
+(so "login"/"log-in"/"logins" still overlap), title features counting
+twice, with sublinear tf.  Each feature is hashed with crc32, which is
+stable across processes, into a signed bucket.  Vectors are L2-normalised,
+so one matrix-vector product gives the cosine similarity to every indexed
+ticket.
+
+The index keeps the `max_entries` most recently written tickets in a
+preallocated matrix; the least recently written one is evicted.  It is fed
+by TicketService on every write and is what lets a new ticket reuse the
+priority of a recent near-identical one instead of paying an LLM call.
+The reuse window runs from when a classifier decided the priority, not from
+the ticket's last write: a ticket that borrowed its priority expires with
+the verdict it borrowed, so a chain of near-duplicates can't keep an old
+answer alive.  (Tickets indexed from storage, by a rebuild or from another
+worker, count from their `updated_at`.)  Single event loop only.
+"""
+
+from __future__ import annotations
+
+import math
+import zlib
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from app.adapters.repos.text_index import tokenize
+from app.core.models import Priority, Ticket
+from app.core.ports import SimilarityIndexPort
+
+DIM = 512
+TITLE_WEIGHT = 2.0
+TRIGRAM_WEIGHT = 0.5
+# below this two texts share little more than a few common trigrams
+MIN_SIMILARITY = 0.1
+# reused verdicts remembered until the ticket that borrowed one is indexed
+MAX_BORROWED = 1024
+
+_Verdict = Tuple[Priority, datetime]
+
+
+def _features(title: str, description: str) -> Counter:
+    counts: Counter = Counter()
+    for weight, text in ((TITLE_WEIGHT, title), (1.0, description)):
+        for word in tokenize(text):
+            counts["w:" + word] += weight
+            padded = f"<{word}>"
+            for i in range(len(padded) - 2):
+                counts[padded[i : i + 3]] += weight * TRIGRAM_WEIGHT
+    return counts
+
+
+def embed(title: str, description: str) -> np.ndarray:
+    """Unit-length hashed n-gram vector (all zeros for text without words)."""
+    buckets, weights = [], []
+    for feature, count in _features(title, description).items():
+        h = zlib.crc32(feature.encode())
+        buckets.append(h % DIM)
+        tf = 1.0 + math.log(count) if count >= 1 else count
+        weights.append(tf if h & 0x80000000 else -tf)
+    vec = np.bincount(buckets, weights=weights, minlength=DIM).astype(
+        np.float32
+    )
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else vec
+
+
+class SimilarityIndex(SimilarityIndexPort):
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        *,
+        reuse_threshold: float = 0.8,
+        reuse_window_s: float = 3600.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        """
+        A new ticket reuses the priority of the most similar classified
+        ticket if the cosine similarity is at least `reuse_threshold` and
+        that ticket's priority was decided less than `reuse_window_s` ago.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._matrix = np.zeros((max_entries, DIM), dtype=np.float32)
+        # ticket id → row, least recently written first
+        self._rows: "OrderedDict[UUID, int]" = OrderedDict()
+        self._free = list(range(max_entries - 1, -1, -1))
+        self._ids: List[Optional[UUID]] = [None] * max_entries
+        self._classified = np.zeros(max_entries, dtype=bool)  # not TBD
+        # ticket id → (priority, when it was decided or None, version)
+        self._meta: Dict[UUID, Tuple[Priority, Optional[datetime], int]] = {}
+        # (title, description) → the (priority, decided at) handed out
+        self._borrowed: "OrderedDict[Tuple[str, str], _Verdict]" = (
+            OrderedDict()
+        )
+        self._reuse_threshold = reuse_threshold
+        self._reuse_window_s = reuse_window_s
+        self._clock = clock
+        self.reuses = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def stats(self) -> dict:
+        return {"entries": len(self._rows), "reuses": self.reuses}
+
+    def upsert(self, ticket: Ticket) -> None:
+        known = self._meta.get(ticket.id)
+        if known is not None and known[2] > ticket.version:
+            return  # a stale copy (e.g. read by a rebuild before a write)
+        classified_at = self._classified_at(ticket, known)
+        row = self._rows.pop(ticket.id, None)
+        if row is None:
+            if not self._free:
+                _, oldest = self._rows.popitem(last=False)
+                self._release(oldest)
+            row = self._free.pop()
+        self._rows[ticket.id] = row
+        self._ids[row] = ticket.id
+        self._matrix[row] = embed(ticket.title, ticket.description)
+        self._classified[row] = classified_at is not None
+        self._meta[ticket.id] = (
+            ticket.priority,
+            classified_at,
+            ticket.version,
+        )
+
+    def _classified_at(
+        self,
+        ticket: Ticket,
+        known: Optional[Tuple[Priority, Optional[datetime], int]],
+    ) -> Optional[datetime]:
+        """When the ticket's priority was decided (None while TBD)."""
+        if ticket.priority == Priority.TBD:
+            return None
+        borrowed = self._borrowed.pop((ticket.title, ticket.description), None)
+        if borrowed is not None and borrowed[0] == ticket.priority:
+            return borrowed[1]  # reused: as old as the verdict it copies
+        if known is not None and known[0] == ticket.priority:
+            return known[1]  # an edit, not a new verdict
+        return ticket.updated_at
+
+    def remove(self, ticket_id: UUID) -> None:
+        row = self._rows.pop(ticket_id, None)
+        if row is not None:
+            self._release(row)
+
+    def _release(self, row: int) -> None:
+        ticket_id = self._ids[row]
+        self._meta.pop(ticket_id, None)
+        self._ids[row] = None
+        self._matrix[row] = 0.0
+        self._classified[row] = False
+        self._free.append(row)
+
+    def nearest(
+        self,
+        title: str,
+        description: str,
+        *,
+        limit: int = 10,
+        exclude: Optional[UUID] = None,
+        min_score: float = MIN_SIMILARITY,
+    ) -> List[Tuple[UUID, float]]:
+        """(ticket id, cosine similarity), most similar first."""
+        scores = self._scores(title, description)
+        if scores is None:
+            return []
+        if exclude is not None and exclude in self._rows:
+            scores[self._rows[exclude]] = -1.0
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k] if k else []
+        out = []
+        for row in sorted(top, key=lambda r: -scores[r]):
+            ticket_id = self._ids[row]
+            if ticket_id is not None and scores[row] > min_score:
+                out.append((ticket_id, round(float(scores[row]), 4)))
+        return out
+
+    def reusable_priority(
+        self, title: str, description: str
+    ) -> Optional[Priority]:
+        """Priority of a recent classified near-duplicate, if there is one."""
+        scores = self._scores(title, description)
+        if scores is None:
+            return None
+        scores[~self._classified] = -1.0
+        rows = np.flatnonzero(scores >= self._reuse_threshold)
+        now = self._clock()
+        for row in rows[np.argsort(-scores[rows])]:  # best first
+            priority, classified_at, _ = self._meta[self._ids[row]]
+            if (now - classified_at).total_seconds() <= self._reuse_window_s:
+                self.reuses += 1
+                self._borrowed[(title, description)] = (
+                    priority,
+                    classified_at,
+                )
+                if len(self._borrowed) > MAX_BORROWED:
+                    self._borrowed.popitem(last=False)
+                return priority
+        return None
+
+    def _scores(self, title: str, description: str) -> Optional[np.ndarray]:
+        if not self._rows:
+            return None
+        query = embed(title, description)
+        if not query.any():
+            return None
+        return self._matrix @ query
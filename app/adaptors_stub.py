@@ -1,42 +1,398 @@
 """
-choose concrete adapters & build singletons (one instance only).
+choose concrete adapters & wire them into ONE Container per worker process.
+
+The lifespan in app/main.py builds it at startup, keeps it on
+`app.state.container` and closes it on shutdown; app/api/deps.py hands its
+long-lived TicketService to the routes.  Nothing is built at import time.
 """
 
-import logging
-from app.adapters.repos.in_memory_repo import InMemoryTicketRepository
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.adapters.events import ChangeBus
+from app.adapters.instrumented import (
+    InstrumentedPriorityClassifier,
+    InstrumentedTicketRepository,
+)
+from app.adapters.breaker import CircuitBreaker
+from app.adapters.llm.cached_classifier import (
+    CachingPriorityClassifier,
+    SQLiteClassificationCacheStore,
+)
+from app.adapters.llm.factory import (
+    build_classifier,
+    build_fallback,
+    build_local_stages,
+    is_remote,
+)
+from app.adapters.llm.resilient import (
+    FallbackPriorityClassifier,
+    ResilientPriorityClassifier,
+)
+from app.adapters.llm.tiered import TieredPriorityClassifier
+from app.adapters.repos.change_feed import ChangeFeed, new_origin
+from app.adapters.repos.job_queue import SQLiteJobQueue
 from app.adapters.repos.sqlite_repo import SQLiteTicketRepository
+from app.config import Settings, get_settings
+from app.core.models import ChangeEvent
+from app.core.ports import (
+    PriorityClassifierPort,
+    SimilarityIndexPort,
+    TicketRepositoryPort,
+)
+from app.core.service import TicketService
+from app.core.stats import TicketCounters
+from app.db.engine import build_engine
+from app.observability.metrics import REGISTRY, CallbackGauge
+from app.workers.pool import WorkerPool
+
+
+@dataclass
+class Container:
+    settings: Settings
+    engine: AsyncEngine
+    repository: TicketRepositoryPort
+    classifier: PriorityClassifierPort
+    # the undecorated classifier (possibly lazy), for warm_up_classifier()
+    base_classifier: PriorityClassifierPort
+    counters: TicketCounters
+    change_bus: ChangeBus
+    pool: Optional[WorkerPool] = None
+    similarity_index: Optional[SimilarityIndexPort] = None
+    # the other worker processes' writes (CROSS_PROCESS_SYNC)
+    change_feed: Optional[ChangeFeed] = None
+    # durable classification jobs ("queue" mode, reclassification)
+    jobs: Optional[SQLiteJobQueue] = None
+    # persisted classifications (CLASSIFY_CACHE_PERSIST), purged periodically
+    classification_store: Optional[SQLiteClassificationCacheStore] = None
+    # the local pre-classifier (CLASSIFY_LOCAL); aclose() cancels its audits
+    tiered: Optional[TieredPriorityClassifier] = None
+    service: TicketService = field(init=False)
+    # CallbackGauges registered for this container, dropped by aclose()
+    metric_names: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.service = TicketService(
+            repository=self.repository,
+            classifier=self.classifier,
+            classification_queue=(
+                self.jobs
+                if self.settings.classify_mode == "queue"
+                else self.pool
+            ),
+            # with a change log, the bus is fed from it, in log order (see
+            # apply_remote_changes), so every worker numbers events alike
+            change_bus=self.change_bus if self.change_feed is None else None,
+            counters=self.counters,
+            similarity_index=self.similarity_index,
+            jobs=self.jobs,
+        )
+
+    async def start(self) -> None:
+        await warm_pool(self.engine, self.settings.db_pool_size)
+        if self.change_feed is not None:
+            await self.change_feed.start()
+            self.change_bus.share(
+                self.change_feed.epoch, self.change_feed.last_seq
+            )
+        if self.pool is not None:
+            await self.pool.start()
+
+    async def warm_up_classifier(self) -> None:
+        """Build a lazily constructed classifier now rather than on use."""
+        warm_up = getattr(self.base_classifier, "warm_up", None)
+        if warm_up is not None:
+            await warm_up()
+
+    def apply_remote_changes(
+        self, events: Sequence[ChangeEvent], reset: bool = False
+    ) -> None:
+        """
+        Change log entries: every one goes on the change bus, and those
+        another process wrote drop stale copies, then are replayed.  With
+        `reset` (see ChangeFeed.poll) earlier writes were missed, so every
+        cached ticket is dropped first.
+        """
+        feed = self.change_feed
+        if feed is not None:
+            if reset:
+                self.change_bus.reset(
+                    events[0].seq - 1 if events else feed.last_seq
+                )
+            for event in events:
+                self.change_bus.publish(event.kind, event.ticket, event.seq)
+            events = [e for e in events if e.origin != feed.origin]
+        invalidate = getattr(self.repository, "invalidate", None)
+        if reset:
+            if invalidate is not None:
+                invalidate()
+            self.service.resync_remote_changes()
+        if invalidate is not None:
+            for event in events:
+                invalidate(event.ticket.id)
+        self.service.apply_remote_changes(events)
+
+    async def aclose(self) -> None:
+        try:
+            if self.pool is not None:
+                await self.pool.drain(
+                    timeout=self.settings.classify_drain_timeout_s
+                )
+        finally:
+            for name in self.metric_names:
+                REGISTRY.unregister(name)
+            if self.tiered is not None:
+                await self.tiered.aclose()
+            if self.change_feed is not None:
+                await self.change_feed.aclose()
+            await self.engine.dispose()
+
+
+async def warm_pool(engine: AsyncEngine, size: int) -> None:
+    """
+    Open up to `size` pooled connections now, so the first requests don't
+    pay for connecting and the per-connection PRAGMAs.  The first one is
+    opened alone: it may switch the file to WAL, which needs the lock.
+    """
+
+    conns = [await engine.connect()]
+    try:
+        await conns[0].execute(text("SELECT 1"))
+        if _in_memory(engine):
+            return  # one shared connection (StaticPool)
+        # held open together, so each one is a distinct connection
+        for _ in range(size - 1):
+            conns.append(await engine.connect())
+        await asyncio.gather(*(c.execute(text("SELECT 1")) for c in conns[1:]))
+    finally:
+        for conn in conns:
+            await conn.close()
 
-# ----------------------------- Classifier -----------------------------
-try:
-    from app.adapters.llm.langgraph_classifier import (
-        LangGraphPriorityClassifier,
+
+def _in_memory(engine: AsyncEngine) -> bool:
+    return engine.dialect.name == "sqlite" and engine.url.database in (
+        None,
+        "",
+        ":memory:",
     )
 
-    _classifier = LangGraphPriorityClassifier()
 
-except Exception as exc:  # pylint: disable=broad-exception-caught
-    # No OPENAI_API_KEY, missing deps, or any runtime issue → PRIORITY = TBD
-    logging.warning(
-        "LangGraphPriorityClassifier unavailable (%s) – defaulting all "
-        "tickets to priority=TBD.",
-        exc,
+def build_container(settings: Optional[Settings] = None) -> Container:
+    settings = settings or get_settings()
+    engine = build_engine(settings.database_url, settings)
+    metric_names: List[str] = []
+
+    # ----------------------- Cross-process change log ---------------------
+    # an in-memory database can't be shared between processes anyway
+    change_feed: Optional[ChangeFeed] = None
+    if settings.cross_process_sync and not _in_memory(engine):
+        change_feed = feed = ChangeFeed(
+            engine,
+            new_origin(),
+            retention_s=settings.change_log_retention_s,
+        )
+        REGISTRY.register(
+            CallbackGauge(
+                "change_feed",
+                "Writes replayed from other worker processes (last_seq, "
+                "received).",
+                lambda: {(k,): float(v) for k, v in feed.stats().items()},
+                ("stat",),
+            )
+        )
+        metric_names.append("change_feed")
+
+    # ------------------------------ Adapters ------------------------------
+    repo: TicketRepositoryPort = SQLiteTicketRepository(
+        engine, change_origin=change_feed.origin if change_feed else None
     )
-    from app.adapters.llm.tbd_classifier import TbdPriorityClassifier
+    # chosen by CLASSIFIER; the LLM one is only built on first use / warm-up
+    classifier = base_classifier = build_classifier(settings)
 
-    _classifier = TbdPriorityClassifier()
+    # ----------------------- Instrumentation (inner) ----------------------
+    if settings.metrics_enabled:
+        repo = InstrumentedTicketRepository(repo)
+        classifier = InstrumentedPriorityClassifier(classifier, layer="llm")
 
-from app.core.service import TicketService
-from app.db.engine import engine
+    # ----------------------- Deadline, cap, breaker, hedging -------------
+    # inside the cache: its "no answer" (TBD) is never cached.  Only for
+    # the remote LLM: the local classifiers neither hang nor fail, and a
+    # TBD classifier's every answer would count as a failure
+    if is_remote(base_classifier):
+        classifier = resilient = ResilientPriorityClassifier(
+            classifier,
+            timeout_s=settings.classify_timeout_s,
+            max_concurrency=settings.classify_max_concurrency,
+            breaker=(
+                CircuitBreaker(
+                    settings.classify_breaker_failures,
+                    settings.classify_breaker_reset_s,
+                )
+                if settings.classify_breaker_failures > 0
+                else None
+            ),
+            hedge_after_s=settings.classify_hedge_after_s,
+        )
+        REGISTRY.register(
+            CallbackGauge(
+                "classifier_resilience",
+                "Classifier guard counters (timeouts, short_circuits, "
+                "breaker_open, …).",
+                lambda: {(k,): float(v) for k, v in resilient.stats().items()},
+                ("stat",),
+            )
+        )
+        metric_names.append("classifier_resilience")
+
+    # ----------------------- Ticket read-through cache --------------------
+    if settings.repo_cache_size > 0:
+        from app.adapters.repos.cached_repo import CachingTicketRepository
+
+        repo = ticket_cache = CachingTicketRepository(
+            repo,
+            max_entries=settings.repo_cache_size,
+            ttl_s=settings.repo_cache_ttl_s,
+            negative_ttl_s=settings.repo_cache_negative_ttl_s,
+        )
+        REGISTRY.register(
+            CallbackGauge(
+                "ticket_cache",
+                "Ticket read-through cache counters (hits, misses, "
+                "hit_ratio, …).",
+                lambda: {
+                    (k,): float(v) for k, v in ticket_cache.stats().items()
+                },
+                ("stat",),
+            )
+        )
+        metric_names.append("ticket_cache")
+
+    # ----------------------- Classification cache -------------------------
+    # only worth it for the LLM; a local classifier answers faster than a
+    # lookup, and hot-reloaded keyword rules must take effect at once
+    classification_store: Optional[SQLiteClassificationCacheStore] = None
+    if settings.classify_cache_size > 0 and is_remote(base_classifier):
+        if settings.classify_cache_persist:
+            classification_store = SQLiteClassificationCacheStore(engine)
+        classifier = cache = CachingPriorityClassifier(
+            classifier,
+            max_entries=settings.classify_cache_size,
+            ttl_s=settings.classify_cache_ttl_s,
+            store=classification_store,
+        )
+        REGISTRY.register(
+            CallbackGauge(
+                "classifier_cache",
+                "Classification cache counters (hits, misses, entries, …).",
+                lambda: {(k,): float(v) for k, v in cache.stats().items()},
+                ("stat",),
+            )
+        )
+        metric_names.append("classifier_cache")
 
-# ONE singleton repo + ONE singleton classifier, kept for the life of the process
+    # ----------------------- Local fallback -------------------------------
+    fallback = build_fallback(settings)
+    if fallback is not None:
+        classifier = FallbackPriorityClassifier(classifier, fallback)
 
-# # In-memory database
-# _repo = InMemoryTicketRepository()
-# _classifier = FakePriorityClassifier()
+    # ----------------------- Local pre-classifier -------------------------
+    # settles confident tickets before the cache/LLM chain is consulted
+    tiered: Optional[TieredPriorityClassifier] = None
+    if settings.classify_local:
+        classifier = tiered = TieredPriorityClassifier(
+            build_local_stages(settings),
+            classifier,
+            min_confidence=settings.classify_local_min_confidence,
+            audit_rate=settings.classify_local_audit_rate,
+        )
+        REGISTRY.register(
+            CallbackGauge(
+                "classifier_tiers",
+                "Local pre-classifier counters (escalation_rate, "
+                "agreement_escalated, …).",
+                lambda: {(k,): float(v) for k, v in tiered.stats().items()},
+                ("stat",),
+            )
+        )
+        metric_names.append("classifier_tiers")
 
-# SQWLite Database
-_repo = SQLiteTicketRepository(engine)
+    # ----------------------- Instrumentation (outer) ----------------------
+    # what the service sees: cache hits included
+    if settings.metrics_enabled:
+        classifier = InstrumentedPriorityClassifier(
+            classifier, layer="service"
+        )
 
+    # ----------------------- Near-duplicate index -------------------------
+    similarity_index: Optional[SimilarityIndexPort] = None
+    if settings.similarity_index_size > 0:
+        from app.adapters.similarity import SimilarityIndex
 
-def get_service() -> TicketService:
-    return TicketService(repository=_repo, classifier=_classifier)
+        similarity_index = index = SimilarityIndex(
+            settings.similarity_index_size,
+            reuse_threshold=settings.similarity_reuse_threshold,
+            reuse_window_s=settings.similarity_reuse_window_s,
+        )
+        REGISTRY.register(
+            CallbackGauge(
+                "similarity_index",
+                "Near-duplicate index counters (entries, reuses).",
+                lambda: {(k,): float(v) for k, v in index.stats().items()},
+                ("stat",),
+            )
+        )
+        metric_names.append("similarity_index")
+
+    # ----------------------- Background classification --------------------
+    pool: Optional[WorkerPool] = None
+    if settings.classify_mode == "background":
+
+        async def _classify_in_background(ticket_id: UUID) -> None:
+            await container.service.classify_ticket(ticket_id)
+
+        pool = WorkerPool(
+            _classify_in_background,
+            concurrency=settings.classify_workers,
+            queue_size=settings.classify_queue_size,
+        )
+        REGISTRY.register(
+            CallbackGauge(
+                "classification_queue_depth",
+                "Tickets waiting for background classification.",
+                lambda: {(): float(pool.pending)},
+            )
+        )
+        metric_names.append("classification_queue_depth")
+
+    # ----------------------- Durable jobs ---------------------------------
+    jobs = SQLiteJobQueue(
+        engine,
+        max_attempts=settings.classify_job_max_attempts,
+        backoff_s=settings.classify_job_backoff_s,
+        backoff_max_s=settings.classify_job_backoff_max_s,
+    )
+
+    container = Container(
+        settings=settings,
+        engine=engine,
+        repository=repo,
+        classifier=classifier,
+        base_classifier=base_classifier,
+        counters=TicketCounters(),
+        change_bus=ChangeBus(buffer_size=settings.events_buffer_size),
+        pool=pool,
+        similarity_index=similarity_index,
+        change_feed=change_feed,
+        jobs=jobs,
+        classification_store=classification_store,
+        tiered=tiered,
+        metric_names=metric_names,
+    )
+    return container
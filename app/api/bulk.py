@@ -0,0 +1,145 @@
+"""
+Request-body parsing for POST /tickets/bulk.
+
+Accepts a JSON array (`application/json`) or newline-delimited JSON
+(`application/x-ndjson`, streamed line by line so large uploads are never
+held in memory as one document).  Yields `(index, TicketCreate | error)`
+so one malformed item never rejects the whole batch.  A body, line or item
+count over its MAX_BULK_* cap raises BulkTooLargeError (413).
+"""
+
+import json
+from typing import AsyncIterator, Tuple, Union
+
+from fastapi import Request
+from pydantic import ValidationError
+
+from app.api import schemas as dto
+
+NDJSON_TYPES = (
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+)
+MAX_BULK_ITEMS = 50_000
+# largest JSON array body, which is parsed as one document
+MAX_BULK_BODY_BYTES = 32 * 1024 * 1024
+# longest NDJSON line (one ticket)
+MAX_BULK_LINE_BYTES = 1024 * 1024
+# tickets handed to the service per repository write
+BULK_CHUNK_SIZE = 1000
+
+BulkItem = Tuple[int, Union[dto.TicketCreate, str]]
+
+
+class BulkBodyError(ValueError):
+    """The body as a whole is unusable (not an array, invalid JSON…)."""
+
+
+class BulkTooLargeError(BulkBodyError):
+    """More than MAX_BULK_ITEMS items, or a body or line over its cap."""
+
+
+def _validate(index: int, obj) -> BulkItem:
+    try:
+        return index, dto.TicketCreate.model_validate(obj)
+    except ValidationError as exc:
+        first = exc.errors()[0]
+        loc = ".".join(str(p) for p in first["loc"]) or "item"
+        return index, f"{loc}: {first['msg']}"
+
+
+async def iter_bulk_items(request: Request) -> AsyncIterator[BulkItem]:
+    content_type = request.headers.get("content-type", "").split(";")[0]
+    if content_type.strip().lower() in NDJSON_TYPES:
+        index = 0
+        async for line in _iter_lines(request):
+            if not line.strip():
+                continue
+            if index >= MAX_BULK_ITEMS:
+                # stop reading; earlier chunks may already be stored
+                raise BulkTooLargeError(
+                    f"at most {MAX_BULK_ITEMS} items per request; the "
+                    f"first {MAX_BULK_ITEMS} were processed"
+                )
+            try:
+                obj = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                yield index, "invalid JSON line"
+            else:
+                yield _validate(index, obj)
+            index += 1
+        return
+
+    try:
+        payload = json.loads(await _read_body(request))
+    except json.JSONDecodeError as exc:
+        raise BulkBodyError(f"invalid JSON: {exc.msg}") from exc
+    if not isinstance(payload, list):
+        raise BulkBodyError("expected a JSON array of tickets")
+    if len(payload) > MAX_BULK_ITEMS:
+        raise BulkTooLargeError(f"at most {MAX_BULK_ITEMS} items per request")
+    for index, obj in enumerate(payload):
+        yield _validate(index, obj)
+
+
+async def _read_body(request: Request) -> bytearray:
+    too_large = BulkTooLargeError(
+        f"a JSON array body is limited to {MAX_BULK_BODY_BYTES} bytes; "
+        "send larger uploads as NDJSON"
+    )
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > MAX_BULK_BODY_BYTES:
+        raise too_large
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_BULK_BODY_BYTES:  # chunked, or a wrong length
+            raise too_large
+    return body
+
+
+async def _iter_lines(request: Request) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    count = 0
+    async for chunk in request.stream():
+        scan = len(buffer)  # the bytes already held have no newline
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", scan)) != -1:
+            if end - start > MAX_BULK_LINE_BYTES:
+                raise _line_too_long(count)
+            yield bytes(buffer[start:end])
+            count += 1
+            start = scan = end + 1
+        del buffer[:start]
+        if len(buffer) > MAX_BULK_LINE_BYTES:
+            raise _line_too_long(count)
+    if buffer:
+        yield bytes(buffer)
+
+
+def _line_too_long(lines_before: int) -> BulkTooLargeError:
+    return BulkTooLargeError(
+        f"NDJSON lines are limited to {MAX_BULK_LINE_BYTES} bytes; line "
+        f"{lines_before + 1} is longer and was not read, the lines before "
+        "it were processed"
+    )
+
+
+BULK_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/TicketCreate"},
+                }
+            },
+            "application/x-ndjson": {
+                "schema": {"$ref": "#/components/schemas/TicketCreate"}
+            },
+        },
+    }
+}
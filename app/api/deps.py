@@ -3,11 +3,31 @@ deps.py benefits:
 1) make FastAPI’s dependency-injection system happy at runtime
 2)exposes that pre-wired service to FastAPI in a way that
 can be cleanly overridden during tests.
+
+The service and the bus live on the Container the lifespan put on
+`app.state`, so resolving them is an attribute lookup, not a build.
 """
 
-from app.adaptors_stub import get_service
+from fastapi import Request
+
+from app.adapters.events import ChangeBus
+from app.adaptors_stub import Container
 from app.core.service import TicketService
 
 
-async def get_ticket_service() -> TicketService:
-    return get_service()
+def _container(request: Request) -> Container:
+    container = getattr(request.app.state, "container", None)
+    if container is None:
+        raise RuntimeError(
+            "no adapters wired: the app's lifespan did not run "
+            "(override the dependencies when testing without it)"
+        )
+    return container
+
+
+async def get_ticket_service(request: Request) -> TicketService:
+    return _container(request).service
+
+
+async def get_event_bus(request: Request) -> ChangeBus:
+    return _container(request).change_bus
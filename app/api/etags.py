@@ -0,0 +1,47 @@
+"""
+ETag helpers: a ticket's ETag is its quoted version number.
+
+GET returns it, `If-None-Match` turns a re-fetch into a 304, and
+`If-Match` on PATCH/DELETE makes the write conditional (412 on mismatch).
+"""
+
+from typing import Optional
+
+from app.core.models import Ticket
+
+
+class PreconditionFailed(ValueError):
+    """If-Match could not possibly match (malformed or foreign ETag)."""
+
+
+def etag_for(ticket: Ticket) -> str:
+    return f'"{ticket.version}"'
+
+
+def expected_version(if_match: Optional[str]) -> Optional[int]:
+    """
+    If-Match → the version the client expects.  None means "unconditional"
+    (header absent or `*`).  Weak validators are accepted: the version is
+    a strong identity anyway.  Lists are not supported, only one ETag.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    if (
+        len(tag) < 3
+        or not (tag[0] == tag[-1] == '"')
+        or not tag[1:-1].isdigit()
+    ):
+        raise PreconditionFailed(if_match)
+    return int(tag[1:-1])
+
+
+def matches(if_none_match: Optional[str], ticket: Ticket) -> bool:
+    """True when `If-None-Match` already names the current version."""
+    if if_none_match is None:
+        return False
+    current = etag_for(ticket)
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or current in tags
@@ -0,0 +1,70 @@
+"""
+Server-sent events for GET /tickets/events.
+
+Frames look like
+
+    id: <epoch>-<seq>
+    event: created | updated | deleted | reset
+    data: <ticket JSON>            (deleted: {"id": ...}; reset: {})
+
+A client resumes by sending the last id back as `Last-Event-ID`, to any
+worker process when they share a change log (CROSS_PROCESS_SYNC).  `reset`
+means "the history you asked for is gone, re-fetch GET /tickets".  It is
+also the first frame for a client without an id, and it carries the
+cursor to resume from.
+
+The generator only pulls the next event once the previous frame was sent.
+A slow client therefore throttles only its own reader.  If it falls behind
+by more than the bus keeps, it gets a `reset` rather than unbounded
+buffering.
+"""
+
+import json
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from app.adapters.events import ChangeBus
+from app.api import schemas as dto
+from app.core.models import ChangeEvent
+
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+# how long a browser waits before reconnecting, in ms
+RETRY_MS = 3000
+
+
+def _frame(event_id: str, kind: str, data: str) -> str:
+    return f"id: {event_id}\nevent: {kind}\ndata: {data}\n\n"
+
+
+def _payload(event: ChangeEvent) -> str:
+    if event.kind == "deleted":
+        return json.dumps({"id": str(event.ticket.id)})
+    return dto.TicketRead.model_validate(event.ticket).model_dump_json()
+
+
+async def stream_events(
+    bus: ChangeBus,
+    last_event_id: Optional[str],
+    *,
+    once: bool,
+    heartbeat_s: float,
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    """
+    Yield SSE frames from `last_event_id` on.  With `once`, stop after the
+    backlog (catch-up polling for clients that can't hold a connection).
+    """
+    seq = bus.parse_event_id(last_event_id)
+    yield f"retry: {RETRY_MS}\n\n"
+    while True:
+        events, reset = bus.since(seq)
+        if reset:
+            seq = bus.last_seq
+            yield _frame(bus.event_id(seq), "reset", "{}")
+        for event in events:
+            seq = event.seq
+            yield _frame(bus.event_id(seq), event.kind, _payload(event))
+        if once or await is_disconnected():
+            return
+        if not await bus.wait(seq, heartbeat_s):
+            yield ": keep-alive\n\n"  # comment frame; detects dead peers
@@ -0,0 +1,179 @@
+"""
+Encoders for GET /tickets/export.
+
+Each one turns the service's batches of tickets into byte chunks for a
+StreamingResponse.  One batch is encoded at a time, so the memory used is
+bounded by the batch size, not the table size.  Rows are flattened
+straight from the domain Ticket: there is no pydantic round-trip per row.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
+
+from app.core.models import Ticket
+
+EXPORT_BATCH_SIZE = 1000
+COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "priority",
+    "status",
+    "created_at",
+    "updated_at",
+    "version",
+    "closed_at",
+)
+
+Batches = AsyncIterator[List[Ticket]]
+Encoder = Callable[[Batches], AsyncIterator[bytes]]
+
+
+class ExportFormatUnavailable(RuntimeError):
+    """The optional library behind a format is not installed."""
+
+
+def _row(t: Ticket) -> Dict[str, Any]:
+    return {
+        "id": str(t.id),
+        "title": t.title,
+        "description": t.description,
+        "priority": t.priority.value,
+        "status": t.status.value,
+        "created_at": t.created_at.isoformat(),
+        "updated_at": t.updated_at.isoformat(),
+        "version": t.version,
+        "closed_at": t.closed_at.isoformat() if t.closed_at else None,
+    }
+
+
+async def ndjson_chunks(batches: Batches) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield "".join(
+            json.dumps(_row(t), ensure_ascii=False) + "\n" for t in batch
+        ).encode()
+
+
+async def csv_chunks(batches: Batches) -> AsyncIterator[bytes]:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=COLUMNS)
+    writer.writeheader()
+    async for batch in batches:
+        writer.writerows(_row(t) for t in batch)
+        yield buf.getvalue().encode()
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():  # header only: empty result
+        yield buf.getvalue().encode()
+
+
+class _DrainableSink:
+    """Write-only file for ParquetWriter whose contents we hand out."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self._parts: List[bytes] = []
+        self._pos = 0
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self) -> None:
+        pass
+
+    def writable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        out = b"".join(self._parts)
+        self._parts.clear()
+        return out
+
+
+def parquet_chunks(batches: Batches) -> AsyncIterator[bytes]:
+    """One parquet row group per batch; the footer is sent last."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # optional dependency
+        raise ExportFormatUnavailable("parquet export needs pyarrow") from exc
+
+    ts = pa.timestamp("s", tz="UTC")
+    schema = pa.schema(
+        [
+            ("id", pa.string()),
+            ("title", pa.string()),
+            ("description", pa.string()),
+            ("priority", pa.string()),
+            ("status", pa.string()),
+            ("created_at", ts),
+            ("updated_at", ts),
+            ("version", pa.int64()),
+            ("closed_at", ts),
+        ]
+    )
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        sink = _DrainableSink()
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+        try:
+            async for batch in batches:
+                columns = {
+                    "id": [str(t.id) for t in batch],
+                    "title": [t.title for t in batch],
+                    "description": [t.description for t in batch],
+                    "priority": [t.priority.value for t in batch],
+                    "status": [t.status.value for t in batch],
+                    "created_at": [t.created_at for t in batch],
+                    "updated_at": [t.updated_at for t in batch],
+                    "version": [t.version for t in batch],
+                    "closed_at": [t.closed_at for t in batch],
+                }
+                writer.write_table(pa.table(columns, schema=schema))
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+    return _chunks()
+
+
+# format → (encoder, media type, file extension)
+FORMATS: Dict[str, Tuple[Encoder, str, str]] = {
+    "ndjson": (ndjson_chunks, "application/x-ndjson", "ndjson"),
+    "csv": (csv_chunks, "text/csv; charset=utf-8", "csv"),
+    "parquet": (parquet_chunks, "application/vnd.apache.parquet", "parquet"),
+}
+
+
+def encode(fmt: str, batches: Batches) -> AsyncIterator[bytes]:
+    """
+    The `fmt` byte stream for `batches`.  Closing it (client gone) also
+    closes the batches, which releases the database cursor right away.
+    """
+    chunks = FORMATS[fmt][0](batches)
+
+    async def _closing() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+            aclose = getattr(batches, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    return _closing()
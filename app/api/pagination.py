@@ -0,0 +1,62 @@
+"""
+Opaque keyset cursors for GET /tickets.
+
+A cursor is the url-safe base64 of "<created_at ISO>|<uuid>" taken from the
+last ticket of the previous page.  Clients must treat it as a black box.
+
+Search results are ranked, not ordered by a key, so GET /tickets/search
+pages by position instead: its cursor wraps "@<offset>".
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from app.core.models import PageCursor, Ticket
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client sends a cursor we did not issue."""
+
+
+def _b64(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _unb64(token: str) -> str:
+    padded = token + "=" * (-len(token) % 4)
+    return base64.urlsafe_b64decode(padded.encode()).decode()
+
+
+def encode_cursor(ticket: Ticket) -> str:
+    return _b64(f"{ticket.created_at.isoformat()}|{ticket.id}")
+
+
+def decode_cursor(token: str) -> PageCursor:
+    try:
+        raw = _unb64(token)
+        created_at, ticket_id = raw.split("|", 1)
+        return PageCursor(
+            created_at=datetime.fromisoformat(created_at), id=UUID(ticket_id)
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError(token) from exc
+
+
+def encode_offset_cursor(offset: int) -> str:
+    return _b64(f"@{offset}")
+
+
+def decode_offset_cursor(token: str) -> int:
+    try:
+        raw = _unb64(token)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError(token) from exc
+    if not raw.startswith("@") or not raw[1:].isdigit():
+        raise InvalidCursorError(token)
+    return int(raw[1:])
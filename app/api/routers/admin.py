@@ -0,0 +1,44 @@
+"""
+Operator endpoints for the durable classification jobs.  Nothing here
+classifies inline: jobs are run by `python -m app.workers.classify`.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api import schemas as dto
+from app.api.deps import get_ticket_service
+from app.core.service import TicketService
+
+router = APIRouter()
+
+_NO_JOBS = "classification jobs are not configured"
+
+
+@router.post(
+    "/reclassify",
+    response_model=dto.ReclassifyResult,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def reclassify(
+    body: dto.ReclassifyRequest,
+    service: TicketService = Depends(get_ticket_service),
+):
+    """
+    Queue a fresh classification of every ticket matching the filter, e.g.
+    after a prompt change.  Priorities change as the job worker gets to
+    them; GET /admin/jobs shows the progress.
+    """
+    try:
+        queued = await service.reclassify_tickets(body.status, body.priority)
+    except TicketService.JobsUnavailableError:
+        raise HTTPException(status_code=503, detail=_NO_JOBS)
+    return dto.ReclassifyResult(queued=queued)
+
+
+@router.get("/jobs", response_model=dto.JobStatsRead)
+async def job_stats(service: TicketService = Depends(get_ticket_service)):
+    """Queue depth, dead letters and throughput of the classification jobs."""
+    try:
+        return dto.JobStatsRead(**await service.job_stats())
+    except TicketService.JobsUnavailableError:
+        raise HTTPException(status_code=503, detail=_NO_JOBS)
@@ -1,25 +1,157 @@
-from typing import List, Optional
+import dataclasses
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Literal, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 from app.api import schemas as dto
-from app.api.deps import get_ticket_service
+from app.api.bulk import (
+    BULK_CHUNK_SIZE,
+    BULK_OPENAPI,
+    BulkBodyError,
+    BulkTooLargeError,
+    iter_bulk_items,
+)
+from app.adapters.events import ChangeBus
+from app.api.deps import get_event_bus, get_ticket_service
+from app.api.events import SSE_HEADERS, SSE_MEDIA_TYPE, stream_events
+from app.api.export import (
+    EXPORT_BATCH_SIZE,
+    FORMATS,
+    ExportFormatUnavailable,
+    encode,
+)
+from app.api.etags import (
+    PreconditionFailed,
+    etag_for,
+    expected_version,
+    matches,
+)
+from app.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    InvalidCursorError,
+    decode_cursor,
+    decode_offset_cursor,
+    encode_cursor,
+    encode_offset_cursor,
+)
+from app.config import get_settings
 from app.core.service import TicketService
-from app.core.models import Priority, Status
+from app.core.models import Priority, Status, Ticket, TicketStats
+
+log = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def _ticket_list(tickets: List[Ticket], headers: Dict[str, str]) -> Response:
+    """
+    List[TicketRead] JSON written straight from the domain tickets: no
+    per-row model validation (the response_model stays for the OpenAPI
+    schema only).
+    """
+    return Response(
+        dto.dump_tickets(tickets),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
 # ---------------------------------------------------------------- create ----
 @router.post(
     "", response_model=dto.TicketRead, status_code=status.HTTP_201_CREATED
 )
 async def create_ticket(
     ticket_in: dto.TicketCreate,
+    response: Response,
     service: TicketService = Depends(get_ticket_service),
 ):
-    return await service.create_ticket(ticket_in.title, ticket_in.description)
+    ticket = await service.create_ticket(
+        ticket_in.title, ticket_in.description
+    )
+    response.headers["ETag"] = etag_for(ticket)
+    return ticket
+
+
+# ---------------------------------------------------------------- bulk ------
+@router.post(
+    "/bulk", response_model=dto.BulkCreateResult, openapi_extra=BULK_OPENAPI
+)
+async def create_tickets_bulk(
+    request: Request,
+    service: TicketService = Depends(get_ticket_service),
+):
+    """
+    Create many tickets at once from a JSON array or an NDJSON stream.
+    Items are validated one by one and written in chunks; the response
+    reports the outcome of every item by its position in the input.
+    """
+    results: List[dto.BulkItemResult] = []
+    chunk: List[Tuple[int, dto.TicketCreate]] = []
+
+    async def _flush() -> None:
+        try:
+            tickets = await service.create_tickets(
+                [(item.title, item.description) for _, item in chunk]
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            log.exception(
+                "Storing %d bulk-created ticket(s) failed", len(chunk)
+            )
+            results.extend(
+                dto.BulkItemResult(index=i, ok=False, error="storage error")
+                for i, _ in chunk
+            )
+        else:
+            results.extend(
+                dto.BulkItemResult(
+                    index=i, ok=True, id=t.id, priority=t.priority
+                )
+                for (i, _), t in zip(chunk, tickets)
+            )
+        chunk.clear()
+
+    try:
+        async for index, item in iter_bulk_items(request):
+            if isinstance(item, str):
+                results.append(
+                    dto.BulkItemResult(index=index, ok=False, error=item)
+                )
+                continue
+            chunk.append((index, item))
+            if len(chunk) >= BULK_CHUNK_SIZE:
+                await _flush()
+    except BulkTooLargeError as exc:
+        if chunk:
+            await _flush()  # the message promises the first items
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(exc),
+        )
+    except BulkBodyError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if chunk:
+        await _flush()
+
+    results.sort(key=lambda r: r.index)
+    created = sum(r.ok for r in results)
+    return dto.BulkCreateResult(
+        created=created, failed=len(results) - created, items=results
+    )
 
 
 # ---------------------------------------------------------------- list ------
@@ -27,49 +159,249 @@ async def create_ticket(
 async def list_tickets(
     status_filter: Optional[Status] = None,
     priority_filter: Optional[Priority] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     service: TicketService = Depends(get_ticket_service),
 ):
-    return await service.list_tickets(
-        status=status_filter, priority=priority_filter
+    """
+    Newest tickets first.  When more rows exist, the opaque cursor for the
+    next page is returned in the `X-Next-Cursor` response header.
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # fetch one extra row to know whether another page exists
+    tickets = await service.list_tickets(
+        status=status_filter,
+        priority=priority_filter,
+        limit=limit + 1,
+        after=after,
+    )
+    headers = {}
+    if len(tickets) > limit:
+        tickets = tickets[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(tickets[-1])
+    return _ticket_list(tickets, headers)
+
+
+# ---------------------------------------------------------------- stats -----
+@router.get("/stats", response_model=dto.TicketStatsRead)
+async def ticket_stats(
+    days: int = Query(30, ge=1, le=366),
+    service: TicketService = Depends(get_ticket_service),
+):
+    """
+    Counts by status × priority plus created/closed per day for the last
+    `days` UTC days.  Served from counters kept up to date on every write.
+    """
+    stats = await service.get_stats()
+    today = datetime.now(timezone.utc).date()
+    window = [today - timedelta(days=n) for n in range(days - 1, -1, -1)]
+    return dto.TicketStatsRead(
+        total=sum(stats.counts.values()),
+        by_status={s: _total(stats, status=s) for s in Status},
+        by_priority={p: _total(stats, priority=p) for p in Priority},
+        by_status_priority={
+            s: {p: stats.counts.get((s, p), 0) for p in Priority}
+            for s in Status
+        },
+        created_per_day=_histogram(stats.created_per_day, window),
+        closed_per_day=_histogram(stats.closed_per_day, window),
+    )
+
+
+def _total(stats: TicketStats, status=None, priority=None) -> int:
+    return sum(
+        n
+        for (s, p), n in stats.counts.items()
+        if status in (None, s) and priority in (None, p)
+    )
+
+
+def _histogram(
+    per_day: Dict[date, int], window: List[date]
+) -> List[dto.DayCount]:
+    return [dto.DayCount(day=d, count=per_day.get(d, 0)) for d in window]
+
+
+# ---------------------------------------------------------------- search ----
+@router.get("/search", response_model=List[dto.TicketRead])
+async def search_tickets(
+    q: str = Query(..., min_length=1, max_length=255),
+    status_filter: Optional[Status] = None,
+    priority_filter: Optional[Priority] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    service: TicketService = Depends(get_ticket_service),
+):
+    """
+    Full-text search over title and description, best match first.  All
+    words must occur; `word*` matches as a prefix.  Paged like the list:
+    follow the `X-Next-Cursor` header.
+    """
+    try:
+        offset = decode_offset_cursor(cursor) if cursor else 0
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    tickets = await service.search_tickets(
+        q,
+        status=status_filter,
+        priority=priority_filter,
+        limit=limit + 1,
+        offset=offset,
+    )
+    headers = {}
+    if len(tickets) > limit:
+        tickets = tickets[:limit]
+        headers[NEXT_CURSOR_HEADER] = encode_offset_cursor(offset + limit)
+    return _ticket_list(tickets, headers)
+
+
+# ---------------------------------------------------------------- export ----
+@router.get("/export", response_class=StreamingResponse)
+async def export_tickets(
+    status_filter: Optional[Status] = None,
+    priority_filter: Optional[Priority] = None,
+    fmt: Literal["ndjson", "csv", "parquet"] = Query("ndjson", alias="format"),
+    service: TicketService = Depends(get_ticket_service),
+):
+    """
+    Every matching ticket, newest first, streamed in batches straight from
+    the database cursor: memory use does not grow with the table.
+    """
+    _, media_type, ext = FORMATS[fmt]
+    batches = service.export_tickets(
+        status=status_filter,
+        priority=priority_filter,
+        batch_size=EXPORT_BATCH_SIZE,
+    )
+    try:
+        chunks = encode(fmt, batches)
+    except ExportFormatUnavailable as exc:
+        raise HTTPException(status_code=501, detail=str(exc))
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="tickets.{ext}"'
+        },
+    )
+
+
+# ---------------------------------------------------------------- events ----
+@router.get("/events", response_class=StreamingResponse)
+async def ticket_events(
+    request: Request,
+    once: bool = False,
+    last_event_id: Optional[str] = Header(None),
+    bus: ChangeBus = Depends(get_event_bus),
+):
+    """
+    Server-sent stream of created/updated/deleted tickets.  Reconnect with
+    `Last-Event-ID` to resume; a `reset` event means "re-fetch the list".
+    `once=true` returns the backlog and closes (for polling clients).
+    """
+    frames = stream_events(
+        bus,
+        last_event_id,
+        once=once,
+        heartbeat_s=get_settings().events_heartbeat_s,
+        is_disconnected=request.is_disconnected,
+    )
+    return StreamingResponse(
+        frames, media_type=SSE_MEDIA_TYPE, headers=SSE_HEADERS
     )
 
 
 # ---------------------------------------------------------------- get -------
 @router.get("/{ticket_id}", response_model=dto.TicketRead)
 async def get_ticket(
-    ticket_id: UUID, service: TicketService = Depends(get_ticket_service)
+    ticket_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    service: TicketService = Depends(get_ticket_service),
 ):
     ticket = await service.get_ticket(ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
+    if matches(if_none_match, ticket):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag_for(ticket)},
+        )
+    response.headers["ETag"] = etag_for(ticket)
     return ticket
 
 
+@router.get("/{ticket_id}/similar", response_model=List[dto.SimilarTicketRead])
+async def similar_tickets(
+    ticket_id: UUID,
+    limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    service: TicketService = Depends(get_ticket_service),
+):
+    """
+    Tickets whose title and description are closest to this one's, most
+    similar first.  Only the recent tickets held by the near-duplicate
+    index are searched (none when SIMILARITY_INDEX_SIZE=0).
+    """
+    try:
+        similar = await service.similar_tickets(ticket_id, limit=limit)
+    except TicketService.NotFoundError:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    return [
+        {**dataclasses.asdict(ticket), "similarity": score}
+        for ticket, score in similar
+    ]
+
+
 # ---------------------------------------------------------------- patch -----
 @router.patch("/{ticket_id}", response_model=dto.TicketRead)
 async def update_ticket(
     ticket_id: UUID,
     ticket_in: dto.TicketUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     service: TicketService = Depends(get_ticket_service),
 ):
+    """Send `If-Match: <ETag>` to update only if nobody changed it since."""
     try:
-        return await service.update_ticket(
+        ticket = await service.update_ticket(
             ticket_id,
             title=ticket_in.title,
             description=ticket_in.description,
             status=ticket_in.status,
+            expected_version=expected_version(if_match),
         )
     except TicketService.NotFoundError:
         raise HTTPException(status_code=404, detail="Ticket not found")
+    except (TicketService.VersionConflictError, PreconditionFailed):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Ticket was modified; re-fetch and retry",
+        )
+    response.headers["ETag"] = etag_for(ticket)
+    return ticket
 
 
 # ---------------------------------------------------------------- delete ----
 @router.delete("/{ticket_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_ticket(
-    ticket_id: UUID, service: TicketService = Depends(get_ticket_service)
+    ticket_id: UUID,
+    if_match: Optional[str] = Header(None),
+    service: TicketService = Depends(get_ticket_service),
 ):
     try:
-        await service.delete_ticket(ticket_id)
+        await service.delete_ticket(
+            ticket_id, expected_version=expected_version(if_match)
+        )
     except TicketService.NotFoundError:
         raise HTTPException(status_code=404, detail="Ticket not found")
+    except (TicketService.VersionConflictError, PreconditionFailed):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Ticket was modified; re-fetch and retry",
+        )
     return None
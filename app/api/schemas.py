@@ -1,10 +1,11 @@
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
 
+import orjson
 from pydantic import BaseModel, Field, ConfigDict
-from app.core.models import Priority, Status
+from app.core.models import Priority, Status, Ticket
 
 
 class TicketCreate(BaseModel):
@@ -31,8 +32,78 @@ class TicketRead(BaseModel):
     status: Status
     created_at: datetime
     updated_at: datetime
+    version: int
+    closed_at: Optional[datetime] = None
 
     # class Config:
     #     orm_mode = True
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class SimilarTicketRead(TicketRead):
+    # cosine similarity of the texts, 1.0 = same words
+    similarity: float
+
+
+def dump_tickets(tickets: Sequence[Ticket]) -> bytes:
+    """
+    Same JSON as List[TicketRead], serialised by orjson directly from the
+    Ticket dataclasses (identical field names and order).  UTC times end
+    in "Z" like pydantic's.
+    """
+    return orjson.dumps(tickets, option=orjson.OPT_UTC_Z)
+
+
+class BulkItemResult(BaseModel):
+    # position in the submitted array / NDJSON line number (0-based)
+    index: int
+    ok: bool
+    id: Optional[UUID] = None
+    priority: Optional[Priority] = None
+    error: Optional[str] = None
+
+
+class BulkCreateResult(BaseModel):
+    created: int
+    failed: int
+    items: List[BulkItemResult]
+
+
+class DayCount(BaseModel):
+    day: date
+    count: int
+
+
+class TicketStatsRead(BaseModel):
+    total: int
+    by_status: Dict[Status, int]
+    by_priority: Dict[Priority, int]
+    by_status_priority: Dict[Status, Dict[Priority, int]]
+    # oldest day first, zero-filled, UTC days
+    created_per_day: List[DayCount]
+    closed_per_day: List[DayCount]
+
+
+class ReclassifyRequest(BaseModel):
+    # both empty → every ticket
+    status: Optional[Status] = None
+    priority: Optional[Priority] = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ReclassifyResult(BaseModel):
+    # new jobs; tickets that already had one pending are not counted
+    queued: int
+
+
+class JobStatsRead(BaseModel):
+    queued: int
+    leased: int
+    done: int  # finished within CLASSIFY_JOB_RETENTION_S
+    dead: int
+    # how long the oldest due job has been waiting
+    oldest_due_age_s: float
+    # jobs finished per second over the last minute
+    done_per_s: float
@@ -0,0 +1,276 @@
+"""
+Runtime configuration read from environment variables (docker-compose /.env).
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    return int(raw) if raw not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw in (None, ""):
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    return float(raw) if raw not in (None, "") else default
+
+
+@dataclass(frozen=True)
+class Settings:
+    # docker-compose already exports DATABASE_URL
+    database_url: str = "sqlite+aiosqlite:///./data/tickets.db"
+    # SQLite pragmas applied on every new connection
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size: int = -65536  # negative → KiB, i.e. 64 MiB per conn
+    sqlite_mmap_size: int = 268_435_456  # 256 MiB
+    sqlite_temp_store: str = "MEMORY"
+    # connection pool (ignored for in-memory databases)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_s: float = 30.0
+
+    # "sync": POST /tickets waits for the classifier (original behaviour)
+    # "background": store as TBD, classify later in the worker pool
+    # "queue": store as TBD plus a durable job, classified by the separate
+    #          `python -m app.workers.classify` process
+    classify_mode: str = "sync"
+    classify_workers: int = 4
+    classify_queue_size: int = 1000
+    classify_drain_timeout_s: float = 30.0
+    # durable jobs (app/adapters/repos/job_queue.py): "queue" mode and
+    # POST /admin/reclassify.  A job is leased by one worker at a time and
+    # dead-lettered after max_attempts; retries back off exponentially.
+    classify_job_batch_size: int = 32
+    classify_job_concurrency: int = 8
+    classify_job_lease_s: float = 60.0
+    classify_job_max_attempts: int = 5
+    classify_job_backoff_s: float = 2.0
+    classify_job_backoff_max_s: float = 300.0
+    classify_job_retention_s: float = 86400.0
+    # auto | langgraph | fake | tbd (see app/adapters/llm/factory.py)
+    classifier: str = "auto"
+    llm_model: str = "gpt-4.1"
+    # build the LLM classifier in the background at startup instead of on
+    # the first ticket
+    classifier_warmup: bool = True
+    # LLM micro-batching; a batch size of 1 disables it
+    llm_batch_max_size: int = 1
+    llm_batch_max_wait_ms: float = 20.0
+    # guards around the classifier (app/adapters/llm/resilient.py); 0
+    # disables the deadline / the cap / the breaker / hedging
+    classify_timeout_s: float = 10.0
+    classify_max_concurrency: int = 16
+    classify_breaker_failures: int = 5
+    classify_breaker_reset_s: float = 30.0
+    classify_hedge_after_s: float = 0.0
+    # what a ticket gets when the classifier has no answer: tbd | fake
+    classify_fallback: str = "tbd"
+    # keyword rules of the fake classifier and the local pre-classifier;
+    # empty → built-in rules.  The file is re-read when it changes.
+    classify_rules_path: str = ""
+    classify_rules_reload_s: float = 5.0
+    # local pre-classifier in front of the LLM (app/adapters/llm/tiered.py):
+    # keyword rules plus an optional trained model file; tickets below the
+    # confidence go to the LLM, audit_rate of the others are double-checked
+    classify_local: bool = False
+    classify_local_min_confidence: float = 0.9
+    classify_local_model: str = ""
+    classify_local_audit_rate: float = 0.0
+    # content-addressed classification cache; 0 entries disables it
+    classify_cache_size: int = 10_000
+    classify_cache_ttl_s: float = 3600.0
+    classify_cache_persist: bool = False
+    # near-duplicate index (app/adapters/similarity.py); 0 entries disables
+    # it (opt-in).  A new ticket this similar to one classified within the
+    # window reuses its priority instead of calling the classifier.
+    similarity_index_size: int = 0
+    similarity_reuse_threshold: float = 0.8
+    similarity_reuse_window_s: float = 3600.0
+    # read-through cache for GET /tickets/{id}; 0 entries disables it
+    repo_cache_size: int = 0
+    repo_cache_ttl_s: float = 30.0
+    repo_cache_negative_ttl_s: float = 2.0
+    # request/adapter instrumentation exposed on GET /metrics
+    metrics_enabled: bool = True
+    # GET /tickets/stats counters are re-checked against the table this
+    # often; 0 disables the periodic reconcile
+    stats_reconcile_s: float = 300.0
+    # GET /tickets/events: replayable history and keep-alive interval
+    events_buffer_size: int = 1024
+    events_heartbeat_s: float = 15.0
+    # worker processes; uvicorn reads the same WEB_CONCURRENCY variable
+    web_concurrency: int = 1
+    # replay the other workers' writes into this one's caches, counters,
+    # index and change stream (app/adapters/repos/change_feed.py); on by
+    # default with more than one worker, and in "queue" mode (the job
+    # worker is another process)
+    cross_process_sync: bool = False
+    cross_process_poll_s: float = 0.2
+    change_log_retention_s: float = 3600.0
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        workers = _env_int("WEB_CONCURRENCY", cls.web_concurrency)
+        classify_mode = os.getenv("CLASSIFY_MODE", cls.classify_mode).lower()
+        return cls(
+            database_url=os.getenv("DATABASE_URL", cls.database_url),
+            sqlite_journal_mode=os.getenv(
+                "SQLITE_JOURNAL_MODE", cls.sqlite_journal_mode
+            ).upper(),
+            sqlite_synchronous=os.getenv(
+                "SQLITE_SYNCHRONOUS", cls.sqlite_synchronous
+            ).upper(),
+            sqlite_busy_timeout_ms=_env_int(
+                "SQLITE_BUSY_TIMEOUT_MS", cls.sqlite_busy_timeout_ms
+            ),
+            sqlite_cache_size=_env_int(
+                "SQLITE_CACHE_SIZE", cls.sqlite_cache_size
+            ),
+            sqlite_mmap_size=_env_int(
+                "SQLITE_MMAP_SIZE", cls.sqlite_mmap_size
+            ),
+            sqlite_temp_store=os.getenv(
+                "SQLITE_TEMP_STORE", cls.sqlite_temp_store
+            ).upper(),
+            db_pool_size=_env_int("DB_POOL_SIZE", cls.db_pool_size),
+            db_max_overflow=_env_int("DB_MAX_OVERFLOW", cls.db_max_overflow),
+            db_pool_timeout_s=_env_float(
+                "DB_POOL_TIMEOUT_S", cls.db_pool_timeout_s
+            ),
+            classify_mode=classify_mode,
+            classify_workers=_env_int("CLASSIFY_WORKERS", cls.classify_workers),
+            classify_queue_size=_env_int(
+                "CLASSIFY_QUEUE_SIZE", cls.classify_queue_size
+            ),
+            classify_drain_timeout_s=_env_float(
+                "CLASSIFY_DRAIN_TIMEOUT_S", cls.classify_drain_timeout_s
+            ),
+            classify_job_batch_size=_env_int(
+                "CLASSIFY_JOB_BATCH_SIZE", cls.classify_job_batch_size
+            ),
+            classify_job_concurrency=_env_int(
+                "CLASSIFY_JOB_CONCURRENCY", cls.classify_job_concurrency
+            ),
+            classify_job_lease_s=_env_float(
+                "CLASSIFY_JOB_LEASE_S", cls.classify_job_lease_s
+            ),
+            classify_job_max_attempts=_env_int(
+                "CLASSIFY_JOB_MAX_ATTEMPTS", cls.classify_job_max_attempts
+            ),
+            classify_job_backoff_s=_env_float(
+                "CLASSIFY_JOB_BACKOFF_S", cls.classify_job_backoff_s
+            ),
+            classify_job_backoff_max_s=_env_float(
+                "CLASSIFY_JOB_BACKOFF_MAX_S", cls.classify_job_backoff_max_s
+            ),
+            classify_job_retention_s=_env_float(
+                "CLASSIFY_JOB_RETENTION_S", cls.classify_job_retention_s
+            ),
+            classifier=os.getenv("CLASSIFIER", cls.classifier).lower(),
+            llm_model=os.getenv("LLM_MODEL", cls.llm_model),
+            classifier_warmup=_env_bool(
+                "CLASSIFIER_WARMUP", cls.classifier_warmup
+            ),
+            llm_batch_max_size=_env_int(
+                "LLM_BATCH_MAX_SIZE", cls.llm_batch_max_size
+            ),
+            llm_batch_max_wait_ms=_env_float(
+                "LLM_BATCH_MAX_WAIT_MS", cls.llm_batch_max_wait_ms
+            ),
+            classify_timeout_s=_env_float(
+                "CLASSIFY_TIMEOUT_S", cls.classify_timeout_s
+            ),
+            classify_max_concurrency=_env_int(
+                "CLASSIFY_MAX_CONCURRENCY", cls.classify_max_concurrency
+            ),
+            classify_breaker_failures=_env_int(
+                "CLASSIFY_BREAKER_FAILURES", cls.classify_breaker_failures
+            ),
+            classify_breaker_reset_s=_env_float(
+                "CLASSIFY_BREAKER_RESET_S", cls.classify_breaker_reset_s
+            ),
+            classify_hedge_after_s=_env_float(
+                "CLASSIFY_HEDGE_AFTER_S", cls.classify_hedge_after_s
+            ),
+            classify_fallback=os.getenv(
+                "CLASSIFY_FALLBACK", cls.classify_fallback
+            ).lower(),
+            classify_rules_path=os.getenv(
+                "CLASSIFY_RULES_PATH", cls.classify_rules_path
+            ),
+            classify_rules_reload_s=_env_float(
+                "CLASSIFY_RULES_RELOAD_S", cls.classify_rules_reload_s
+            ),
+            classify_local=_env_bool("CLASSIFY_LOCAL", cls.classify_local),
+            classify_local_min_confidence=_env_float(
+                "CLASSIFY_LOCAL_MIN_CONFIDENCE",
+                cls.classify_local_min_confidence,
+            ),
+            classify_local_model=os.getenv(
+                "CLASSIFY_LOCAL_MODEL", cls.classify_local_model
+            ),
+            classify_local_audit_rate=_env_float(
+                "CLASSIFY_LOCAL_AUDIT_RATE", cls.classify_local_audit_rate
+            ),
+            classify_cache_size=_env_int(
+                "CLASSIFY_CACHE_SIZE", cls.classify_cache_size
+            ),
+            classify_cache_ttl_s=_env_float(
+                "CLASSIFY_CACHE_TTL_S", cls.classify_cache_ttl_s
+            ),
+            classify_cache_persist=_env_bool(
+                "CLASSIFY_CACHE_PERSIST", cls.classify_cache_persist
+            ),
+            similarity_index_size=_env_int(
+                "SIMILARITY_INDEX_SIZE", cls.similarity_index_size
+            ),
+            similarity_reuse_threshold=_env_float(
+                "SIMILARITY_REUSE_THRESHOLD", cls.similarity_reuse_threshold
+            ),
+            similarity_reuse_window_s=_env_float(
+                "SIMILARITY_REUSE_WINDOW_S", cls.similarity_reuse_window_s
+            ),
+            repo_cache_size=_env_int("REPO_CACHE_SIZE", cls.repo_cache_size),
+            repo_cache_ttl_s=_env_float(
+                "REPO_CACHE_TTL_S", cls.repo_cache_ttl_s
+            ),
+            repo_cache_negative_ttl_s=_env_float(
+                "REPO_CACHE_NEGATIVE_TTL_S", cls.repo_cache_negative_ttl_s
+            ),
+            metrics_enabled=_env_bool("METRICS_ENABLED", cls.metrics_enabled),
+            stats_reconcile_s=_env_float(
+                "STATS_RECONCILE_S", cls.stats_reconcile_s
+            ),
+            events_buffer_size=_env_int(
+                "EVENTS_BUFFER_SIZE", cls.events_buffer_size
+            ),
+            events_heartbeat_s=_env_float(
+                "EVENTS_HEARTBEAT_S", cls.events_heartbeat_s
+            ),
+            web_concurrency=workers,
+            cross_process_sync=_env_bool(
+                "CROSS_PROCESS_SYNC", workers > 1 or classify_mode == "queue"
+            ),
+            cross_process_poll_s=_env_float(
+                "CROSS_PROCESS_POLL_S", cls.cross_process_poll_s
+            ),
+            change_log_retention_s=_env_float(
+                "CHANGE_LOG_RETENTION_S", cls.change_log_retention_s
+            ),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings.from_env()
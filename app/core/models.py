@@ -1,7 +1,8 @@
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from enum import Enum
+from typing import Dict, Optional, Tuple
 
 
 class Priority(str, Enum):
@@ -17,7 +18,8 @@ class Status(str, Enum):
     CLOSED = "CLOSED"
 
 
-@dataclass
+# slots: no per-instance __dict__; list pages and caches hold many of these
+@dataclass(slots=True)
 class Ticket:
     id: uuid.UUID = field(default_factory=uuid.uuid4)
     title: str = ""
@@ -34,3 +36,35 @@ class Ticket:
             microsecond=0
         )
     )
+    # bumped by every write; exposed to clients as the ETag
+    version: int = 1
+    # set when the status becomes CLOSED, cleared when it is reopened
+    closed_at: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Keyset position: the (created_at, id) of the last ticket already seen."""
+
+    created_at: datetime
+    id: uuid.UUID
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """One entry of the change stream; `seq` increases with every event."""
+
+    seq: int
+    kind: str  # "created" | "updated" | "deleted"
+    ticket: Ticket
+    # the writing process, for entries of the cross-process change log
+    origin: Optional[str] = None
+
+
+@dataclass
+class TicketStats:
+    """Aggregate counts; per-day buckets are UTC dates, zero entries omitted."""
+
+    counts: Dict[Tuple[Status, Priority], int] = field(default_factory=dict)
+    created_per_day: Dict[date, int] = field(default_factory=dict)
+    closed_per_day: Dict[date, int] = field(default_factory=dict)
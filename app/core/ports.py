@@ -1,20 +1,162 @@
-from typing import List, Optional, Protocol
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
 from uuid import UUID
 
-from app.core.models import Priority, Status, Ticket
+from app.core.models import (
+    PageCursor,
+    Priority,
+    Status,
+    Ticket,
+    TicketStats,
+)
 
 
 class TicketRepositoryPort(Protocol):
     async def add(self, ticket: Ticket) -> None: ...
+    async def add_many(self, tickets: Sequence[Ticket]) -> None:
+        """Insert many tickets, batching the writes (one transaction per chunk)."""
+        ...
+
     async def get(self, ticket_id: UUID) -> Optional[Ticket]: ...
     async def list(
         self,
         status: Optional[Status] = None,
         priority: Optional[Priority] = None,
-    ) -> List[Ticket]: ...
-    async def update(self, ticket: Ticket) -> None: ...
-    async def delete(self, ticket_id: UUID) -> None: ...
+        *,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Ticket]:
+        """
+        Newest first, ordered by (created_at, id) DESC.  `after` resumes
+        strictly below the given cursor; `limit=None` means no bound.
+        """
+        ...
+
+    def iter_batches(
+        self,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[Ticket]]:
+        """
+        Every matching ticket in `list` order, `batch_size` at a time, for
+        exports: only one batch is held in memory at once.
+        """
+        ...
+
+    async def search(
+        self,
+        query: str,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Ticket]:
+        """
+        Tickets whose title/description contain every word of `query`
+        (`word*` also matches as a prefix), best BM25 match first; title
+        hits rank above description hits.
+        """
+        ...
+
+    async def aggregate(self) -> TicketStats:
+        """Counts recomputed from the stored tickets (a full scan)."""
+        ...
+
+    async def update(self, ticket: Ticket) -> None:
+        """Full overwrite; bumps `ticket.version`."""
+        ...
+
+    async def update_fields(
+        self,
+        ticket_id: UUID,
+        changes: Mapping[str, Any],
+        *,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Ticket]:
+        """
+        Write only `changes` (title/description/priority/status/updated_at)
+        and bump the version, atomically.  Returns the updated ticket, or
+        None when the id does not exist or its version != expected_version.
+        """
+        ...
+
+    async def delete(
+        self, ticket_id: UUID, *, expected_version: Optional[int] = None
+    ) -> Optional[Ticket]:
+        """Returns the deleted ticket; None as for update_fields."""
+        ...
 
 
 class PriorityClassifierPort(Protocol):
     async def classify(self, title: str, description: str) -> Priority: ...
+
+
+class ChangeBusPort(Protocol):
+    """Fan-out of ticket changes to live subscribers (GET /tickets/events)."""
+
+    def publish(self, kind: str, ticket: Ticket) -> None:
+        """Must not block: a slow subscriber can never stall a write."""
+        ...
+
+    def reset(self) -> None:
+        """Changes were missed: subscribers must re-fetch, not replay."""
+        ...
+
+
+class ClassificationQueuePort(Protocol):
+    """Deferred classification: the ticket is already stored as TBD."""
+
+    async def enqueue(self, ticket_id: UUID) -> None: ...
+
+
+class ClassificationJobsPort(ClassificationQueuePort, Protocol):
+    """Durable classification jobs, run by `python -m app.workers.classify`."""
+
+    async def enqueue_many(
+        self, ticket_ids: Iterable[UUID], *, kind: str = "classify"
+    ) -> int:
+        """
+        Queue "classify" or "reclassify" jobs; returns how many were new
+        (a ticket has at most one job pending).
+        """
+        ...
+
+    async def stats(self) -> dict: ...
+
+
+class SimilarityIndexPort(Protocol):
+    """Nearest neighbours by ticket text, fed by the service's writes."""
+
+    def upsert(self, ticket: Ticket) -> None: ...
+    def remove(self, ticket_id: UUID) -> None: ...
+    def nearest(
+        self,
+        title: str,
+        description: str,
+        *,
+        limit: int = 10,
+        exclude: Optional[UUID] = None,
+    ) -> List[Tuple[UUID, float]]:
+        """(ticket id, similarity in [0, 1]), most similar first."""
+        ...
+
+    def reusable_priority(
+        self, title: str, description: str
+    ) -> Optional[Priority]:
+        """
+        The priority of a recently classified near-duplicate of this text,
+        or None when the classifier has to be asked.
+        """
+        ...
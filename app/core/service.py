@@ -1,35 +1,199 @@
+import asyncio
+import logging
 from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
-from app.core.models import Status, Ticket
-from app.core.ports import PriorityClassifierPort, TicketRepositoryPort
+from app.core.models import ChangeEvent, PageCursor, Priority, Status
+from app.core.models import Ticket
+from app.core.models import TicketStats
+from app.core.ports import (
+    ChangeBusPort,
+    ClassificationJobsPort,
+    ClassificationQueuePort,
+    PriorityClassifierPort,
+    SimilarityIndexPort,
+    TicketRepositoryPort,
+)
+from app.core.stats import TicketCounters
+
+log = logging.getLogger(__name__)
+
+REQUEUE_PAGE_SIZE = 500
+# a background classification restarts if the ticket changed meanwhile
+CLASSIFY_ATTEMPTS = 3
+# concurrent classifier calls during a bulk create (feeds the micro-batcher)
+BULK_CLASSIFY_CONCURRENCY = 16
+# a status change re-reads and retries if the ticket changed meanwhile
+STATUS_CHANGE_ATTEMPTS = 3
+# tickets read per page when the similarity index is rebuilt at startup
+SIMILARITY_REBUILD_PAGE_SIZE = 1000
+# tickets read per page when queueing a bulk reclassification
+RECLASSIFY_PAGE_SIZE = 1000
+
+# deferred bulk enqueues must outlive the request that spawned them
+_background_tasks: Set[asyncio.Task] = set()
 
 
 class TicketService:
     class NotFoundError(Exception):
         """Raised when a ticket is not found."""
 
+    class VersionConflictError(Exception):
+        """Raised when a conditional write targets an outdated version."""
+
+    class ClassifierUnavailableError(Exception):
+        """Raised when a reclassification got no answer (TBD)."""
+
+    class JobsUnavailableError(Exception):
+        """Raised when durable jobs are asked for but not configured."""
+
     def __init__(
         self,
         repository: TicketRepositoryPort,
         classifier: PriorityClassifierPort,
+        classification_queue: Optional[ClassificationQueuePort] = None,
+        change_bus: Optional[ChangeBusPort] = None,
+        counters: Optional[TicketCounters] = None,
+        similarity_index: Optional[SimilarityIndexPort] = None,
+        jobs: Optional[ClassificationJobsPort] = None,
     ) -> None:
         self._repo = repository
         self._classifier = classifier
+        # None → classify inline; otherwise store as TBD and defer
+        self._queue = classification_queue
+        self._bus = change_bus
+        # None → GET /tickets/stats aggregates the table on every call
+        self._counters = counters
+        # None → no near-duplicate reuse, GET /tickets/{id}/similar is empty
+        self._similar = similarity_index
+        # ids deleted while rebuild_similarity_index pages through the table
+        self._deleted_during_rebuild: Optional[Set[UUID]] = None
+        # None → no bulk reclassification (POST /admin/reclassify)
+        self._jobs = jobs
 
     # ----------------------------- use-cases --------------------------------
     async def create_ticket(self, title: str, description: str) -> Ticket:
-        priority = await self._classifier.classify(title, description)
+        if self._queue is not None:
+            ticket = Ticket(
+                title=title,
+                description=description,
+                priority=self._reused_priority(title, description),
+            )
+            await self._repo.add(ticket)
+            self._created(ticket)
+            if ticket.priority == Priority.TBD:
+                await self._queue.enqueue(ticket.id)
+            return ticket
+
+        priority = await self._prioritise(title, description)
         ticket = Ticket(title=title, description=description, priority=priority)
         await self._repo.add(ticket)
+        self._created(ticket)
         return ticket
 
-    async def list_tickets(self, status=None, priority=None):
-        return await self._repo.list(status=status, priority=priority)
+    async def create_tickets(
+        self, items: Sequence[Tuple[str, str]]
+    ) -> List[Ticket]:
+        """
+        Bulk create from (title, description) pairs with ONE repository write.
+        In background mode tickets are stored as TBD and handed to the queue
+        without holding up the caller; otherwise they are classified
+        concurrently (bounded) before the write.
+        """
+        if self._queue is not None:
+            tickets = [
+                Ticket(
+                    title=t,
+                    description=d,
+                    priority=self._reused_priority(t, d),
+                )
+                for t, d in items
+            ]
+            await self._repo.add_many(tickets)
+            self._created_all(tickets)
+            task = asyncio.create_task(
+                self._enqueue_all(
+                    [t.id for t in tickets if t.priority == Priority.TBD]
+                )
+            )
+            _background_tasks.add(task)
+            task.add_done_callback(_background_task_done)
+            return tickets
+
+        gate = asyncio.Semaphore(BULK_CLASSIFY_CONCURRENCY)
+
+        async def _classify(title: str, description: str) -> Ticket:
+            async with gate:
+                priority = await self._prioritise(title, description)
+            return Ticket(
+                title=title, description=description, priority=priority
+            )
+
+        tickets = list(await asyncio.gather(*(_classify(*i) for i in items)))
+        await self._repo.add_many(tickets)
+        self._created_all(tickets)
+        return tickets
+
+    async def list_tickets(
+        self,
+        status=None,
+        priority=None,
+        *,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ):
+        return await self._repo.list(
+            status=status, priority=priority, limit=limit, after=after
+        )
+
+    async def search_tickets(
+        self,
+        query: str,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Ticket]:
+        return await self._repo.search(
+            query, status, priority, limit=limit, offset=offset
+        )
+
+    def export_tickets(
+        self,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[Ticket]]:
+        """Every matching ticket, newest first, one batch at a time."""
+        return self._repo.iter_batches(
+            status=status, priority=priority, batch_size=batch_size
+        )
 
     async def get_ticket(self, ticket_id: UUID):
         return await self._repo.get(ticket_id)
 
+    async def similar_tickets(
+        self, ticket_id: UUID, *, limit: int = 10
+    ) -> List[Tuple[Ticket, float]]:
+        """The indexed tickets whose text is closest to this one's."""
+        ticket = await self._repo.get(ticket_id)
+        if ticket is None:
+            raise TicketService.NotFoundError()
+        if self._similar is None:
+            return []
+        neighbours = self._similar.nearest(
+            ticket.title, ticket.description, limit=limit, exclude=ticket_id
+        )
+        similar = []
+        for neighbour_id, score in neighbours:
+            neighbour = await self._repo.get(neighbour_id)
+            if neighbour is not None:  # deleted elsewhere
+                similar.append((neighbour, score))
+        return similar
+
     async def update_ticket(
         self,
         ticket_id: UUID,
@@ -37,21 +201,357 @@ class TicketService:
         title: str | None = None,
         description: str | None = None,
         status: Status | None = None,
+        expected_version: int | None = None,
     ) -> Ticket:
-        ticket = await self._repo.get(ticket_id)
-        if not ticket:
-            raise TicketService.NotFoundError()
-        if title is not None:
-            ticket.title = title
-        if description is not None:
-            ticket.description = description
+        changes = {
+            k: v
+            for k, v in (
+                ("title", title),
+                ("description", description),
+                ("status", status),
+            )
+            if v is not None
+        }
+        changes["updated_at"] = _now()
         if status is not None:
-            ticket.status = status
-        ticket.updated_at = datetime.now(timezone.utc).replace(microsecond=0)
-        await self._repo.update(ticket)
+            ticket = await self._change_status(
+                ticket_id, changes, expected_version
+            )
+        else:
+            ticket = await self._repo.update_fields(
+                ticket_id, changes, expected_version=expected_version
+            )
+            if ticket is None:
+                await self._raise_write_failure(ticket_id, expected_version)
+        self._publish("updated", ticket)
+        self._index(ticket)
         return ticket
 
-    async def delete_ticket(self, ticket_id: UUID) -> None:
-        if not await self._repo.get(ticket_id):
+    async def _change_status(
+        self, ticket_id: UUID, changes: dict, expected_version: int | None
+    ) -> Ticket:
+        """
+        closed_at and the stats depend on the previous status, so this is
+        a read followed by a write conditional on the version just read.
+        """
+        for _ in range(STATUS_CHANGE_ATTEMPTS):
+            before = await self._repo.get(ticket_id)
+            if before is None:
+                raise TicketService.NotFoundError()
+            if expected_version not in (None, before.version):
+                raise TicketService.VersionConflictError()
+            changes["closed_at"] = _closed_at(
+                before, changes["status"], changes["updated_at"]
+            )
+            ticket = await self._repo.update_fields(
+                ticket_id, changes, expected_version=before.version
+            )
+            if ticket is not None:
+                self._count(before, ticket)
+                return ticket
+        if expected_version is not None:
+            raise TicketService.VersionConflictError()
+        # lost every race: write anyway, the counters get rebuilt
+        ticket = await self._repo.update_fields(ticket_id, changes)
+        if ticket is None:
             raise TicketService.NotFoundError()
-        await self._repo.delete(ticket_id)
+        self._invalidate_counters()
+        return ticket
+
+    async def delete_ticket(
+        self, ticket_id: UUID, *, expected_version: int | None = None
+    ) -> Ticket:
+        ticket = await self._repo.delete(
+            ticket_id, expected_version=expected_version
+        )
+        if ticket is None:
+            await self._raise_write_failure(ticket_id, expected_version)
+        self._count(ticket, None)
+        self._publish("deleted", ticket)
+        self._unindex(ticket.id)
+        return ticket
+
+    async def _raise_write_failure(
+        self, ticket_id: UUID, expected_version: int | None
+    ):
+        """A conditional write matched nothing: missing id or stale version?"""
+        if expected_version is not None and await self._repo.get(ticket_id):
+            raise TicketService.VersionConflictError()
+        raise TicketService.NotFoundError()
+
+    # ----------------------------- statistics -------------------------------
+    async def get_stats(self) -> TicketStats:
+        if self._counters is None:
+            return await self._repo.aggregate()
+        if not self._counters.ready:
+            await self.reconcile_stats()
+        return self._counters.snapshot() or await self._repo.aggregate()
+
+    async def reconcile_stats(self) -> bool:
+        """
+        Reload the counters from the table.  Returns True when they had
+        drifted (writes from elsewhere, or a delta that wasn't known).
+        """
+        if self._counters is None:
+            return False
+        stable = False
+        for _ in range(2):
+            generation = self._counters.generation
+            fresh = await self._repo.aggregate()
+            # a write landed while aggregating: it may be in `fresh` or not
+            stable = generation == self._counters.generation
+            if stable:
+                break
+        drifted = (
+            stable
+            and self._counters.ready
+            and self._counters.snapshot() != fresh
+        )
+        if drifted:
+            log.warning("Ticket counters drifted from the table; reloaded")
+        self._counters.reset(fresh)
+        return drifted
+
+    def _count(self, before: Optional[Ticket], after: Optional[Ticket]):
+        if self._counters is not None:
+            self._counters.apply(before, after)
+
+    def _count_created(self, tickets: Sequence[Ticket]) -> None:
+        if self._counters is not None:
+            for ticket in tickets:
+                self._counters.apply(None, ticket)
+
+    def _created(self, ticket: Ticket) -> None:
+        self._count(None, ticket)
+        self._publish("created", ticket)
+        self._index(ticket)
+
+    def _created_all(self, tickets: Sequence[Ticket]) -> None:
+        self._count_created(tickets)
+        self._publish_all("created", tickets)
+        for ticket in tickets:
+            self._index(ticket)
+
+    def _invalidate_counters(self) -> None:
+        if self._counters is not None:
+            self._counters.invalidate()
+
+    # ----------------------------- change stream ----------------------------
+    def _publish(self, kind: str, ticket: Ticket) -> None:
+        if self._bus is not None:
+            self._bus.publish(kind, ticket)
+
+    def _publish_all(self, kind: str, tickets: Sequence[Ticket]) -> None:
+        if self._bus is not None:
+            for ticket in tickets:
+                self._bus.publish(kind, ticket)
+
+    # ----------------------------- near-duplicates --------------------------
+    def _reused_priority(self, title: str, description: str) -> Priority:
+        if self._similar is None:
+            return Priority.TBD
+        return self._similar.reusable_priority(title, description) or (
+            Priority.TBD
+        )
+
+    async def _prioritise(self, title: str, description: str) -> Priority:
+        """A recent near-duplicate's priority, else the classifier's."""
+        priority = self._reused_priority(title, description)
+        if priority != Priority.TBD:
+            return priority
+        return await self._classifier.classify(title, description)
+
+    def _index(self, ticket: Ticket) -> None:
+        if self._similar is not None:
+            self._similar.upsert(ticket)
+
+    def _unindex(self, ticket_id: UUID) -> None:
+        if self._similar is not None:
+            self._similar.remove(ticket_id)
+        if self._deleted_during_rebuild is not None:
+            self._deleted_during_rebuild.add(ticket_id)
+
+    async def rebuild_similarity_index(self, max_tickets: int) -> int:
+        """Index the newest `max_tickets` stored tickets (at startup)."""
+        if self._similar is None:
+            return 0
+        tickets: List[Ticket] = []
+        after = None
+        deleted: Set[UUID] = set()
+        self._deleted_during_rebuild = deleted
+        try:
+            while len(tickets) < max_tickets:
+                limit = min(
+                    SIMILARITY_REBUILD_PAGE_SIZE, max_tickets - len(tickets)
+                )
+                page = await self._repo.list(limit=limit, after=after)
+                tickets.extend(page)
+                if len(page) < limit:
+                    break
+                after = PageCursor(
+                    created_at=page[-1].created_at, id=page[-1].id
+                )
+        finally:
+            self._deleted_during_rebuild = None
+        # a page may have been read before one of its tickets was deleted
+        tickets = [t for t in tickets if t.id not in deleted]
+        # oldest first, so the newest are the last to be evicted
+        for ticket in reversed(tickets):
+            self._similar.upsert(ticket)
+        return len(tickets)
+
+    # ----------------------------- other processes --------------------------
+    def apply_remote_changes(self, events: Sequence[ChangeEvent]) -> None:
+        """
+        Replay writes made by another worker process on the same database
+        into this one's counters, index and change stream.  An update
+        doesn't say what it replaced, so it makes the counters reload.
+        """
+        for event in events:
+            ticket = event.ticket
+            if event.kind == "created":
+                self._created(ticket)
+                continue
+            if event.kind == "deleted":
+                self._count(ticket, None)
+                self._unindex(ticket.id)
+            else:
+                self._invalidate_counters()
+                self._index(ticket)
+            self._publish(event.kind, ticket)
+
+    def resync_remote_changes(self) -> None:
+        """
+        Other processes' writes were missed (pruned from the change log
+        first): reload the counters and make subscribers re-fetch.  Index
+        entries of tickets deleted elsewhere stay until evicted; similar
+        tickets are re-read, so they never show up.
+        """
+        self._invalidate_counters()
+        if self._bus is not None:
+            self._bus.reset()
+
+    # ----------------------------- background -------------------------------
+    async def classify_ticket(self, ticket_id: UUID) -> Optional[Ticket]:
+        """
+        Worker entry point: classify a stored TBD ticket and write the
+        priority back.  Tickets that were deleted or already classified in
+        the meantime are left untouched, so re-delivery is harmless.
+        """
+        for _ in range(CLASSIFY_ATTEMPTS):
+            ticket = await self._repo.get(ticket_id)
+            if ticket is None or ticket.priority != Priority.TBD:
+                return ticket
+            priority = await self._prioritise(ticket.title, ticket.description)
+            if priority == Priority.TBD:  # fell back; retried on next start
+                return ticket
+            updated = await self._write_priority(ticket, priority)
+            if updated is not None:
+                return updated
+        return await self._repo.get(ticket_id)
+
+    async def reclassify_ticket(self, ticket_id: UUID) -> Optional[Ticket]:
+        """
+        Ask the classifier again about a stored ticket, e.g. after a prompt
+        change, and write the priority back if it differs.  Near-duplicate
+        reuse is skipped: it would only copy the old verdicts.  Returns
+        None if the ticket is gone.
+        """
+        for _ in range(CLASSIFY_ATTEMPTS):
+            ticket = await self._repo.get(ticket_id)
+            if ticket is None:
+                return None
+            priority = await self._classifier.classify(
+                ticket.title, ticket.description
+            )
+            if priority == Priority.TBD:
+                raise TicketService.ClassifierUnavailableError()
+            if priority == ticket.priority:
+                return ticket
+            updated = await self._write_priority(ticket, priority)
+            if updated is not None:
+                return updated
+        return await self._repo.get(ticket_id)
+
+    async def _write_priority(
+        self, ticket: Ticket, priority: Priority
+    ) -> Optional[Ticket]:
+        """Only if nobody edited the ticket while the LLM was thinking."""
+        updated = await self._repo.update_fields(
+            ticket.id,
+            {"priority": priority, "updated_at": _now()},
+            expected_version=ticket.version,
+        )
+        if updated is not None:
+            self._count(ticket, updated)
+            self._publish("updated", updated)
+            self._index(updated)
+        return updated
+
+    async def reclassify_tickets(
+        self,
+        status: Optional[Status] = None,
+        priority: Optional[Priority] = None,
+    ) -> int:
+        """Queue a reclassification job per matching ticket."""
+        if self._jobs is None:
+            raise TicketService.JobsUnavailableError()
+        queued = 0
+        async for batch in self._repo.iter_batches(
+            status=status, priority=priority, batch_size=RECLASSIFY_PAGE_SIZE
+        ):
+            queued += await self._jobs.enqueue_many(
+                [t.id for t in batch], kind="reclassify"
+            )
+        return queued
+
+    async def job_stats(self) -> dict:
+        if self._jobs is None:
+            raise TicketService.JobsUnavailableError()
+        return await self._jobs.stats()
+
+    async def _enqueue_all(self, ticket_ids: Sequence[UUID]) -> None:
+        assert self._queue is not None
+        enqueue_many = getattr(self._queue, "enqueue_many", None)
+        if enqueue_many is not None:  # durable jobs: one write per chunk
+            await enqueue_many(ticket_ids)
+            return
+        for ticket_id in ticket_ids:
+            await self._queue.enqueue(ticket_id)
+
+    async def requeue_unclassified(self) -> int:
+        """Enqueue every TBD ticket left over from a previous run."""
+        if self._queue is None:
+            return 0
+        count, after = 0, None
+        while True:
+            page = await self._repo.list(
+                priority=Priority.TBD, limit=REQUEUE_PAGE_SIZE, after=after
+            )
+            await self._enqueue_all([ticket.id for ticket in page])
+            count += len(page)
+            if len(page) < REQUEUE_PAGE_SIZE:
+                return count
+            after = PageCursor(created_at=page[-1].created_at, id=page[-1].id)
+
+
+def _background_task_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        # the tickets stay TBD; the startup requeue picks them up
+        log.error(
+            "Enqueueing bulk-created tickets failed",
+            exc_info=task.exception(),
+        )
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _closed_at(
+    before: Ticket, status: Status, now: datetime
+) -> Optional[datetime]:
+    if status != Status.CLOSED:
+        return None
+    return before.closed_at if before.status == Status.CLOSED else now
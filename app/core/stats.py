@@ -0,0 +1,75 @@
+"""
+Incrementally maintained ticket statistics behind GET /tickets/stats.
+
+TicketService reports every write as a (before, after) pair.  A create
+has no `before` and a delete has no `after`.  The counters move by exactly
+that difference, so reading the stats never scans the table.  The
+repository's `aggregate()` is the source of truth: `reset` loads it at
+start-up and on the periodic reconcile.  `invalidate` forces a reload
+whenever an exact delta is not known (e.g. a write by another process).
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Dict, Optional
+
+from app.core.models import Status, Ticket, TicketStats
+
+
+class TicketCounters:
+    def __init__(self) -> None:
+        self._stats: Optional[TicketStats] = None
+        # bumped by every change: tells reconcile a write raced with it
+        self.generation = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._stats is not None
+
+    def reset(self, stats: TicketStats) -> None:
+        self._stats = stats
+        self.generation += 1
+
+    def invalidate(self) -> None:
+        self._stats = None
+        self.generation += 1
+
+    def snapshot(self) -> Optional[TicketStats]:
+        if self._stats is None:
+            return None
+        return TicketStats(
+            counts=dict(self._stats.counts),
+            created_per_day=dict(self._stats.created_per_day),
+            closed_per_day=dict(self._stats.closed_per_day),
+        )
+
+    def apply(self, before: Optional[Ticket], after: Optional[Ticket]) -> None:
+        self.generation += 1
+        if self._stats is None:
+            return
+        if before is not None:
+            count_ticket(self._stats, before, -1)
+        if after is not None:
+            count_ticket(self._stats, after, +1)
+
+
+def count_ticket(stats: TicketStats, t: Ticket, delta: int = 1) -> None:
+    _bump(stats.counts, (t.status, t.priority), delta)
+    _bump(stats.created_per_day, utc_day(t.created_at), delta)
+    if t.status == Status.CLOSED and t.closed_at is not None:
+        _bump(stats.closed_per_day, utc_day(t.closed_at), delta)
+
+
+def _bump(counter: Dict, key, delta: int) -> None:
+    value = counter.get(key, 0) + delta
+    if value:
+        counter[key] = value
+    else:
+        counter.pop(key, None)
+
+
+def utc_day(moment: datetime) -> date:
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date()
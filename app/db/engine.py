@@ -1,10 +1,68 @@
-import os
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
-# docker-compose already exports DATABASE_URL
-DATABASE_URL = os.getenv(
-    "DATABASE_URL", "sqlite+aiosqlite:///./data/tickets.db"
-)
+from app.config import Settings, get_settings
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORE = {"DEFAULT", "FILE", "MEMORY"}
+
+
+def sqlite_pragmas(settings: Settings) -> list[str]:
+    """
+    PRAGMAs run on every new connection.  WAL lets readers proceed while a
+    writer commits; synchronous=NORMAL is durable across app crashes in WAL
+    mode and avoids an fsync per commit; busy_timeout makes writers wait for
+    the lock instead of failing with "database is locked".
+    """
+    for value, allowed in (
+        (settings.sqlite_journal_mode, _JOURNAL_MODES),
+        (settings.sqlite_synchronous, _SYNCHRONOUS),
+        (settings.sqlite_temp_store, _TEMP_STORE),
+    ):
+        if value not in allowed:
+            raise ValueError(f"invalid SQLite pragma value {value!r}")
+    return [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA cache_size={int(settings.sqlite_cache_size)}",
+        f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}",
+        f"PRAGMA temp_store={settings.sqlite_temp_store}",
+    ]
+
+
+def build_engine(
+    url: Optional[str] = None, settings: Optional[Settings] = None
+) -> AsyncEngine:
+    settings = settings or get_settings()
+    url = url or settings.database_url
+    parsed = make_url(url)
+    is_sqlite = parsed.get_backend_name() == "sqlite"
+    in_memory = is_sqlite and parsed.database in (None, "", ":memory:")
+
+    kwargs = {}
+    if not in_memory:  # in-memory SQLite uses a StaticPool: nothing to size
+        kwargs.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_s,
+        )
+
+    # echo=False → keep logs clean; future=True → 2.0 style API
+    new_engine = create_async_engine(url, echo=False, future=True, **kwargs)
+
+    if is_sqlite:
+        pragmas = sqlite_pragmas(settings)
+
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def _on_connect(dbapi_conn, _record):
+            cursor = dbapi_conn.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
 
-# echo=False → keep logs clean; future=True → 2.0 style API
-engine: AsyncEngine = create_async_engine(DATABASE_URL, echo=False, future=True)
+    return new_engine
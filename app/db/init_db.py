@@ -1,17 +1,123 @@
 """
 Run once inside the `init-db` container defined in docker-compose.yml.
-Creates the tickets table if it does not exist.
+Creates the tickets table (and its indexes) if it does not exist.
+
+`python -m app.db.init_db --rebuild-search` re-creates the full-text index
+from the tickets table (e.g. after a VACUUM, which may renumber rowids).
 """
 
 import asyncio
-from app.db.engine import engine
+import sys
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.db.engine import build_engine
 from app.db.schema import metadata
 
 
-async def main() -> None:
-    async with engine.begin() as conn:
+async def create_schema(target: AsyncEngine) -> None:
+    """Idempotent DDL: tables + indexes that are missing get created."""
+    async with target.begin() as conn:
         # Uses SQLAlchemy's DDL generator
         await conn.run_sync(metadata.create_all)
+        await _add_missing_columns(conn)
+        await _create_search_index(conn)
+
+
+async def _add_missing_columns(conn: AsyncConnection) -> None:
+    """create_all never alters existing tables: add columns added later."""
+    rows = (await conn.execute(text("PRAGMA table_info(tickets)"))).fetchall()
+    columns = {r[1] for r in rows}
+    if "version" not in columns:
+        await conn.execute(
+            text(
+                "ALTER TABLE tickets "
+                "ADD COLUMN version INTEGER NOT NULL DEFAULT 1"
+            )
+        )
+    if "closed_at" not in columns:
+        await conn.execute(
+            text("ALTER TABLE tickets ADD COLUMN closed_at DATETIME")
+        )
+        # best guess for tickets closed before the column existed
+        await conn.execute(
+            text(
+                "UPDATE tickets SET closed_at = updated_at "
+                "WHERE status = 'CLOSED'"
+            )
+        )
+
+
+# External-content FTS5 index over tickets(title, description): the text is
+# not stored twice, only the index.  Rows are linked by tickets.rowid.
+_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE tickets_fts USING fts5(
+        title, description,
+        content='tickets', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_ai AFTER INSERT ON tickets
+    BEGIN
+        INSERT INTO tickets_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_ad AFTER DELETE ON tickets
+    BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+    END
+    """,
+    # status/priority-only updates leave the index alone
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_au
+    AFTER UPDATE OF title, description ON tickets
+    WHEN old.title IS NOT new.title OR old.description IS NOT new.description
+    BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO tickets_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+)
+
+
+async def _create_search_index(conn: AsyncConnection) -> None:
+    exists = (
+        await conn.execute(
+            text(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'tickets_fts'"
+            )
+        )
+    ).first()
+    if exists:
+        return
+    for ddl in _FTS_DDL:
+        await conn.execute(text(ddl))
+    # index tickets that existed before the search table
+    await conn.execute(
+        text("INSERT INTO tickets_fts(tickets_fts) VALUES ('rebuild')")
+    )
+
+
+async def rebuild_search_index(target: AsyncEngine) -> None:
+    async with target.begin() as conn:
+        await conn.execute(
+            text("INSERT INTO tickets_fts(tickets_fts) VALUES ('rebuild')")
+        )
+
+
+async def main() -> None:
+    engine = build_engine()
+    await create_schema(engine)
+    if "--rebuild-search" in sys.argv[1:]:
+        await rebuild_search_index(engine)
     await engine.dispose()
 
 
@@ -1,4 +1,15 @@
-from sqlalchemy import MetaData, Table, Column, String, Text, DateTime
+from sqlalchemy import (
+    MetaData,
+    Table,
+    Column,
+    String,
+    Text,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    text,
+)
 
 metadata = MetaData()
 
@@ -12,4 +23,92 @@ tickets = Table(
     Column("status", String(15), nullable=False),
     Column("created_at", DateTime, nullable=False),
     Column("updated_at", DateTime, nullable=False),
+    # optimistic concurrency: every UPDATE bumps it (see ETag / If-Match)
+    Column("version", Integer, nullable=False, server_default="1"),
+    # feeds the "closed per day" statistics
+    Column("closed_at", DateTime, nullable=True),
+    # keyset pagination walks (created_at, id) newest-first; the filtered
+    # variants let SQLite seek straight into the matching slice
+    Index("ix_tickets_created_at_id", "created_at", "id"),
+    Index("ix_tickets_status_created_at_id", "status", "created_at", "id"),
+    Index("ix_tickets_priority_created_at_id", "priority", "created_at", "id"),
+    Index(
+        "ix_tickets_status_priority_created_at_id",
+        "status",
+        "priority",
+        "created_at",
+        "id",
+    ),
+)
+
+# side table for CachingPriorityClassifier(persist=True): survives restarts
+classification_cache = Table(
+    "classification_cache",
+    metadata,
+    Column("key", String(64), primary_key=True),  # sha256 hex
+    Column("priority", String(10), nullable=False),
+    Column("expires_at", Float, nullable=False),  # unix epoch seconds
+)
+
+# cross-process change log (CROSS_PROCESS_SYNC): every ticket write, in the
+# same transaction, so the other worker processes can replay it.  See
+# app/adapters/repos/change_feed.py.
+ticket_changes = Table(
+    "ticket_changes",
+    metadata,
+    # AUTOINCREMENT: a seq is never reused, even after pruning
+    Column("seq", Integer, primary_key=True),
+    Column("origin", String(32), nullable=False),
+    Column("kind", String(10), nullable=False),  # created|updated|deleted
+    # the ticket row after the write (before it, for a delete), as JSON
+    Column("payload", Text, nullable=False),
+    Column("at", Float, nullable=False),  # unix epoch seconds
+    Index("ix_ticket_changes_at", "at"),
+    sqlite_autoincrement=True,
+)
+
+# one row naming this database's change log: SSE event ids carry it, so a
+# cursor is never read against a re-created log
+ticket_changes_epoch = Table(
+    "ticket_changes_epoch",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("epoch", String(16), nullable=False),
+)
+
+# durable classification work (app/adapters/repos/job_queue.py), drained by
+# `python -m app.workers.classify`
+classification_jobs = Table(
+    "classification_jobs",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("ticket_id", String, nullable=False),
+    Column("kind", String(12), nullable=False),  # classify | reclassify
+    # queued → leased → done, or back to queued (retry), or dead
+    Column("state", String(8), nullable=False),
+    Column("attempts", Integer, nullable=False, server_default="0"),
+    # unix epoch seconds
+    Column("run_after", Float, nullable=False),
+    Column("leased_until", Float, nullable=True),
+    Column("lease_owner", String(32), nullable=True),
+    Column("last_error", Text, nullable=True),
+    Column("created_at", Float, nullable=False),
+    Column("finished_at", Float, nullable=True),
+    # leasing seeks the due queued jobs; stats/pruning the recent done ones
+    Index("ix_classification_jobs_state_run_after", "state", "run_after"),
+    Index("ix_classification_jobs_state_finished_at", "state", "finished_at"),
+    # at most one pending job per ticket: enqueueing it again is a no-op
+    Index(
+        "ux_classification_jobs_pending_ticket",
+        "ticket_id",
+        unique=True,
+        sqlite_where=text("state IN ('queued', 'leased')"),
+    ),
+    # enqueueing a `classify` job checks for a dead one first
+    Index(
+        "ix_classification_jobs_dead_ticket",
+        "ticket_id",
+        sqlite_where=text("state = 'dead'"),
+    ),
+    sqlite_autoincrement=True,
 )
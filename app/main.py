@@ -1,5 +1,122 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import Response
+from app.adaptors_stub import Container, build_container
+from app.api.routers import admin as admin_router
 from app.api.routers import tickets as tickets_router
+from app.config import get_settings
+from app.observability.metrics import CONTENT_TYPE, REGISTRY
+from app.observability.middleware import MetricsMiddleware
+
+log = logging.getLogger(__name__)
+
+# how often expired persisted classifications are deleted
+CACHE_PURGE_INTERVAL_S = 3600.0
+
+
+async def _requeue_unclassified(container: Container) -> None:
+    count = await container.service.requeue_unclassified()
+    if count:
+        log.info("Re-enqueued %d unclassified ticket(s)", count)
+
+
+async def _rebuild_similarity_index(container: Container) -> None:
+    count = await container.service.rebuild_similarity_index(
+        container.settings.similarity_index_size
+    )
+    log.info("Indexed %d ticket(s) for near-duplicate detection", count)
+
+
+async def _follow_changes(container: Container, interval_s: float) -> None:
+    """Replay the other worker processes' writes into this one."""
+    assert container.change_feed is not None
+    while True:
+        try:
+            events, reset = await container.change_feed.poll()
+            container.apply_remote_changes(events, reset)
+        except Exception:  # pylint: disable=broad-exception-caught
+            log.exception("Following the cross-process change log failed")
+        await asyncio.sleep(interval_s)
+
+
+async def _purge_classification_cache(
+    container: Container, interval_s: float
+) -> None:
+    """Drop expired rows of the persisted classification cache."""
+    assert container.classification_store is not None
+    while True:
+        try:
+            purged = await container.classification_store.purge_expired()
+            if purged:
+                log.info("Purged %d expired classification(s)", purged)
+        except Exception:  # pylint: disable=broad-exception-caught
+            log.exception("Purging the classification cache failed")
+        await asyncio.sleep(interval_s)
+
+
+async def _reconcile_stats(container: Container, interval_s: float) -> None:
+    """Load the stats counters, then re-check them against the table."""
+    while True:
+        try:
+            await container.service.reconcile_stats()
+        except Exception:  # pylint: disable=broad-exception-caught
+            log.exception("Reconciling ticket statistics failed")
+        await asyncio.sleep(interval_s)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Wire the adapters once per worker, warm the connection pool, and tear
+    everything down (queue drained, engine disposed) on shutdown.
+    """
+    settings = get_settings()
+    container = build_container(settings)
+    tasks = []
+    try:
+        await container.start()
+        app.state.container = container
+        if container.pool is not None or settings.classify_mode == "queue":
+            # leftovers from a previous run (or tickets whose job was never
+            # written); don't hold up startup for them
+            tasks.append(asyncio.create_task(_requeue_unclassified(container)))
+        if container.similarity_index is not None:
+            tasks.append(
+                asyncio.create_task(_rebuild_similarity_index(container))
+            )
+        if container.change_feed is not None:
+            tasks.append(
+                asyncio.create_task(
+                    _follow_changes(container, settings.cross_process_poll_s)
+                )
+            )
+        if container.classification_store is not None:
+            tasks.append(
+                asyncio.create_task(
+                    _purge_classification_cache(
+                        container, CACHE_PURGE_INTERVAL_S
+                    )
+                )
+            )
+        if settings.classifier_warmup:
+            tasks.append(asyncio.create_task(container.warm_up_classifier()))
+        if settings.stats_reconcile_s > 0:
+            tasks.append(
+                asyncio.create_task(
+                    _reconcile_stats(container, settings.stats_reconcile_s)
+                )
+            )
+        yield
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        app.state.container = None
+        await container.aclose()
 
 
 def create_application() -> FastAPI:
@@ -7,10 +124,19 @@ def create_application() -> FastAPI:
         title="Ticket Service - async in-memory demo",
         version="0.2.0",
         description="Uses an async in-memory repo and async fake priority classifier",
+        lifespan=lifespan,
     )
     app.include_router(
         tickets_router.router, prefix="/tickets", tags=["tickets"]
     )
+    app.include_router(admin_router.router, prefix="/admin", tags=["admin"])
+
+    if get_settings().metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
 
     @app.get("/", include_in_schema=False)
     async def root():
@@ -0,0 +1,242 @@
+"""
+Minimal in-process metrics with Prometheus text exposition (format 0.0.4).
+
+No external client library: counters, gauges and fixed-bucket histograms
+keyed by label tuples.  Updates are plain dict/list operations — cheap
+enough to leave on in production — and are meant to be made from the event
+loop thread.
+"""
+
+from __future__ import annotations
+
+import abc
+import bisect
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _fmt(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(
+    names: Sequence[str], values: Sequence[str], extra: str = ""
+) -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric(abc.ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames=()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    @abc.abstractmethod
+    def samples(self) -> Iterable[str]:
+        """Exposition lines, one per sample."""
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        for key, value in self._values.items():
+            yield f"{self.name}{_labels(self.labelnames, key)} {_fmt(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+
+class CallbackGauge(_Metric):
+    """Gauge whose samples are read from a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Dict[LabelValues, float]],
+        labelnames=(),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._callback = callback
+
+    def samples(self):
+        for key, value in self._callback().items():
+            yield f"{self.name}{_labels(self.labelnames, key)} {_fmt(value)}"
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name,
+        documentation,
+        labelnames=(),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._upper = tuple(sorted(buckets))
+        # per label set: [bucket counts..., +Inf count], sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = ([0] * (len(self._upper) + 1), [0.0])
+        counts, total = series
+        counts[bisect.bisect_left(self._upper, value)] += 1
+        total[0] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def samples(self):
+        for key, (counts, total) in self._series.items():
+            cumulative = 0
+            for upper, n in zip((*self._upper, math.inf), counts):
+                cumulative += n
+                le = f'le="{_fmt(upper)}"'
+                yield (
+                    f"{self.name}_bucket"
+                    f"{_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            yield f"{self.name}_sum{_labels(self.labelnames, key)} {_fmt(total[0])}"
+            yield f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}"
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        self._metrics.pop(name, None)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = Registry()
+
+# ───────────────────────── application metrics ──────────────────────────
+HTTP_REQUESTS = REGISTRY.register(
+    Counter(
+        "http_requests_total",
+        "HTTP requests by route template, method and status code.",
+        ("method", "route", "status"),
+    )
+)
+HTTP_LATENCY = REGISTRY.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template and method.",
+        ("method", "route"),
+    )
+)
+HTTP_INFLIGHT = REGISTRY.register(
+    Gauge(
+        "http_requests_in_flight",
+        "HTTP requests currently being served.",
+        ("method",),
+    )
+)
+REPO_LATENCY = REGISTRY.register(
+    Histogram(
+        "ticket_repository_call_duration_seconds",
+        "TicketRepositoryPort call latency by method and outcome.",
+        ("method", "outcome"),
+    )
+)
+CLASSIFIER_LATENCY = REGISTRY.register(
+    Histogram(
+        "classifier_call_duration_seconds",
+        "PriorityClassifierPort call latency by classifier layer.",
+        ("classifier",),
+    )
+)
+CLASSIFIER_OUTCOMES = REGISTRY.register(
+    Counter(
+        "classifier_outcomes_total",
+        "Classifier results by layer and priority (TBD = fallback).",
+        ("classifier", "outcome"),
+    )
+)
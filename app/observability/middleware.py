@@ -0,0 +1,47 @@
+"""
+Pure-ASGI request instrumentation (no BaseHTTPMiddleware overhead).
+
+Latency is labelled with the matched route *template* (`/tickets/{ticket_id}`)
+so label cardinality stays bounded; unmatched paths share one label.
+"""
+
+import time
+
+from app.observability.metrics import (
+    HTTP_INFLIGHT,
+    HTTP_LATENCY,
+    HTTP_REQUESTS,
+)
+
+
+class MetricsMiddleware:
+    def __init__(self, app, *, exclude_paths=("/metrics",)) -> None:
+        self.app = app
+        self._exclude = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self._exclude:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = {"code": 500}
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        HTTP_INFLIGHT.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_INFLIGHT.dec(method=method)
+            # the router stores the matched route in the (shared) scope
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_LATENCY.observe(elapsed, method=method, route=route)
+            HTTP_REQUESTS.inc(
+                method=method, route=route, status=str(status["code"])
+            )
@@ -0,0 +1,275 @@
+"""
+Classification job worker: drains the durable `classification_jobs` table.
+
+    python -m app.workers.classify                 # until SIGTERM / Ctrl-C
+    python -m app.workers.classify --once          # until nothing is due
+    python -m app.workers.classify --retry-dead    # requeue dead jobs, exit
+
+Jobs come from CLASSIFY_MODE=queue (new tickets) and POST /admin/reclassify.
+Each round leases up to CLASSIFY_JOB_BATCH_SIZE due jobs, oldest first,
+and runs them with at most CLASSIFY_JOB_CONCURRENCY classifier calls in
+flight (renewing the leases until each job is finished), through the
+same classifier chain as the API (cache, guards, fallback, micro-batching).
+A failed job is retried with backoff, then dead-lettered.  Any number of
+these processes can share the database: a job is leased by one at a time,
+and a crashed worker's jobs are picked up once their lease expires.
+
+Writes are logged for the API workers (CROSS_PROCESS_SYNC), so their
+caches, counters and event streams see the new priorities; this process
+prunes that log too, since a single API process doesn't follow it.  An idle
+poll for due jobs is a read: no write lock is taken while nothing is due.  Progress is
+logged every `--report-every` seconds; GET /admin/jobs shows the queue.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import logging
+import signal
+import time
+from typing import List, Optional, Set
+
+from app.adapters.repos import change_feed
+from app.adapters.repos.change_feed import ChangeFeed, new_origin
+from app.adapters.repos.job_queue import Job, SQLiteJobQueue
+from app.core.models import Priority
+from app.core.service import TicketService
+
+log = logging.getLogger(__name__)
+
+# done jobs older than the retention are deleted this often
+PRUNE_INTERVAL_S = 3600.0
+# leases of a running batch are renewed this many times per lease period
+HEARTBEATS_PER_LEASE = 3
+
+
+class JobRunner:
+    def __init__(
+        self,
+        jobs: SQLiteJobQueue,
+        service: TicketService,
+        *,
+        owner: Optional[str] = None,
+        batch_size: int = 32,
+        concurrency: int = 8,
+        lease_s: float = 60.0,
+        idle_sleep_s: float = 1.0,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._jobs = jobs
+        self._service = service
+        self.owner = owner or new_origin()
+        self._batch_size = batch_size
+        self._gate = asyncio.Semaphore(concurrency)
+        self._lease_s = lease_s
+        self._idle_sleep_s = idle_sleep_s
+        self.done = 0
+        self.failed = 0
+        self.lost = 0  # finished after the lease had been taken over
+
+    def stats(self) -> dict:
+        return {"done": self.done, "failed": self.failed, "lost": self.lost}
+
+    async def run_batch(self) -> int:
+        """Lease and run one batch; returns its size (0 → nothing due)."""
+        batch = await self._jobs.lease(
+            self.owner, self._batch_size, self._lease_s
+        )
+        if not batch:
+            return 0
+        # jobs waiting for a slot, or in a slow call, must not lose their
+        # lease to another worker meanwhile
+        held = set(batch)
+        heartbeat = asyncio.create_task(self._heartbeat(held))
+        try:
+            await asyncio.gather(*(self._run(job, held) for job in batch))
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+        return len(batch)
+
+    async def run_until_idle(self) -> int:
+        total = 0
+        while n := await self.run_batch():
+            total += n
+        return total
+
+    async def run_forever(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                if await self.run_batch():
+                    continue
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception("Leasing classification jobs failed")
+            try:
+                await asyncio.wait_for(stop.wait(), self._idle_sleep_s)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _heartbeat(self, held: Set[Job]) -> None:
+        while True:
+            await asyncio.sleep(self._lease_s / HEARTBEATS_PER_LEASE)
+            try:
+                await self._jobs.extend(list(held), self.owner, self._lease_s)
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception("Extending job leases failed")
+
+    async def _run(self, job: Job, held: Set[Job]) -> None:
+        async with self._gate:
+            try:
+                await self._handle(job)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                error = f"{type(exc).__name__}: {exc}"
+                log.warning(
+                    "Job %d (%s %s) failed on attempt %d: %s",
+                    job.id,
+                    job.kind,
+                    job.ticket_id,
+                    job.attempts,
+                    error,
+                )
+                self.failed += 1
+                kept = await self._jobs.fail(job, self.owner, error)
+            else:
+                self.done += 1
+                kept = await self._jobs.complete(job, self.owner)
+            finally:
+                held.discard(job)
+        if not kept:
+            self.lost += 1
+
+    async def _handle(self, job: Job) -> None:
+        if job.kind == "reclassify":
+            await self._service.reclassify_ticket(job.ticket_id)
+            return
+        ticket = await self._service.classify_ticket(job.ticket_id)
+        if ticket is not None and ticket.priority == Priority.TBD:
+            raise TicketService.ClassifierUnavailableError()
+
+
+async def _report(
+    runner: JobRunner, jobs: SQLiteJobQueue, interval_s: float
+) -> None:
+    last, last_at = runner.done, time.monotonic()
+    while True:
+        await asyncio.sleep(interval_s)
+        now = time.monotonic()
+        rate = (runner.done - last) / (now - last_at)
+        last, last_at = runner.done, now
+        try:
+            queue = await jobs.stats()
+        except Exception:  # pylint: disable=broad-exception-caught
+            log.exception("Reading job statistics failed")
+            continue
+        log.info(
+            "%.1f jobs/s; %s; queue: %s",
+            rate,
+            runner.stats(),
+            {k: queue[k] for k in ("queued", "leased", "dead")},
+        )
+
+
+async def _prune(jobs: SQLiteJobQueue, retention_s: float) -> None:
+    while True:
+        try:
+            pruned = await jobs.prune(retention_s)
+            if pruned:
+                log.info("Pruned %d finished job(s)", pruned)
+        except Exception:  # pylint: disable=broad-exception-caught
+            log.exception("Pruning finished jobs failed")
+        await asyncio.sleep(PRUNE_INTERVAL_S)
+
+
+async def _prune_changes(feed: ChangeFeed) -> None:
+    """This process writes to the change log but never reads it."""
+    while True:
+        try:
+            pruned = await feed.prune()
+            if pruned:
+                log.debug("Pruned %d change log entries", pruned)
+        except Exception:  # pylint: disable=broad-exception-caught
+            log.exception("Pruning the change log failed")
+        await asyncio.sleep(change_feed.PRUNE_INTERVAL_S)
+
+
+async def main_async(opts: argparse.Namespace) -> None:
+    from app.adaptors_stub import build_container
+    from app.config import get_settings
+
+    settings = get_settings()
+    # the API workers follow this process's writes through the change log
+    settings = dataclasses.replace(
+        settings, cross_process_sync=True, classify_mode="sync"
+    )
+    container = build_container(settings)
+    assert container.jobs is not None
+    tasks: List[asyncio.Task] = []
+    try:
+        await container.start()
+        if opts.retry_dead:
+            count = await container.jobs.retry_dead()
+            log.info("Requeued %d dead job(s)", count)
+            return
+        if container.similarity_index is not None:
+            await container.service.rebuild_similarity_index(
+                settings.similarity_index_size
+            )
+        await container.warm_up_classifier()
+        runner = JobRunner(
+            container.jobs,
+            container.service,
+            batch_size=opts.batch_size or settings.classify_job_batch_size,
+            concurrency=opts.concurrency or settings.classify_job_concurrency,
+            lease_s=settings.classify_job_lease_s,
+        )
+        log.info("Job worker %s started", runner.owner)
+        tasks.append(
+            asyncio.create_task(
+                _report(runner, container.jobs, opts.report_every)
+            )
+        )
+        tasks.append(
+            asyncio.create_task(
+                _prune(container.jobs, settings.classify_job_retention_s)
+            )
+        )
+        if container.change_feed is not None:
+            tasks.append(
+                asyncio.create_task(_prune_changes(container.change_feed))
+            )
+        if opts.once:
+            count = await runner.run_until_idle()
+            log.info("Ran %d job(s): %s", count, runner.stats())
+            return
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        await runner.run_forever(stop)
+        log.info("Job worker stopped: %s", runner.stats())
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await container.aclose()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--once", action="store_true")
+    p.add_argument("--retry-dead", action="store_true")
+    p.add_argument("--batch-size", type=int, default=0)
+    p.add_argument("--concurrency", type=int, default=0)
+    p.add_argument("--report-every", type=float, default=30.0)
+    opts = p.parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
+    )
+    asyncio.run(main_async(opts))
+
+
+if __name__ == "__main__":
+    main()
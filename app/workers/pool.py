@@ -0,0 +1,98 @@
+"""
+In-process background worker pool.
+
+A bounded asyncio.Queue of ticket ids drained by N worker tasks.  `enqueue`
+awaits when the queue is full, so producers (POST /tickets) feel
+back-pressure instead of the process buffering unbounded work.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+from uuid import UUID
+
+log = logging.getLogger(__name__)
+
+Handler = Callable[[UUID], Awaitable[object]]
+
+
+class WorkerPool:
+    """Implements ClassificationQueuePort on top of asyncio tasks."""
+
+    def __init__(
+        self,
+        handler: Handler,
+        *,
+        concurrency: int = 4,
+        queue_size: int = 1000,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._handler = handler
+        self._concurrency = concurrency
+        self._queue_size = queue_size
+        # re-created in start() so it binds to the serving event loop
+        self._queue: asyncio.Queue[UUID] = asyncio.Queue(maxsize=queue_size)
+        self._workers: List[asyncio.Task] = []
+        self._accepting = False
+
+    # ───────────────────────── lifecycle ────────────────────────
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._accepting = True
+        self._workers = [
+            asyncio.create_task(self._run(), name=f"classify-worker-{i}")
+            for i in range(self._concurrency)
+        ]
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting work, let the workers finish what is queued (up to
+        `timeout` seconds), then cancel them.  Anything still queued stays
+        TBD in the repository and is picked up again on the next start.
+        """
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            log.warning(
+                "Worker pool drain timed out with %d job(s) left", self.pending
+            )
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    # ───────────────────────── producer side ────────────────────
+    async def enqueue(self, ticket_id: UUID) -> None:
+        if not self._accepting:
+            # the ticket is already stored: failing the request would
+            # hide that.  It stays TBD until the next start requeues it.
+            log.warning(
+                "Worker pool is not running; ticket %s stays TBD", ticket_id
+            )
+            return
+        await self._queue.put(ticket_id)
+
+    # ───────────────────────── consumer side ────────────────────
+    async def _run(self) -> None:
+        while True:
+            ticket_id = await self._queue.get()
+            try:
+                await self._handler(ticket_id)
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception("Background job for ticket %s failed", ticket_id)
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,90 @@
+"""
+Benchmark wiring: the real FastAPI app with a chosen repository and a fake
+classifier that sleeps like an LLM would.  No OpenAI key or network needed.
+
+`create_app_from_env` is the uvicorn `--factory` entry point; it reads
+BENCH_REPO (memory|sqlite), BENCH_DB_PATH and BENCH_CLASSIFIER_LATENCY_MS.
+SQLite files must be initialised with `prepare_database` first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+from typing import Optional
+
+from fastapi import FastAPI
+
+from app.adapters.llm.fake_classifier import FakePriorityClassifier
+from app.adapters.repos.in_memory_repo import InMemoryTicketRepository
+from app.adapters.repos.sqlite_repo import SQLiteTicketRepository
+from app.api.deps import get_ticket_service
+from app.core.models import Priority
+from app.core.ports import PriorityClassifierPort
+from app.core.service import TicketService
+from app.db.engine import build_engine
+from app.db.init_db import create_schema
+from app.main import create_application
+
+
+class LatencyInjectingClassifier(PriorityClassifierPort):
+    """Keyword classifier that waits latency ± jitter ms, like an LLM call."""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0):
+        self._inner = FakePriorityClassifier()
+        self._latency_s = latency_ms / 1000.0
+        self._jitter_s = jitter_ms / 1000.0
+
+    async def classify(self, title: str, description: str) -> Priority:
+        delay = self._latency_s + random.uniform(-1, 1) * self._jitter_s
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await self._inner.classify(title, description)
+
+
+def sqlite_engine(db_path: str):
+    return build_engine(f"sqlite+aiosqlite:///{db_path}")
+
+
+async def prepare_database(db_path: str) -> None:
+    engine = sqlite_engine(db_path)
+    await create_schema(engine)
+    await engine.dispose()
+
+
+def create_benchmark_app(
+    repo: str = "memory",
+    *,
+    db_path: Optional[str] = None,
+    classifier_latency_ms: float = 0.0,
+) -> FastAPI:
+    if repo == "memory":
+        repository = InMemoryTicketRepository()
+    elif repo == "sqlite":
+        if not db_path:
+            raise ValueError("db_path is required for the sqlite repository")
+        # schema is created beforehand by prepare_database()
+        repository = SQLiteTicketRepository(sqlite_engine(db_path))
+    else:
+        raise ValueError(f"unknown repository {repo!r}")
+
+    service = TicketService(
+        repository=repository,
+        classifier=LatencyInjectingClassifier(
+            classifier_latency_ms, classifier_latency_ms / 4
+        ),
+    )
+    application = create_application()
+    application.dependency_overrides[get_ticket_service] = lambda: service
+    return application
+
+
+def create_app_from_env() -> FastAPI:
+    return create_benchmark_app(
+        os.getenv("BENCH_REPO", "memory"),
+        db_path=os.getenv("BENCH_DB_PATH"),
+        classifier_latency_ms=float(
+            os.getenv("BENCH_CLASSIFIER_LATENCY_MS", "0")
+        ),
+    )
@@ -0,0 +1,162 @@
+"""
+Per-row CPU cost of serving a large GET /tickets page, stage by stage.
+
+    hydrate     DB row → Ticket.  baseline: name lookups through
+                row._mapping, Enum(...) calls, a __dict__ dataclass; now:
+                positional unpacking, cached enum maps, a slotted Ticket
+    serialise   Ticket list → JSON bytes.  baseline: what FastAPI does for
+                response_model=List[TicketRead] (validate every row into a
+                model, dump to Python, json.dumps); now: orjson straight
+                from the dataclasses
+    memory      bytes held per hydrated Ticket
+
+Rows are fetched once from a throw-away SQLite file, so driver time is
+measured on its own ("fetch") and left out of the stages.
+
+    python -m benchmarks.hydration --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from sqlalchemy import text
+
+from app.adapters.repos.sqlite_repo import (
+    _COLUMNS,
+    SQLiteTicketRepository,
+    _as_dt,
+)
+from app.api import schemas as dto
+from app.core.models import Priority, Status, Ticket
+from app.db.engine import build_engine
+from app.db.init_db import create_schema
+
+# the model as it was: same fields, per-instance __dict__
+DictTicket = dataclasses.make_dataclass(
+    "DictTicket",
+    [(f.name, f.type, f) for f in dataclasses.fields(Ticket)],
+)
+
+_AS_READ = TypeAdapter(List[dto.TicketRead])
+
+
+def hydrate_baseline(row) -> DictTicket:
+    m = row._mapping  # pylint: disable=protected-access
+    return DictTicket(
+        id=UUID(m["id"]),
+        title=m["title"],
+        description=m["description"],
+        priority=Priority(m["priority"]),
+        status=Status(m["status"]),
+        created_at=_as_dt(m["created_at"]),
+        updated_at=_as_dt(m["updated_at"]),
+        version=m["version"],
+        closed_at=_as_dt(m["closed_at"]) if m["closed_at"] else None,
+    )
+
+
+def serialise_baseline(tickets) -> bytes:
+    models = _AS_READ.validate_python(tickets, from_attributes=True)
+    return json.dumps(_AS_READ.dump_python(models, mode="json")).encode()
+
+
+async def _fetch(rows: int, db_dir: str):
+    engine = build_engine(f"sqlite+aiosqlite:///{db_dir}/tickets.db")
+    await create_schema(engine)
+    await SQLiteTicketRepository(engine).add_many(
+        [
+            Ticket(
+                title=f"ticket {i}",
+                description="Checkout fails with a 500 after login " * 3,
+            )
+            for i in range(rows)
+        ]
+    )
+    async with engine.connect() as conn:
+        start = time.perf_counter()
+        result = await conn.execute(text(f"SELECT {_COLUMNS} FROM tickets"))
+        fetched = result.fetchall()
+        fetch_s = time.perf_counter() - start
+    await engine.dispose()
+    return fetched, fetch_s
+
+
+def _timed(fn: Callable, arg, repeat: int):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return out, best
+
+
+def _bytes_per_object(build: Callable[[], list]) -> float:
+    tracemalloc.start()
+    objects = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(objects)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    opts = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        rows, fetch_s = asyncio.run(_fetch(opts.rows, db_dir))
+    n = len(rows)
+    to_ticket = SQLiteTicketRepository._row_to_ticket
+
+    def per_row_us(seconds: float) -> float:
+        return round(seconds / n * 1e6, 3)
+
+    old, old_hydrate = _timed(
+        lambda rs: [hydrate_baseline(r) for r in rs], rows, opts.repeat
+    )
+    new, new_hydrate = _timed(
+        lambda rs: [to_ticket(r) for r in rs], rows, opts.repeat
+    )
+    old_body, old_serialise = _timed(serialise_baseline, old, opts.repeat)
+    new_body, new_serialise = _timed(dto.dump_tickets, new, opts.repeat)
+    assert json.loads(old_body) == json.loads(new_body)
+
+    report = {
+        "rows": n,
+        "fetch_us_per_row": per_row_us(fetch_s),
+        "baseline": {
+            "hydrate_us_per_row": per_row_us(old_hydrate),
+            "serialise_us_per_row": per_row_us(old_serialise),
+            "total_us_per_row": per_row_us(old_hydrate + old_serialise),
+            "bytes_per_ticket": round(
+                _bytes_per_object(lambda: [hydrate_baseline(r) for r in rows])
+            ),
+        },
+        "current": {
+            "hydrate_us_per_row": per_row_us(new_hydrate),
+            "serialise_us_per_row": per_row_us(new_serialise),
+            "total_us_per_row": per_row_us(new_hydrate + new_serialise),
+            "bytes_per_ticket": round(
+                _bytes_per_object(lambda: [to_ticket(r) for r in rows])
+            ),
+        },
+    }
+    report["speedup"] = round(
+        (old_hydrate + old_serialise) / (new_hydrate + new_serialise), 2
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Cost per ticket of keyword classification as the rule set grows.
+
+    substring   the original FakePriorityClassifier: lower-case an f-string,
+                then `any(w in text ...)` per tier (one scan per keyword)
+    per-tier    one alternation regex per tier (three scans)
+    trie        KeywordRules: every tier in ONE trie-shaped regex (one scan)
+
+Texts are the title + body of each line of a JSONL file (by default the
+change-request samples in requests.jsonl).  Without that file, the
+synthetic tickets of benchmarks/tiered.py are used.  Rule sets are the
+built-in rules, plus the same rules padded with `--extra` random keywords
+per tier (words that rarely match, which is the worst case for the
+substring scan).
+
+    python -m benchmarks.keywords --samples requests.jsonl --extra 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import string
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from app.adapters.llm.rules import DEFAULT_RULES, KeywordRules, Rules
+from app.core.models import Priority
+
+Text = Tuple[str, str]
+
+
+def load_texts(path: Optional[str]) -> Tuple[str, List[Text]]:
+    if path and Path(path).exists():
+        texts = []
+        for line in Path(path).read_text().splitlines():
+            if line.strip():
+                item = json.loads(line)
+                texts.append((item.get("title", ""), item.get("body", "")))
+        return path, texts
+    from benchmarks.tiered import make_corpus
+
+    return "synthetic", [
+        (t, d) for t, d, _ in make_corpus(500, 42, unseen=True)
+    ]
+
+
+def padded_rules(extra: int, seed: int) -> Rules:
+    rnd = random.Random(seed)
+    rules = {}
+    for priority, keywords in DEFAULT_RULES.items():
+        words = [
+            "".join(rnd.choices(string.ascii_lowercase, k=rnd.randint(5, 10)))
+            for _ in range(extra)
+        ]
+        rules[priority] = tuple(keywords) + tuple((w, 1.0) for w in words)
+    return rules
+
+
+def substring_classifier(rules: Rules) -> Callable[[str, str], Priority]:
+    tiers = [
+        (p, tuple(k for k, _ in rules[p]))
+        for p in (Priority.HIGH, Priority.MEDIUM)
+    ]
+
+    def classify(title: str, description: str) -> Priority:
+        text = f"{title} {description}".lower()
+        for priority, keywords in tiers:
+            if any(w in text for w in keywords):
+                return priority
+        return Priority.LOW
+
+    return classify
+
+
+def per_tier_classifier(rules: Rules) -> Callable[[str, str], Priority]:
+    patterns = [
+        (
+            p,
+            re.compile(
+                r"\b(?:" + "|".join(re.escape(k) for k, _ in rules[p]) + ")"
+            ),
+        )
+        for p in (Priority.HIGH, Priority.MEDIUM)
+    ]
+
+    def classify(title: str, description: str) -> Priority:
+        text = f"{title} {description}".lower()
+        for priority, pattern in patterns:
+            if pattern.search(text):
+                return priority
+        return Priority.LOW
+
+    return classify
+
+
+def trie_classifier(rules: Rules) -> Callable[[str, str], Priority]:
+    engine = KeywordRules(rules)
+
+    def classify(title: str, description: str) -> Priority:
+        scores = engine.scores(title, description)
+        return next(iter(scores)) if scores else Priority.LOW
+
+    return classify
+
+
+def time_per_ticket(
+    classify: Callable[[str, str], Priority], texts: List[Text], rounds: int
+) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for title, description in texts:
+            classify(title, description)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts) * 1e6
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--samples", default="requests.jsonl")
+    p.add_argument("--extra", type=int, default=300)
+    p.add_argument("--rounds", type=int, default=20)
+    p.add_argument("--seed", type=int, default=42)
+    opts = p.parse_args(argv)
+
+    source, texts = load_texts(opts.samples)
+    report = {
+        "samples": source,
+        "texts": len(texts),
+        "avg_chars": round(
+            sum(len(t) + len(d) for t, d in texts) / len(texts)
+        ),
+        "us_per_ticket": {},
+    }
+    for label, rules in (
+        ("default", DEFAULT_RULES),
+        (f"default+{opts.extra}/tier", padded_rules(opts.extra, opts.seed)),
+    ):
+        keywords = sum(len(v) for v in rules.values())
+        row = {"keywords": keywords}
+        for name, build in (
+            ("substring", substring_classifier),
+            ("per-tier", per_tier_classifier),
+            ("trie", trie_classifier),
+        ):
+            row[name] = round(
+                time_per_ticket(build(rules), texts, opts.rounds), 2
+            )
+        report["us_per_ticket"][label] = row
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
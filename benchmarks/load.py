@@ -0,0 +1,292 @@
+"""
+Load generator for the ticket API.
+
+Drives the app either in-process through httpx.ASGITransport or over TCP
+against a real uvicorn process, with a weighted mix of create / list / get /
+patch / delete calls, and prints a JSON report (p50/p95/p99 per operation,
+requests/s) that can be diffed between commits.
+
+    python -m benchmarks.load --transport asgi --repo memory
+    python -m benchmarks.load --transport uvicorn --repo sqlite \\
+        --requests 5000 --concurrency 32 --classifier-latency-ms 50 \\
+        --output bench_output.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks.app_factory import create_benchmark_app, prepare_database
+
+OPERATIONS = ("create", "list", "get", "patch", "delete")
+DEFAULT_MIX = "create=20,list=30,get=35,patch=10,delete=5"
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}")
+        mix[name] = float(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("mix needs a positive weight")
+    return mix
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarise(latencies: List[float], errors: int, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "max_ms": round((ordered[-1] if ordered else 0.0) * 1000, 3),
+    }
+
+
+class LoadRunner:
+    def __init__(self, client: httpx.AsyncClient, mix: Dict[str, float]):
+        self._client = client
+        self._ops = list(mix)
+        self._weights = [mix[o] for o in self._ops]
+        self._ids: List[str] = []
+        self.latencies: Dict[str, List[float]] = {o: [] for o in OPERATIONS}
+        self.errors: Dict[str, int] = {o: 0 for o in OPERATIONS}
+
+    async def seed(self, n: int) -> None:
+        for i in range(n):
+            await self._create(i)
+
+    async def _create(self, i: int) -> httpx.Response:
+        r = await self._client.post(
+            "/tickets",
+            json={"title": f"bench {i}", "description": "checkout is slow"},
+        )
+        if r.status_code == 201:
+            self._ids.append(r.json()["id"])
+        return r
+
+    async def _one(self, op: str, i: int, rnd: random.Random) -> None:
+        if op in ("get", "patch", "delete") and not self._ids:
+            op = "create"
+        start = time.perf_counter()
+        try:
+            ok = await self._request(op, i, rnd)
+        except httpx.TransportError:  # e.g. a worker process restarted
+            ok = False
+        self.latencies[op].append(time.perf_counter() - start)
+        if not ok:
+            self.errors[op] += 1
+
+    async def _request(self, op: str, i: int, rnd: random.Random) -> bool:
+        if op == "create":
+            r = await self._create(i)
+            ok = r.status_code == 201
+        elif op == "list":
+            r = await self._client.get("/tickets", params={"limit": 50})
+            ok = r.status_code == 200
+        elif op == "get":
+            r = await self._client.get(f"/tickets/{rnd.choice(self._ids)}")
+            ok = r.status_code in (200, 404)  # raced with a delete
+        elif op == "patch":
+            r = await self._client.patch(
+                f"/tickets/{rnd.choice(self._ids)}",
+                json={"status": rnd.choice(["OPEN", "IN_PROGRESS", "CLOSED"])},
+            )
+            ok = r.status_code in (200, 404)
+        else:
+            tid = self._ids.pop(rnd.randrange(len(self._ids)))
+            r = await self._client.delete(f"/tickets/{tid}")
+            ok = r.status_code == 204
+        return ok
+
+    async def run(self, requests: int, concurrency: int, seed: int) -> float:
+        rnd = random.Random(seed)
+        plan = rnd.choices(self._ops, weights=self._weights, k=requests)
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(plan):
+            queue.put_nowait(item)
+
+        async def _worker(worker_seed: int) -> None:
+            wrnd = random.Random(worker_seed)
+            while not queue.empty():
+                i, op = queue.get_nowait()
+                await self._one(op, i, wrnd)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_worker(seed + w) for w in range(concurrency)))
+        return time.perf_counter() - start
+
+    def report(self, elapsed: float) -> dict:
+        every = [v for vals in self.latencies.values() for v in vals]
+        return {
+            "total": summarise(every, sum(self.errors.values()), elapsed),
+            "operations": {
+                op: summarise(vals, self.errors[op], elapsed)
+                for op, vals in self.latencies.items()
+                if vals
+            },
+        }
+
+
+# ───────────────────────── transports ──────────────────────────
+@asynccontextmanager
+async def asgi_client(opts, db_path: Optional[str]):
+    app = create_benchmark_app(
+        opts.repo,
+        db_path=db_path,
+        classifier_latency_ms=opts.classifier_latency_ms,
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        yield client
+
+
+@asynccontextmanager
+async def uvicorn_client(opts, db_path: Optional[str]):
+    env = {
+        **os.environ,
+        "BENCH_REPO": opts.repo,
+        "BENCH_DB_PATH": db_path or "",
+        "BENCH_CLASSIFIER_LATENCY_MS": str(opts.classifier_latency_ms),
+    }
+    cmd = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "--factory",
+        "benchmarks.app_factory:create_app_from_env",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(opts.port),
+        "--log-level",
+        "warning",
+        *opts.uvicorn_arg,
+    ]
+    proc = subprocess.Popen(cmd, env=env)
+    base_url = f"http://127.0.0.1:{opts.port}"
+    limits = httpx.Limits(max_connections=opts.concurrency)
+    try:
+        async with httpx.AsyncClient(
+            base_url=base_url, limits=limits, timeout=60
+        ) as client:
+            await _wait_until_up(client, proc)
+            yield client
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+async def _wait_until_up(client: httpx.AsyncClient, proc, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            if (await client.get("/")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise TimeoutError("uvicorn did not come up")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(opts) -> dict:
+    with tempfile.TemporaryDirectory(dir=opts.dir) as tmp:
+        db_path = None
+        if opts.repo == "sqlite":
+            db_path = os.path.join(tmp, "bench.db")
+            await prepare_database(db_path)
+
+        factory = asgi_client if opts.transport == "asgi" else uvicorn_client
+        async with factory(opts, db_path) as client:
+            runner = LoadRunner(client, opts.mix)
+            await runner.seed(opts.seed_tickets)
+            elapsed = await runner.run(
+                opts.requests, opts.concurrency, opts.seed
+            )
+
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "config": {
+            k: v for k, v in vars(opts).items() if k not in ("output",)
+        },
+        "elapsed_s": round(elapsed, 3),
+        **runner.report(elapsed),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--transport", choices=("asgi", "uvicorn"), default="asgi")
+    p.add_argument("--repo", choices=("memory", "sqlite"), default="memory")
+    p.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    p.add_argument("--requests", type=int, default=2000)
+    p.add_argument("--concurrency", type=int, default=16)
+    p.add_argument("--seed-tickets", type=int, default=200)
+    p.add_argument("--classifier-latency-ms", type=float, default=0.0)
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument(
+        "--uvicorn-arg",
+        action="append",
+        default=[],
+        help="extra uvicorn CLI argument (repeatable), e.g. --uvicorn-arg=--loop=uvloop",
+    )
+    p.add_argument("--dir", default=".", help="where to put the SQLite file")
+    p.add_argument("--output", help="write the JSON report here as well")
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    opts = build_parser().parse_args(argv)
+    report = asyncio.run(run(opts))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if opts.output:
+        with open(opts.output, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Throughput of the production deployment mode as the number of uvicorn
+worker processes grows.
+
+For each worker count, a fresh SQLite file is served by
+
+    uvicorn app.main:app --workers N --loop uvloop --http httptools
+
+with the real container (CLASSIFIER=fake, so no network) and, from two
+workers on, the cross-process change feed.  Several driver processes then
+run benchmarks.load's request mix against it, so the load generator is not
+the bottleneck.  The report gives requests/s, latency percentiles and the
+speed-up over one worker.  It can't exceed the number of CPU cores, which is
+printed along with the results.
+
+    python -m benchmarks.scaling --workers 1,2,4 --drivers 4 --requests 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks.app_factory import prepare_database
+from benchmarks.load import (
+    DEFAULT_MIX,
+    LoadRunner,
+    _wait_until_up,
+    parse_mix,
+    summarise,
+)
+
+
+@asynccontextmanager
+async def serve(opts, workers: int, db_path: str):
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{db_path}",
+        "CLASSIFIER": "fake",
+        "WEB_CONCURRENCY": str(workers),
+        "STATS_RECONCILE_S": "0",
+    }
+    cmd = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "app.main:app",
+        "--workers",
+        str(workers),
+        "--loop",
+        opts.loop,
+        "--http",
+        opts.http,
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(opts.port),
+        "--log-level",
+        "warning",
+    ]
+    proc = subprocess.Popen(cmd, env=env)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{opts.port}"
+        ) as client:
+            await _wait_until_up(client, proc, timeout=60.0)
+            # every worker must be up, not just the first to accept
+            await asyncio.sleep(0.5 * workers)
+        yield
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+def drive(port: int, mix: Dict[str, float], requests: int, opts) -> dict:
+    """One driver process: seed, then run its share of the requests."""
+
+    async def _run() -> dict:
+        limits = httpx.Limits(max_connections=opts.concurrency)
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60
+        ) as client:
+            runner = LoadRunner(client, mix)
+            await runner.seed(opts.seed_tickets)
+            started = time.time()
+            await runner.run(requests, opts.concurrency, opts.seed + port)
+            return {
+                "started": started,
+                "finished": time.time(),
+                "latencies": [
+                    v for vs in runner.latencies.values() for v in vs
+                ],
+                "errors": sum(runner.errors.values()),
+            }
+
+    return asyncio.run(_run())
+
+
+async def measure(opts, workers: int) -> dict:
+    with tempfile.TemporaryDirectory(dir=opts.dir) as tmp:
+        db_path = os.path.join(tmp, "scaling.db")
+        await prepare_database(db_path)
+        async with serve(opts, workers, db_path):
+            share = opts.requests // opts.drivers
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(opts.drivers) as executor:
+                parts = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            executor, drive, opts.port, opts.mix, share, opts
+                        )
+                        for _ in range(opts.drivers)
+                    )
+                )
+    elapsed = max(p["finished"] for p in parts) - min(
+        p["started"] for p in parts
+    )
+    latencies = [v for p in parts for v in p["latencies"]]
+    return {
+        "workers": workers,
+        **summarise(latencies, sum(p["errors"] for p in parts), elapsed),
+    }
+
+
+async def run(opts) -> dict:
+    results = []
+    for workers in opts.workers:
+        results.append(await measure(opts, workers))
+        opts.port += 1  # don't wait for the old socket to be released
+    base = results[0]["rps"] or 1.0
+    for row in results:
+        row["speedup"] = round(row["rps"] / base, 2)
+    return {
+        "cpu_count": os.cpu_count(),
+        "loop": opts.loop,
+        "http": opts.http,
+        "drivers": opts.drivers,
+        "concurrency_per_driver": opts.concurrency,
+        "requests": opts.requests,
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument(
+        "--workers",
+        type=lambda s: [int(n) for n in s.split(",")],
+        default=[1, 2, 4],
+    )
+    p.add_argument("--drivers", type=int, default=4)
+    p.add_argument("--requests", type=int, default=4000)
+    p.add_argument("--concurrency", type=int, default=16)
+    p.add_argument("--seed-tickets", type=int, default=50)
+    p.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    p.add_argument("--loop", default="uvloop")
+    p.add_argument("--http", default="httptools")
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--port", type=int, default=8865)
+    p.add_argument("--dir", default=".", help="where to put the SQLite files")
+    opts = p.parse_args(argv)
+    print(json.dumps(asyncio.run(run(opts)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
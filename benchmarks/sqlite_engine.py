@@ -0,0 +1,144 @@
+"""
+Mixed read/write throughput of the SQLite repository with the default
+engine vs the tuned one from app.db.engine (WAL + pragmas + sized pool).
+
+Several OS processes share one database file, like uvicorn workers sharing
+tickets.db.  Prints one JSON document with ops/s per configuration.
+
+    python -m benchmarks.sqlite_engine --processes 4 --seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing as mp
+import os
+import random
+import tempfile
+import time
+from typing import List
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.exc import OperationalError
+
+from app.adapters.repos.sqlite_repo import SQLiteTicketRepository
+from app.core.models import Status, Ticket
+from app.db.engine import build_engine
+from app.db.init_db import create_schema
+
+
+def _engine(url: str, mode: str):
+    if mode == "baseline":  # what app/db/engine.py used to build
+        return create_async_engine(url, echo=False, future=True)
+    return build_engine(url)
+
+
+async def _seed(url: str, rows: int) -> List[str]:
+    engine = _engine(url, "tuned")
+    await create_schema(engine)
+    repo = SQLiteTicketRepository(engine)
+    tickets = [Ticket(title=f"seed {i}", description="x") for i in range(rows)]
+    await repo.add_many(tickets)
+    await engine.dispose()
+    return [str(t.id) for t in tickets]
+
+
+async def _worker(url, mode, ids, seconds, concurrency, write_ratio):
+    from uuid import UUID
+
+    engine = _engine(url, mode)
+    repo = SQLiteTicketRepository(engine)
+    ids = [UUID(i) for i in ids]
+    deadline = time.perf_counter() + seconds
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+
+    async def _loop():
+        rnd = random.Random()
+        while time.perf_counter() < deadline:
+            try:
+                if rnd.random() < write_ratio:
+                    if rnd.random() < 0.5:
+                        await repo.add(Ticket(title="bench", description="x"))
+                    else:
+                        t = await repo.get(rnd.choice(ids))
+                        if t is not None:
+                            t.status = rnd.choice(list(Status))
+                            await repo.update(t)
+                    counts["writes"] += 1
+                else:
+                    if rnd.random() < 0.5:
+                        await repo.get(rnd.choice(ids))
+                    else:
+                        await repo.list(limit=50)
+                    counts["reads"] += 1
+            except OperationalError:  # "database is locked"
+                counts["errors"] += 1
+
+    await asyncio.gather(*(_loop() for _ in range(concurrency)))
+    await engine.dispose()
+    return counts
+
+
+def _process_main(args, out):
+    out.put(asyncio.run(_worker(*args)))
+
+
+def run(mode: str, opts) -> dict:
+    with tempfile.TemporaryDirectory(dir=opts.dir) as tmp:
+        url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+        ids = asyncio.run(_seed(url, opts.rows))
+        out: mp.Queue = mp.Queue()
+        procs = [
+            mp.Process(
+                target=_process_main,
+                args=(
+                    (
+                        url,
+                        mode,
+                        ids,
+                        opts.seconds,
+                        opts.concurrency,
+                        opts.write_ratio,
+                    ),
+                    out,
+                ),
+            )
+            for _ in range(opts.processes)
+        ]
+        for p in procs:
+            p.start()
+        results = [out.get() for _ in procs]
+        for p in procs:
+            p.join()
+
+    total = {k: sum(r[k] for r in results) for k in results[0]}
+    ops = total["reads"] + total["writes"]
+    return {**total, "ops_per_s": round(ops / opts.seconds, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument(
+        "--dir",
+        default=".",
+        help="where to create the database (use a real disk, not tmpfs)",
+    )
+    opts = parser.parse_args()
+
+    report = {
+        "config": vars(opts),
+        "baseline": run("baseline", opts),
+        "tuned": run("tuned", opts),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
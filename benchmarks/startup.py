@@ -0,0 +1,79 @@
+"""
+Cold-start cost of the API process, measured in fresh interpreters.
+
+    import       `import app.main`: what a uvicorn worker / --reload cycle /
+                 pytest session pays before it can serve anything
+    eager        import + building the LLM classifier right away, i.e. what
+                 every start paid when the adapters were wired at import time
+    warm_up      only the deferred build, now done in the background (or on
+                 the first ticket) by LazyPriorityClassifier
+
+The LLM path is forced (CLASSIFIER=langgraph with a dummy key); nothing
+is sent over the network.
+
+    python -m benchmarks.startup --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+_PROBE = """
+import asyncio, json, time
+t0 = time.perf_counter()
+import app.main
+from app.adaptors_stub import build_container
+t1 = time.perf_counter()
+asyncio.run(build_container().warm_up_classifier())
+t2 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "warm_up": t2 - t1}))
+"""
+
+
+def probe(env: Dict[str, str]) -> Dict[str, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    sample = json.loads(out.strip().splitlines()[-1])
+    sample["eager"] = sample["import"] + sample["warm_up"]
+    return sample
+
+
+def summarise(samples: List[Dict[str, float]]) -> Dict[str, dict]:
+    return {
+        key: {
+            "median_s": round(statistics.median(s[key] for s in samples), 3),
+            "min_s": round(min(s[key] for s in samples), 3),
+        }
+        for key in ("import", "eager", "warm_up")
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    opts = parser.parse_args()
+
+    env = {
+        **os.environ,
+        "CLASSIFIER": "langgraph",
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY") or "sk-startup-bench",
+        "PYTHONDONTWRITEBYTECODE": "0",
+    }
+    probe(env)  # populate __pycache__ so every run measures the same thing
+    samples = [probe(env) for _ in range(opts.runs)]
+    print(json.dumps({"runs": opts.runs, **summarise(samples)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+LLM calls and classification latency with and without the local
+pre-classifier (app/adapters/llm/tiered.py).
+
+Synthetic tickets ("<subject> <symptom>") are labelled by an "oracle
+LLM": a fake that knows the true priority and sleeps like a real call.
+The naive Bayes stage is trained on past tickets that never show some of
+the symptoms.  New tickets, unseen symptoms included, are then classified
+by
+
+    llm          every ticket goes to the LLM (what CLASSIFIER=langgraph does)
+    rules        KeywordRules first, the LLM for the rest
+    rules+model  KeywordRules, then the trained model, then the LLM
+
+For each it reports the LLM calls, the escalation rate, the accuracy
+against the oracle and p50/p95 latency.
+
+    python -m benchmarks.tiered --tickets 4000 --llm-latency-ms 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.adapters.llm.local_model import NaiveBayesPriorityModel
+from app.adapters.llm.rules import KeywordRules
+from app.adapters.llm.tiered import TieredPriorityClassifier
+from app.core.models import Priority
+from app.core.ports import PriorityClassifierPort
+from benchmarks.load import percentile
+
+SUBJECTS = (
+    "checkout",
+    "login",
+    "search",
+    "dashboard",
+    "billing",
+    "export",
+    "settings page",
+    "mobile app",
+    "api",
+    "notifications",
+)
+# symptom phrases per true priority.  Some carry keywords the rules know,
+# some only words the model can learn, some mislead (a LOW "error").
+SYMPTOMS = {
+    Priority.HIGH: (
+        "crashes for every user",
+        "returns 503 on every request",
+        "rejects all card payments",
+        "is unreachable since the deploy",
+        "lost today's orders",
+        "shows an error and nobody can continue",
+        "leaks other customers' data",
+        "is completely down in eu-west",
+        "charges customers twice",
+        "throws 500 for all requests",
+    ),
+    Priority.MEDIUM: (
+        "is slow, pages take ten seconds",
+        "is delayed by several hours",
+        "times out for large accounts",
+        "fails intermittently, a few times per hour",
+        "shows stale data after sync",
+        "sends duplicate emails to some users",
+        "breaks for customers with long names",
+        "ignores the saved filters now and then",
+        "loses the sort order after refresh",
+    ),
+    Priority.LOW: (
+        "has a typo in the header",
+        "uses the old colour palette",
+        "has confusing tooltip wording",
+        "needs a dark mode, feature request",
+        "has an icon misaligned by two pixels",
+        "error text could be friendlier",
+        "should remember the last tab",
+        "footer links should open in a new tab",
+        "has inconsistent capitalisation",
+    ),
+}
+# the model never sees the last symptoms of each tier during training
+UNSEEN_PER_TIER = 3
+FILLER = (
+    "reported by support",
+    "seen in production",
+    "customer ticket #{n}",
+    "happens on chrome and firefox",
+    "since yesterday's release",
+    "",
+)
+
+Sample = Tuple[str, str, Priority]
+
+
+def make_corpus(n: int, seed: int, *, unseen: bool) -> List[Sample]:
+    rnd = random.Random(seed)
+    weights = {Priority.HIGH: 2, Priority.MEDIUM: 3, Priority.LOW: 5}
+    out = []
+    for i in range(n):
+        priority = rnd.choices(list(weights), list(weights.values()))[0]
+        symptoms = SYMPTOMS[priority]
+        if not unseen:
+            symptoms = symptoms[:-UNSEEN_PER_TIER]
+        subject, symptom = rnd.choice(SUBJECTS), rnd.choice(symptoms)
+        filler = rnd.choice(FILLER).format(n=i)
+        title = f"{subject.capitalize()} {symptom.split(',')[0]}"
+        out.append((title, f"The {subject} {symptom}. {filler}", priority))
+    return out
+
+
+class OracleLLM(PriorityClassifierPort):
+    """Knows the right answer; costs latency ± 25 %."""
+
+    def __init__(self, truth: Dict[Tuple[str, str], Priority], ms: float):
+        self._truth = truth
+        self._latency_s = ms / 1000.0
+        self.calls = 0
+
+    async def classify(self, title: str, description: str) -> Priority:
+        self.calls += 1
+        await asyncio.sleep(self._latency_s * random.uniform(0.75, 1.25))
+        return self._truth[(title, description)]
+
+
+async def _measure(
+    name: str,
+    classifier: PriorityClassifierPort,
+    llm: OracleLLM,
+    samples: List[Sample],
+    concurrency: int,
+) -> dict:
+    latencies: List[float] = []
+    correct = 0
+    gate = asyncio.Semaphore(concurrency)
+
+    async def _one(title: str, description: str, truth: Priority) -> None:
+        nonlocal correct
+        async with gate:
+            start = time.perf_counter()
+            priority = await classifier.classify(title, description)
+            latencies.append(time.perf_counter() - start)
+        correct += priority == truth
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_one(*s) for s in samples))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "mode": name,
+        "llm_calls": llm.calls,
+        "escalation_rate": round(llm.calls / len(samples), 3),
+        "accuracy": round(correct / len(samples), 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "elapsed_s": round(elapsed, 2),
+    }
+
+
+async def run(opts) -> dict:
+    # past tickets, already labelled by the LLM, train the model
+    train = make_corpus(opts.tickets, opts.seed, unseen=False)
+    model = NaiveBayesPriorityModel.fit(train)
+    test = make_corpus(opts.tickets, opts.seed + 1, unseen=True)
+    truth = {(t, d): p for t, d, p in test}
+
+    results = []
+    for name, stages in (
+        ("llm", None),
+        ("rules", [KeywordRules()]),
+        ("rules+model", [KeywordRules(), model]),
+    ):
+        llm = OracleLLM(truth, opts.llm_latency_ms)
+        classifier: PriorityClassifierPort = llm
+        if stages is not None:
+            classifier = TieredPriorityClassifier(
+                stages, llm, min_confidence=opts.min_confidence
+            )
+        results.append(
+            await _measure(name, classifier, llm, test, opts.concurrency)
+        )
+    return {
+        "tickets": len(test),
+        "llm_latency_ms": opts.llm_latency_ms,
+        "min_confidence": opts.min_confidence,
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--tickets", type=int, default=4000)
+    p.add_argument("--llm-latency-ms", type=float, default=400.0)
+    p.add_argument("--concurrency", type=int, default=64)
+    p.add_argument("--min-confidence", type=float, default=0.9)
+    p.add_argument("--seed", type=int, default=42)
+    opts = p.parse_args(argv)
+    print(json.dumps(asyncio.run(run(opts)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Streamlit UI for the FastAPI “Ticket Service”.
 
 from __future__ import annotations
 
+import json
 import os
 from functools import partial
 from typing import Any, Dict, List, Sequence
@@ -29,6 +30,9 @@ defaults: Dict[str, Any] = dict(
     selected_id=None,
     confirm_delete_id=None,  # if not None → show confirmation box
     deleted_tickets=[],  # per-session recycle bin
+    tickets=None,  # cached list, kept current from GET /tickets/events
+    tickets_filters=None,  # (status, priority) the cached list was built for
+    last_event_id=None,
 )
 for k, v in defaults.items():
     st.session_state.setdefault(k, v)
@@ -112,20 +116,92 @@ def ui_create_ticket() -> None:
 ###############################################################################
 STATUSES: Sequence[str] = ("OPEN", "IN_PROGRESS", "CLOSED")
 PRIORITIES: Sequence[str] = ("LOW", "MEDIUM", "HIGH", "TBD")
+PAGE_SIZE = 500  # the API's maximum `limit`
 
 
 def _fetch_ticket_list() -> List[Dict[str, Any]]:
-    params: Dict[str, str] = {}
+    """Every matching ticket: follows X-Next-Cursor to the last page."""
+    params: Dict[str, Any] = {"limit": PAGE_SIZE}
     if st.session_state.status_filter != "ALL":
         params["status_filter"] = st.session_state.status_filter
     if st.session_state.priority_filter != "ALL":
         params["priority_filter"] = st.session_state.priority_filter
 
-    r = api_get("/tickets", params=params)
+    tickets: List[Dict[str, Any]] = []
+    while True:
+        r = api_get("/tickets", params=params)
+        if r.status_code != 200:
+            st.error(f"Backend error {r.status_code}: {r.text}")
+            st.stop()
+        tickets.extend(r.json())
+        cursor = r.headers.get("X-Next-Cursor")
+        if not cursor:
+            return tickets
+        params["cursor"] = cursor
+
+
+def _matches_filters(ticket: Dict[str, Any]) -> bool:
+    return st.session_state.status_filter in (
+        "ALL",
+        ticket["status"],
+    ) and st.session_state.priority_filter in ("ALL", ticket["priority"])
+
+
+def _read_events() -> List[tuple[str, str, Dict[str, Any]]]:
+    """Changes since `last_event_id` as (id, event, data), oldest first."""
+    headers = {}
+    if st.session_state.last_event_id:
+        headers["Last-Event-ID"] = st.session_state.last_event_id
+    r = api_get("/tickets/events", params={"once": "true"}, headers=headers)
     if r.status_code != 200:
-        st.error(f"Backend error {r.status_code}: {r.text}")
-        st.stop()
-    return r.json()
+        return [("", "reset", {})]
+    events = []
+    for block in r.text.split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines() if ": " in line
+        )
+        if "event" in fields:
+            events.append(
+                (fields["id"], fields["event"], json.loads(fields["data"]))
+            )
+    return events
+
+
+def _synced_ticket_list() -> List[Dict[str, Any]]:
+    """
+    The full list is fetched once (and again on filter change or `reset`);
+    every later rerun only replays the change events since the last one.
+    """
+    filters = (
+        st.session_state.status_filter,
+        st.session_state.priority_filter,
+    )
+    events = _read_events()
+    if events:
+        st.session_state.last_event_id = events[-1][0] or None
+    tickets = st.session_state.tickets
+    if (
+        tickets is None
+        or st.session_state.tickets_filters != filters
+        or any(kind == "reset" for _, kind, _ in events)
+    ):
+        tickets = _fetch_ticket_list()
+        st.session_state.tickets_filters = filters
+        # deltas that raced with the fetch are re-applied below; harmless
+        events = [e for e in events if e[1] != "reset"]
+
+    by_id = {t["id"]: t for t in tickets}
+    for _, kind, data in events:
+        current = by_id.get(data["id"])
+        if kind == "deleted" or not _matches_filters(data):
+            by_id.pop(data["id"], None)
+        elif current is None or data["version"] >= current["version"]:
+            by_id[data["id"]] = data
+    tickets = sorted(
+        by_id.values(), key=lambda t: (t["created_at"], t["id"]), reverse=True
+    )
+    st.session_state.tickets = tickets
+    return tickets
 
 
 ###############################################################################
@@ -159,7 +235,7 @@ def ui_browse_tickets() -> None:
             on_change=_clear_selection,
         )
 
-    tickets = _fetch_ticket_list()
+    tickets = _synced_ticket_list()
     if not tickets:
         st.info("No tickets match the selected filters.")
         return
@@ -179,8 +255,10 @@ def ui_browse_tickets() -> None:
     if not tid:
         return
 
-    # ── details ───────────────────────────────────────────────────────────
-    detail = api_get(f"/tickets/{tid}").json()
+    # ── details (already current thanks to the change stream) ─────────────
+    detail = next((t for t in tickets if t["id"] == tid), None)
+    if detail is None:
+        return
     st.subheader("Details")
     st.json(detail)
 
@@ -201,11 +279,18 @@ def ui_browse_tickets() -> None:
                     "description": udesc,
                     "status": ustatus,
                 },
+                # only overwrite the version we displayed
+                headers={"If-Match": f'"{detail["version"]}"'},
             )
             if pr.status_code == 200:
                 st.success("Ticket updated ✔")
                 st.session_state.reset_selected = True
                 st.rerun()
+            elif pr.status_code == 412:
+                st.warning(
+                    "Someone else changed this ticket meanwhile — "
+                    "reload it and apply your edit again."
+                )
             else:
                 st.error(f"Update failed: {pr.status_code} – {pr.text}")
 
@@ -1,8 +1,11 @@
+import asyncio
+
 import pytest
 import pytest_asyncio
 import httpx
 from httpx import AsyncClient
 from fastapi import FastAPI
+from app.db.engine import build_engine
 
 from app.main import create_application
 from app.adapters.repos.in_memory_repo import InMemoryTicketRepository
@@ -10,18 +13,70 @@ from app.core.models import Priority
 from app.core.ports import PriorityClassifierPort
 from app.core.service import TicketService
 from app.api.deps import get_ticket_service
+from app.db.init_db import create_schema
 
 
 # tests/conftest.py
 class StubPriorityClassifier(PriorityClassifierPort):
+    """
+    Stand-in for the LLM.  Answers by keyword unless scripted: call n gets
+    `answers[n]` after `latencies[n]` seconds (the last entry repeats, an
+    exception is raised).  Counts calls, cancellations and concurrency.
+    """
+
+    def __init__(self, answers=(), latencies=(0.0,)) -> None:
+        self._answers = list(answers)
+        self._latencies = list(latencies)
+        self._first = 0  # call number that gets answers[0]
+        self.calls = 0
+        self.cancelled = 0
+        self.active = 0
+        self.max_active = 0
+
+    def script(self, *answers) -> None:
+        """Answer the next calls (and every one after) with these."""
+        self._answers = list(answers)
+        self._first = self.calls
+
     async def classify(self, title: str, description: str) -> Priority:
-        txt = f"{title} {description}".lower()
-        if any(
-            word in txt for word in ("glitch", "typo", "cosmetic", "button")
-        ):
-            return Priority.LOW
-        # default fallback
-        return Priority.MEDIUM
+        n = self.calls
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            latency = self._latencies[min(n, len(self._latencies) - 1)]
+            if latency:
+                await asyncio.sleep(latency)
+            if not self._answers:
+                return _by_keyword(f"{title} {description}".lower())
+            answer = self._answers[
+                min(n - self._first, len(self._answers) - 1)
+            ]
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+
+
+def _by_keyword(txt: str) -> Priority:
+    if any(word in txt for word in ("glitch", "typo", "cosmetic", "button")):
+        return Priority.LOW
+    # default fallback
+    return Priority.MEDIUM
+
+
+class FakeClock:
+    """A clock the test moves by hand (seconds, or datetimes)."""
+
+    def __init__(self, start=0.0) -> None:
+        self.now = start
+
+    def __call__(self):
+        return self.now
 
 
 @pytest.fixture(name="app")
@@ -47,3 +102,12 @@ async def client(app: FastAPI):
     transport = httpx.ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+
+@pytest_asyncio.fixture(name="sqlite_engine")
+async def sqlite_engine(tmp_path):
+    """Throw-away SQLite file with the production schema applied."""
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path}/tickets.db")
+    await create_schema(engine)
+    yield engine
+    await engine.dispose()
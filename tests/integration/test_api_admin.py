@@ -0,0 +1,121 @@
+"""
+CLASSIFY_MODE=queue end to end: tickets are stored as TBD with a durable
+job, POST /admin/reclassify queues more, and the job worker drains them.
+"""
+
+import dataclasses
+
+import httpx
+import pytest
+from httpx import AsyncClient
+
+import app.main as main_module
+from app.config import Settings
+from app.core.models import Priority
+from app.main import create_application
+from app.workers.classify import JobRunner
+
+
+class FlakyClassifier:
+    """No answer (TBD) for the first `failures` calls, then a fixed one."""
+
+    def __init__(self, failures: int, answer: Priority) -> None:
+        self.failures = failures
+        self.answer = answer
+        self.calls = 0
+
+    async def classify(self, title: str, description: str) -> Priority:
+        self.calls += 1
+        if self.calls <= self.failures:
+            return Priority.TBD
+        return self.answer
+
+
+@pytest.fixture(name="settings")
+def settings(sqlite_engine, monkeypatch):
+    wired = dataclasses.replace(
+        Settings(),
+        database_url=str(sqlite_engine.url),
+        classifier="fake",
+        classify_mode="queue",
+        classify_job_backoff_s=0,
+        classify_cache_size=0,
+        similarity_index_size=0,
+        stats_reconcile_s=0,
+        metrics_enabled=False,
+    )
+    monkeypatch.setattr(main_module, "get_settings", lambda: wired)
+    return wired
+
+
+@pytest.mark.asyncio
+async def test_queue_mode_and_bulk_reclassification(settings, monkeypatch):
+    application = create_application()
+    async with application.router.lifespan_context(application):
+        container = application.state.container
+        runner = JobRunner(container.jobs, container.service, batch_size=2)
+        transport = httpx.ASGITransport(app=application)
+        async with AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            created = await client.post(
+                "/tickets", json={"title": "Site down", "description": "500"}
+            )
+            assert created.json()["priority"] == "TBD"
+            assert (await client.get("/admin/jobs")).json()["queued"] == 1
+
+            assert await runner.run_until_idle() == 1
+            ticket_id = created.json()["id"]
+            fetched = await client.get(f"/tickets/{ticket_id}")
+            assert fetched.json()["priority"] == "HIGH"
+
+            # a new prompt that needs two tries to answer
+            flaky = FlakyClassifier(failures=1, answer=Priority.LOW)
+            monkeypatch.setattr(container.service, "_classifier", flaky)
+            reclassify = await client.post(
+                "/admin/reclassify", json={"priority": "HIGH"}
+            )
+            assert reclassify.status_code == 202
+            assert reclassify.json() == {"queued": 1}
+            assert (
+                await client.post("/admin/reclassify", json={"priority": "X"})
+            ).status_code == 422
+
+            await runner.run_until_idle()
+            assert runner.stats() == {"done": 2, "failed": 1, "lost": 0}
+            fetched = await client.get(f"/tickets/{ticket_id}")
+            assert fetched.json()["priority"] == "LOW"
+            stats = (await client.get("/admin/jobs")).json()
+            assert (stats["queued"], stats["done"], stats["dead"]) == (0, 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_jobs_are_dead_lettered_after_max_attempts(
+    settings, monkeypatch
+):
+    settings = dataclasses.replace(settings, classify_job_max_attempts=2)
+    monkeypatch.setattr(main_module, "get_settings", lambda: settings)
+    application = create_application()
+    async with application.router.lifespan_context(application):
+        container = application.state.container
+        monkeypatch.setattr(
+            container.service, "_classifier", FlakyClassifier(10, Priority.LOW)
+        )
+        ticket = await container.service.create_ticket("t", "d")
+        runner = JobRunner(container.jobs, container.service)
+
+        await runner.run_until_idle()
+        stats = await container.jobs.stats()
+        assert stats["dead"] == 1 and stats["queued"] == 0
+        assert runner.stats()["failed"] == 2
+        stored = await container.service.get_ticket(ticket.id)
+        assert stored.priority == Priority.TBD
+
+    # a restart's requeue of TBD tickets leaves the dead job alone
+    application = create_application()
+    async with application.router.lifespan_context(application):
+        container = application.state.container
+        assert await container.service.requeue_unclassified() == 1
+        stats = await container.jobs.stats()
+        assert stats["dead"] == 1 and stats["queued"] == 0
+        assert await container.jobs.retry_dead() == 1
@@ -0,0 +1,155 @@
+"""POST /tickets/bulk with JSON arrays and NDJSON streams."""
+
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from app.api import bulk
+from app.api.deps import get_ticket_service
+
+
+@pytest.mark.asyncio
+async def test_json_array_reports_every_item(client: AsyncClient):
+    payload = [
+        {"title": "UI glitch", "description": "button misaligned"},
+        {"title": "missing description"},
+        {"title": "Payments", "description": "card declined"},
+    ]
+    r = await client.post("/tickets/bulk", json=payload)
+    assert r.status_code == 200
+    body = r.json()
+
+    assert (body["created"], body["failed"]) == (2, 1)
+    assert [i["index"] for i in body["items"]] == [0, 1, 2]
+    assert body["items"][0]["priority"] == "LOW"
+    assert body["items"][1]["ok"] is False
+    assert "description" in body["items"][1]["error"]
+
+    listed = {t["id"] for t in (await client.get("/tickets")).json()}
+    assert {body["items"][0]["id"], body["items"][2]["id"]} <= listed
+
+
+@pytest.mark.asyncio
+async def test_ndjson_stream(client: AsyncClient):
+    lines = [
+        json.dumps({"title": f"t{i}", "description": "d"}) for i in range(5)
+    ]
+    lines.insert(2, "{not json")
+    r = await client.post(
+        "/tickets/bulk",
+        content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert r.status_code == 200
+    body = r.json()
+    assert (body["created"], body["failed"]) == (5, 1)
+    assert body["items"][2] == {
+        "index": 2,
+        "ok": False,
+        "id": None,
+        "priority": None,
+        "error": "invalid JSON line",
+    }
+
+
+@pytest.mark.asyncio
+async def test_non_array_body_is_rejected(client: AsyncClient):
+    r = await client.post("/tickets/bulk", json={"title": "x"})
+    assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_ndjson_past_the_limit_stops_with_413(
+    client: AsyncClient, monkeypatch
+):
+    monkeypatch.setattr(bulk, "MAX_BULK_ITEMS", 3)
+    read = []
+
+    async def _lines():
+        for i in range(100):
+            read.append(i)
+            yield (
+                json.dumps({"title": f"t{i}", "description": "d"}) + "\n"
+            ).encode()
+
+    r = await client.post(
+        "/tickets/bulk",
+        content=_lines(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert r.status_code == 413
+    assert "first 3" in r.json()["detail"]
+    assert len(read) < 100  # the rest of the body was never read
+    assert len((await client.get("/tickets")).json()) == 3
+
+
+@pytest.mark.asyncio
+async def test_an_overlong_ndjson_line_stops_with_413(
+    client: AsyncClient, monkeypatch
+):
+    monkeypatch.setattr(bulk, "MAX_BULK_LINE_BYTES", 100)
+    first = json.dumps({"title": "t", "description": "d"}).encode() + b"\n"
+    read = []
+
+    async def _chunks():
+        for i in range(0, len(first), 5):  # lines span chunks
+            yield first[i : i + 5]
+        for i in range(1000):  # then one endless line
+            read.append(i)
+            yield b"x" * 10
+
+    r = await client.post(
+        "/tickets/bulk",
+        content=_chunks(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert r.status_code == 413
+    assert "line 2" in r.json()["detail"]
+    assert len(read) < 20
+    assert len((await client.get("/tickets")).json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_json_bodies_are_capped_before_parsing(
+    client: AsyncClient, monkeypatch
+):
+    monkeypatch.setattr(bulk, "MAX_BULK_BODY_BYTES", 100)
+    payload = [{"title": f"t{i}", "description": "d"} for i in range(10)]
+    r = await client.post("/tickets/bulk", json=payload)
+    assert r.status_code == 413
+    assert "NDJSON" in r.json()["detail"]
+
+    read = []
+
+    async def _chunks():  # no Content-Length
+        for i in range(1000):
+            read.append(i)
+            yield b"[" if i == 0 else b' {"title": "t"},'
+
+    r = await client.post(
+        "/tickets/bulk",
+        content=_chunks(),
+        headers={"Content-Type": "application/json"},
+    )
+    assert r.status_code == 413
+    assert len(read) < 20
+    assert (await client.get("/tickets")).json() == []
+
+
+@pytest.mark.asyncio
+async def test_storage_errors_are_logged_per_chunk(
+    client: AsyncClient, app, monkeypatch, caplog
+):
+    async def _broken(items):
+        raise RuntimeError("disk full")
+
+    service = app.dependency_overrides[get_ticket_service]()
+    monkeypatch.setattr(service, "create_tickets", _broken)
+    app.dependency_overrides[get_ticket_service] = lambda: service
+
+    r = await client.post(
+        "/tickets/bulk", json=[{"title": "t", "description": "d"}]
+    )
+    assert r.json()["items"][0]["error"] == "storage error"
+    assert "disk full" in caplog.text
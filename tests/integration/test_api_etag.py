@@ -0,0 +1,51 @@
+"""Optimistic concurrency on the router: ETag, If-Match, If-None-Match."""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_conditional_patch_and_delete(client: AsyncClient):
+    r = await client.post("/tickets", json={"title": "t", "description": "d"})
+    tid, etag = r.json()["id"], r.headers["ETag"]
+    assert etag == '"1"'
+
+    # two clients edit the same version: the second one loses
+    first = await client.patch(
+        f"/tickets/{tid}",
+        json={"status": "CLOSED"},
+        headers={"If-Match": etag},
+    )
+    assert first.status_code == 200
+    assert first.headers["ETag"] == '"2"' and first.json()["version"] == 2
+
+    second = await client.patch(
+        f"/tickets/{tid}", json={"title": "x"}, headers={"If-Match": etag}
+    )
+    assert second.status_code == 412
+
+    stale = await client.delete(f"/tickets/{tid}", headers={"If-Match": etag})
+    assert stale.status_code == 412
+    fresh = await client.delete(
+        f"/tickets/{tid}", headers={"If-Match": first.headers["ETag"]}
+    )
+    assert fresh.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_and_unknown_ids(client: AsyncClient):
+    r = await client.post("/tickets", json={"title": "t", "description": "d"})
+    tid = r.json()["id"]
+
+    r = await client.get(f"/tickets/{tid}", headers={"If-None-Match": '"1"'})
+    assert r.status_code == 304
+
+    missing = "00000000-0000-0000-0000-000000000000"
+    r = await client.patch(
+        f"/tickets/{missing}", json={"title": "x"}, headers={"If-Match": '"1"'}
+    )
+    assert r.status_code == 404
+    r = await client.patch(
+        f"/tickets/{tid}", json={"title": "x"}, headers={"If-Match": "junk"}
+    )
+    assert r.status_code == 412
@@ -0,0 +1,72 @@
+"""GET /tickets/export: streamed NDJSON, CSV and Parquet."""
+
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+
+
+async def _seed(client: AsyncClient, n: int = 5):
+    ids = []
+    for i in range(n):
+        r = await client.post(
+            "/tickets", json={"title": f"t{i}", "description": 'd, "q"'}
+        )
+        ids.append(r.json()["id"])
+    await client.patch(f"/tickets/{ids[0]}", json={"status": "CLOSED"})
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_matches_list(client: AsyncClient):
+    await _seed(client)
+    listed = (await client.get("/tickets")).json()
+
+    r = await client.get("/tickets/export")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert [row["id"] for row in rows] == [t["id"] for t in listed]
+    assert rows[0].keys() == listed[0].keys()
+
+
+@pytest.mark.asyncio
+async def test_csv_export_with_filter(client: AsyncClient):
+    ids = await _seed(client)
+
+    r = await client.get(
+        "/tickets/export",
+        params={"format": "csv", "status_filter": "CLOSED"},
+    )
+    assert r.status_code == 200
+    assert "tickets.csv" in r.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(r.text)))
+    assert [row["id"] for row in rows] == [ids[0]]
+    assert rows[0]["description"] == 'd, "q"'
+
+    r = await client.get(
+        "/tickets/export", params={"format": "csv", "priority_filter": "HIGH"}
+    )
+    assert r.text.strip() == ",".join(
+        csv.DictReader(io.StringIO(r.text)).fieldnames
+    )
+
+
+@pytest.mark.asyncio
+async def test_parquet_export(client: AsyncClient):
+    pq = pytest.importorskip("pyarrow.parquet")
+    await _seed(client)
+
+    r = await client.get("/tickets/export", params={"format": "parquet"})
+    assert r.status_code == 200
+    table = pq.read_table(io.BytesIO(r.content))
+    assert table.num_rows == 5
+    assert table.column("version").to_pylist().count(2) == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_format_is_rejected(client: AsyncClient):
+    r = await client.get("/tickets/export", params={"format": "xlsx"})
+    assert r.status_code == 422
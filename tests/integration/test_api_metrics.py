@@ -0,0 +1,18 @@
+"""GET /metrics through the real app and its middleware."""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_templates(client: AsyncClient):
+    r = await client.post("/tickets", json={"title": "t", "description": "d"})
+    await client.get(f"/tickets/{r.json()['id']}")
+
+    r = await client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_requests_total{method="GET",route="/tickets/{ticket_id}",'
+        'status="200"}' in r.text
+    )
@@ -0,0 +1,33 @@
+"""GET /tickets pages through results with an opaque cursor header."""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_list_is_bounded_and_cursor_walks_all_pages(client: AsyncClient):
+    created = set()
+    for i in range(5):
+        r = await client.post(
+            "/tickets", json={"title": f"ticket {i}", "description": "x"}
+        )
+        created.add(r.json()["id"])
+
+    seen, params = [], {"limit": 2}
+    while True:
+        r = await client.get("/tickets", params=params)
+        assert r.status_code == 200
+        assert len(r.json()) <= 2
+        seen.extend(t["id"] for t in r.json())
+        cursor = r.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        params["cursor"] = cursor
+
+    assert len(seen) == len(created) and set(seen) == created
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_and_limit_are_rejected(client: AsyncClient):
+    assert (await client.get("/tickets?cursor=bogus")).status_code == 400
+    assert (await client.get("/tickets?limit=0")).status_code == 422
@@ -0,0 +1,35 @@
+"""GET /tickets/search: ranked full-text hits with cursor paging."""
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_search_pages_through_ranked_hits(client: AsyncClient):
+    for i in range(5):
+        await client.post(
+            "/tickets",
+            json={"title": f"VPN drops #{i}", "description": "after update"},
+        )
+    await client.post(
+        "/tickets", json={"title": "Email", "description": "vpn unrelated?"}
+    )
+
+    seen, params = [], {"q": "vpn", "limit": 4}
+    while True:
+        r = await client.get("/tickets/search", params=params)
+        assert r.status_code == 200
+        seen.extend(t["title"] for t in r.json())
+        cursor = r.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        params["cursor"] = cursor
+
+    assert len(seen) == 6 and seen[-1] == "Email"  # title hits rank first
+
+
+@pytest.mark.asyncio
+async def test_search_validation(client: AsyncClient):
+    assert (await client.get("/tickets/search")).status_code == 422
+    r = await client.get("/tickets/search", params={"q": "x", "cursor": "!"})
+    assert r.status_code == 400
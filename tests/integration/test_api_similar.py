@@ -0,0 +1,50 @@
+"""GET /tickets/{id}/similar: nearest neighbours from the local index."""
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.adapters.repos.in_memory_repo import InMemoryTicketRepository
+from app.adapters.similarity import SimilarityIndex
+from app.api.deps import get_ticket_service
+from app.core.service import TicketService
+from tests.conftest import StubPriorityClassifier
+
+
+@pytest.fixture(name="app")
+def app(app: FastAPI) -> FastAPI:
+    service = TicketService(
+        repository=InMemoryTicketRepository(),
+        classifier=StubPriorityClassifier(),
+        similarity_index=SimilarityIndex(100),
+    )
+    app.dependency_overrides[get_ticket_service] = lambda: service
+    return app
+
+
+@pytest.mark.asyncio
+async def test_similar_returns_closest_tickets_with_scores(
+    client: AsyncClient,
+):
+    ids = []
+    for title, description in (
+        ("Button misaligned", "the save button overlaps the footer"),
+        ("Save button misaligned", "save button overlaps footer on mobile"),
+        ("Database down", "all writes fail with timeout"),
+    ):
+        r = await client.post(
+            "/tickets", json={"title": title, "description": description}
+        )
+        ids.append(r.json()["id"])
+
+    r = await client.get(f"/tickets/{ids[0]}/similar", params={"limit": 5})
+    assert r.status_code == 200
+    body = r.json()
+    assert [t["id"] for t in body] == [ids[1]]
+    assert 0.5 < body[0]["similarity"] < 1.0
+    assert body[0]["priority"] == "LOW"
+
+    assert (await client.get(f"/tickets/{ids[2]}/similar")).json() == []
+    missing = "00000000-0000-0000-0000-000000000000"
+    r = await client.get(f"/tickets/{missing}/similar")
+    assert r.status_code == 404
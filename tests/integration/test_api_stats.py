@@ -0,0 +1,36 @@
+"""GET /tickets/stats: bucket counts and per-day histograms."""
+
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_stats_shape_and_counts(client: AsyncClient):
+    ids = []
+    for title in ("Button glitch", "Server down", "Login broken"):
+        r = await client.post(
+            "/tickets", json={"title": title, "description": "d"}
+        )
+        ids.append(r.json()["id"])
+    await client.patch(f"/tickets/{ids[1]}", json={"status": "CLOSED"})
+
+    r = await client.get("/tickets/stats", params={"days": 7})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["total"] == 3
+    assert body["by_status"] == {"OPEN": 2, "IN_PROGRESS": 0, "CLOSED": 1}
+    assert body["by_priority"]["LOW"] == 1
+    assert body["by_status_priority"]["CLOSED"]["MEDIUM"] == 1
+
+    today = datetime.now(timezone.utc).date().isoformat()
+    assert len(body["created_per_day"]) == 7
+    assert body["created_per_day"][-1] == {"day": today, "count": 3}
+    assert body["closed_per_day"][-1] == {"day": today, "count": 1}
+
+
+@pytest.mark.asyncio
+async def test_stats_window_is_bounded(client: AsyncClient):
+    assert (await client.get("/tickets/stats?days=0")).status_code == 422
+    assert (await client.get("/tickets/stats?days=367")).status_code == 422
@@ -0,0 +1,119 @@
+"""
+Two containers on one SQLite file stand in for two uvicorn workers: the
+writes of one must reach the other's cache, counters, index and events.
+"""
+
+import dataclasses
+
+import pytest
+
+from app.adaptors_stub import build_container
+from app.config import Settings
+from app.core.models import Status
+
+
+@pytest.fixture(name="settings")
+def settings(sqlite_engine):
+    return dataclasses.replace(
+        Settings(),
+        database_url=str(sqlite_engine.url),
+        classifier="fake",
+        db_pool_size=2,
+        repo_cache_size=100,
+        similarity_index_size=100,
+        cross_process_sync=True,
+        metrics_enabled=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_writes_are_replayed_into_the_other_worker(settings):
+    first, second = build_container(settings), build_container(settings)
+    await first.start()
+    await second.start()
+    try:
+        reader = second.service
+        ticket = await first.service.create_ticket(
+            "Checkout crashes", "every payment fails"
+        )
+        assert (await reader.get_stats()).counts  # loaded, then kept live
+        second.apply_remote_changes(*await second.change_feed.poll())
+        cached = await reader.get_ticket(ticket.id)
+        assert cached.status == Status.OPEN
+
+        await first.service.update_ticket(ticket.id, status=Status.CLOSED)
+        first.apply_remote_changes(*await first.change_feed.poll())  # own
+        second.apply_remote_changes(*await second.change_feed.poll())
+
+        # the cached copy was dropped, the counters follow the table
+        assert (await reader.get_ticket(ticket.id)).status == Status.CLOSED
+        assert await reader.get_stats() == await first.service.get_stats()
+        events, _ = second.change_bus.since(0)
+        assert [e.kind for e in events] == ["created", "updated"]
+        # both workers number events after the log: any can resume a cursor
+        cursor = first.change_bus.event_id(events[0].seq)
+        assert first.change_bus.since(0) == second.change_bus.since(0)
+        seq = second.change_bus.parse_event_id(cursor)
+        assert second.change_bus.since(seq)[0] == events[1:]
+        similar = await reader.similar_tickets(ticket.id, limit=1)
+        assert similar == []  # only itself is indexed, and it's excluded
+        assert second.similarity_index.stats()["entries"] == 1
+
+        await first.service.delete_ticket(ticket.id)
+        second.apply_remote_changes(*await second.change_feed.poll())
+        assert await reader.get_ticket(ticket.id) is None
+        assert sum((await reader.get_stats()).counts.values()) == 0
+        assert second.similarity_index.stats()["entries"] == 0
+    finally:
+        await first.aclose()
+        await second.aclose()
+
+
+@pytest.mark.asyncio
+async def test_a_pruned_gap_drops_everything_derived_from_the_log(settings):
+    first, second = build_container(settings), build_container(settings)
+    await first.start()
+    await second.start()
+    try:
+        reader = second.service
+        ticket = await first.service.create_ticket("Login", "SSO loop")
+        second.apply_remote_changes(*await second.change_feed.poll())
+        assert (await reader.get_ticket(ticket.id)).status == Status.OPEN
+        cursor = second.change_bus.last_seq
+
+        await first.service.update_ticket(ticket.id, status=Status.CLOSED)
+        async with first.engine.begin() as conn:  # pruned before it's read
+            await conn.exec_driver_sql("DELETE FROM ticket_changes")
+        second.apply_remote_changes(*await second.change_feed.poll())
+
+        assert (await reader.get_ticket(ticket.id)).status == Status.CLOSED
+        assert await reader.get_stats() == await first.service.get_stats()
+        assert second.change_bus.since(cursor) == ([], True)
+    finally:
+        await first.aclose()
+        await second.aclose()
+
+
+@pytest.mark.asyncio
+async def test_a_cursor_from_a_worker_that_read_the_log_first(settings):
+    first, second = build_container(settings), build_container(settings)
+    await first.start()
+    await second.start()
+    try:
+        await first.service.create_ticket("Login", "SSO loop")
+        first.apply_remote_changes(*await first.change_feed.poll())
+        cursor = first.change_bus.event_id(first.change_bus.last_seq)
+
+        # the second worker hasn't polled yet: no reset, just nothing new
+        seq = second.change_bus.parse_event_id(cursor)
+        assert second.change_bus.since(seq) == ([], False)
+        second.apply_remote_changes(*await second.change_feed.poll())
+        assert second.change_bus.since(seq) == ([], False)
+
+        ticket = await second.service.create_ticket("Export", "CSV broken")
+        second.apply_remote_changes(*await second.change_feed.poll())
+        events, reset = second.change_bus.since(seq)
+        assert not reset and [e.ticket.id for e in events] == [ticket.id]
+    finally:
+        await first.aclose()
+        await second.aclose()
@@ -0,0 +1,103 @@
+import asyncio
+import dataclasses
+
+import httpx
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+import app.main as main_module
+from app.adapters.llm.cached_classifier import SQLiteClassificationCacheStore
+from app.config import Settings
+from app.core.models import Priority
+from app.main import create_application
+
+
+@pytest.fixture(name="settings")
+def settings(sqlite_engine, monkeypatch):
+    """Settings pointing at the conftest's schema-ready SQLite file."""
+    url = str(sqlite_engine.url)
+    wired = dataclasses.replace(
+        Settings(),
+        database_url=url,
+        classifier="fake",
+        db_pool_size=3,
+        stats_reconcile_s=0,
+    )
+    monkeypatch.setattr(main_module, "get_settings", lambda: wired)
+    return wired
+
+
+@pytest.mark.asyncio
+async def test_lifespan_wires_once_and_disposes(settings):
+    application = create_application()
+    async with application.router.lifespan_context(application):
+        container = application.state.container
+        pool = container.engine.sync_engine.pool
+        # warmed: every pooled connection is already open and idle
+        assert pool.checkedin() == settings.db_pool_size
+        # no breaker, hedging or cache around a local classifier
+        assert "classifier_resilience" not in container.metric_names
+        assert "classifier_cache" not in container.metric_names
+
+        transport = httpx.ASGITransport(app=application)
+        async with AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            created = await client.post(
+                "/tickets", json={"title": "Typo", "description": "footer"}
+            )
+            assert created.status_code == 201
+            listed = await client.get("/tickets")
+            assert [t["id"] for t in listed.json()] == [created.json()["id"]]
+        # one service for the worker, not one per request
+        assert application.state.container.service is container.service
+        assert pool.checkedout() == 0
+
+    assert application.state.container is None
+    # dispose() replaced the pool; the warmed connections were closed
+    assert pool.checkedin() == 0
+
+
+@pytest.mark.asyncio
+async def test_routes_need_lifespan_or_overrides():
+    application = create_application()
+    transport = httpx.ASGITransport(app=application)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        with pytest.raises(RuntimeError, match="lifespan"):
+            await ac.get("/tickets")
+
+
+@pytest.mark.asyncio
+async def test_expired_classifications_are_purged_at_startup(
+    settings, sqlite_engine, monkeypatch
+):
+    settings = dataclasses.replace(
+        settings,
+        # the cache is only put in front of the (lazily built) LLM
+        classifier="langgraph",
+        classifier_warmup=False,
+        classify_cache_persist=True,
+    )
+    monkeypatch.setattr(main_module, "get_settings", lambda: settings)
+    store = SQLiteClassificationCacheStore(sqlite_engine)
+    await store.put("expired", Priority.LOW, ttl_s=-1)
+    await store.put("fresh", Priority.HIGH, ttl_s=60)
+
+    async def _rows() -> int:
+        async with sqlite_engine.connect() as conn:
+            return (
+                await conn.execute(
+                    text("SELECT COUNT(*) FROM classification_cache")
+                )
+            ).scalar_one()
+
+    application = create_application()
+    async with application.router.lifespan_context(application):
+        assert application.state.container.classification_store is not None
+
+        async def _purged():
+            while await _rows() != 1:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(_purged(), 5)
@@ -0,0 +1,124 @@
+"""Deferred classification through the in-process worker pool."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.repos.in_memory_repo import InMemoryTicketRepository
+from app.core.models import Priority, Ticket
+from app.core.ports import PriorityClassifierPort
+from app.core.service import TicketService
+from app.workers.pool import WorkerPool
+
+
+class GatedClassifier(PriorityClassifierPort):
+    """Blocks every call until the test opens the gate."""
+
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.calls = 0
+
+    async def classify(self, title: str, description: str) -> Priority:
+        self.calls += 1
+        await self.gate.wait()
+        return Priority.HIGH
+
+
+def _wire(repo, classifier, **pool_kw):
+    services = {}
+    pool = WorkerPool(
+        lambda tid: services["svc"].classify_ticket(tid), **pool_kw
+    )
+    services["svc"] = TicketService(
+        repository=repo, classifier=classifier, classification_queue=pool
+    )
+    return services["svc"], pool
+
+
+@pytest.mark.asyncio
+async def test_create_returns_tbd_and_worker_writes_priority_back():
+    repo, classifier = InMemoryTicketRepository(), GatedClassifier()
+    service, pool = _wire(repo, classifier, concurrency=2)
+    await pool.start()
+
+    ticket = await service.create_ticket("Prod down", "checkout fails")
+    assert ticket.priority == Priority.TBD  # returned before the LLM ran
+
+    classifier.gate.set()
+    await pool.drain(timeout=1)
+
+    stored = await repo.get(ticket.id)
+    assert stored and stored.priority == Priority.HIGH
+    assert classifier.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_leftover_tbd_tickets_are_requeued_on_start():
+    repo, classifier = InMemoryTicketRepository(), GatedClassifier()
+    classifier.gate.set()
+    leftovers = [Ticket(title=f"t{i}", description="d") for i in range(3)]
+    for t in leftovers:
+        await repo.add(t)
+    await repo.add(Ticket(title="done", description="d", priority=Priority.LOW))
+
+    service, pool = _wire(repo, classifier)
+    await pool.start()
+    assert await service.requeue_unclassified() == 3
+    await pool.drain(timeout=1)
+
+    assert not await repo.list(priority=Priority.TBD)
+    assert classifier.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure():
+    repo, classifier = InMemoryTicketRepository(), GatedClassifier()
+    service, pool = _wire(repo, classifier, concurrency=1, queue_size=1)
+    await pool.start()
+
+    await service.create_ticket("a", "x")  # picked up by the worker
+    await asyncio.sleep(0)
+    await service.create_ticket("b", "x")  # fills the queue
+    blocked = asyncio.create_task(service.create_ticket("c", "x"))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+
+    classifier.gate.set()
+    await blocked
+    await pool.drain(timeout=1)
+    assert classifier.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_enqueue_is_logged(caplog):
+    class BrokenQueue:
+        async def enqueue(self, ticket_id):
+            raise RuntimeError("queue gone")
+
+    service = TicketService(
+        repository=InMemoryTicketRepository(),
+        classifier=GatedClassifier(),
+        classification_queue=BrokenQueue(),
+    )
+    [ticket] = await service.create_tickets([("t", "d")])
+    for _ in range(3):
+        await asyncio.sleep(0)  # the detached enqueue task runs and fails
+    assert ticket.priority == Priority.TBD
+    assert "queue gone" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_create_succeeds_while_the_pool_is_stopped(caplog):
+    repo = InMemoryTicketRepository()
+    service, pool = _wire(repo, GatedClassifier())
+    await pool.start()
+    await pool.drain(timeout=1)  # shutting down
+
+    ticket = await service.create_ticket("t", "d")
+    assert (await repo.get(ticket.id)).priority == Priority.TBD
+    assert "stays TBD" in caplog.text
+
+    await pool.start()
+    assert await service.requeue_unclassified() == 1
+    assert pool.pending == 1
+    await pool.drain(timeout=0)
@@ -0,0 +1,36 @@
+"""Smoke test so the load harness keeps working as the API evolves."""
+
+import pytest
+
+from benchmarks.load import build_parser, percentile, run
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("repo", ["memory", "sqlite"])
+async def test_asgi_run_produces_a_report(repo, tmp_path):
+    opts = build_parser().parse_args(
+        [
+            "--repo",
+            repo,
+            "--requests",
+            "60",
+            "--concurrency",
+            "4",
+            "--seed-tickets",
+            "5",
+            "--dir",
+            str(tmp_path),
+        ]
+    )
+    report = await run(opts)
+
+    assert report["total"]["count"] == 60
+    assert report["total"]["errors"] == 0
+    assert {"p50_ms", "p95_ms", "p99_ms", "rps"} <= set(report["total"])
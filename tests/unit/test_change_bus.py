@@ -0,0 +1,101 @@
+"""ChangeBus: replay from a cursor, ring overflow, wake-ups."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.events import ChangeBus
+from app.api.events import stream_events
+from app.core.models import Ticket
+
+
+def test_replay_from_cursor_and_reset_when_overwritten():
+    bus = ChangeBus(buffer_size=3)
+    ticket = Ticket(title="t", description="d")
+
+    assert bus.since(None) == ([], True)  # no cursor → start over
+    for _ in range(5):
+        bus.publish("updated", ticket)
+
+    events, reset = bus.since(3)
+    assert not reset and [e.seq for e in events] == [4, 5]
+    assert bus.since(5) == ([], False)
+    assert bus.since(1)[1]  # seq 2 already overwritten
+    assert bus.since(99)[1]  # cursor from a different lifetime
+
+    bus.reset()  # changes were missed: nobody can replay
+    assert bus.since(5) == ([], True)
+    bus.publish("updated", ticket)
+    assert [e.seq for e in bus.since(bus.last_seq - 1)[0]] == [7]
+
+
+def test_events_are_snapshots_and_ids_are_scoped_to_the_bus():
+    bus = ChangeBus()
+    ticket = Ticket(title="before", description="d")
+    bus.publish("created", ticket)
+    ticket.title = "after"
+    assert bus.since(0)[0][0].ticket.title == "before"
+
+    assert bus.parse_event_id(bus.event_id(1)) == 1
+    assert bus.parse_event_id(ChangeBus().event_id(1)) is None
+    assert bus.parse_event_id("garbage") is None
+
+
+def test_a_shared_bus_keeps_the_log_numbering():
+    bus = ChangeBus(buffer_size=2)
+    bus.share("db", 10)
+    assert bus.since(9) == ([], True)  # before this process followed the log
+    assert bus.since(12) == ([], False)  # another worker read further
+    for seq in (11, 12, 14):  # seqs need not be contiguous
+        bus.publish("updated", Ticket(), seq)
+    with pytest.raises(ValueError):
+        bus.publish("updated", Ticket(), 14)
+
+    assert [e.seq for e in bus.since(12)[0]] == [14]
+    assert [e.seq for e in bus.since(11)[0]] == [12, 14]
+    assert bus.since(10)[1]  # 11 was overwritten
+    assert bus.parse_event_id(bus.event_id(14)) == 14
+    other = ChangeBus()
+    other.share("db", 0)
+    assert other.parse_event_id(bus.event_id(14)) == 14
+
+    bus.reset(20)  # the log lost 15-20 before this process read them
+    assert bus.since(14) == ([], True)
+    bus.publish("created", Ticket(), 21)
+    assert [e.seq for e in bus.since(20)[0]] == [21]
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_on_publish_and_times_out():
+    bus = ChangeBus()
+    assert not await bus.wait(0, timeout=0.01)
+
+    waiter = asyncio.create_task(bus.wait(0, timeout=5))
+    await asyncio.sleep(0)
+    bus.publish("created", Ticket())
+    assert await waiter
+
+
+@pytest.mark.asyncio
+async def test_live_stream_delivers_new_events():
+    bus = ChangeBus()
+
+    async def connected() -> bool:
+        return False
+
+    frames = stream_events(
+        bus,
+        None,
+        once=False,
+        heartbeat_s=0.01,
+        is_disconnected=connected,
+    )
+    assert (await anext(frames)).startswith("retry:")
+    assert "event: reset" in await anext(frames)
+    assert await anext(frames) == ": keep-alive\n\n"
+
+    ticket = Ticket(title="live", description="d")
+    bus.publish("created", ticket)
+    frame = await anext(frames)
+    assert "event: created" in frame and str(ticket.id) in frame
+    await frames.aclose()
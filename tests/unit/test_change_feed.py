@@ -0,0 +1,158 @@
+"""ChangeFeed: other origins' writes from the SQLite change log."""
+
+import pytest
+
+from app.adapters.repos.change_feed import ChangeFeed
+from app.adapters.repos.sqlite_repo import SQLiteTicketRepository
+from app.core.models import Priority, Status, Ticket
+
+
+@pytest.mark.asyncio
+async def test_reports_other_origins_writes_in_order(sqlite_engine):
+    writer = SQLiteTicketRepository(sqlite_engine, change_origin="a")
+    before = Ticket(title="old", description="d")
+    await writer.add(before)
+
+    feed = ChangeFeed(sqlite_engine, "b")
+    await feed.start()
+    try:
+        assert await feed.poll() == (
+            [],
+            False,
+        )  # history before start() is skipped
+
+        ticket = Ticket(title="Checkout down", description="500s")
+        await writer.add(ticket)
+        await writer.update_fields(ticket.id, {"status": Status.CLOSED})
+        await writer.add_many([Ticket(title="t2", description="d")])
+        await writer.delete(before.id)
+
+        events, reset = await feed.poll()
+        assert [e.kind for e in events] == [
+            "created",
+            "updated",
+            "created",
+            "deleted",
+        ]
+        assert [e.seq for e in events] == sorted(e.seq for e in events)
+        assert not reset
+        created, updated = events[0].ticket, events[1].ticket
+        assert created.id == ticket.id and created.title == "Checkout down"
+        assert created.created_at == ticket.created_at
+        assert updated.status == Status.CLOSED and updated.version == 2
+        assert events[3].ticket.id == before.id
+        assert await feed.poll() == ([], False)
+        assert feed.stats()["received"] == 4
+    finally:
+        await feed.aclose()
+
+
+@pytest.mark.asyncio
+async def test_tags_entries_with_their_origin(sqlite_engine):
+    feed = ChangeFeed(sqlite_engine, "me")
+    await feed.start()
+    try:
+        own = SQLiteTicketRepository(sqlite_engine, change_origin="me")
+        await own.add(Ticket(title="mine", description="d"))
+        plain = SQLiteTicketRepository(sqlite_engine)
+        await plain.add(Ticket(title="unlogged", description="d"))
+        other = SQLiteTicketRepository(sqlite_engine, change_origin="other")
+        ticket = Ticket(title="theirs", description="d", priority=Priority.LOW)
+        await other.add(ticket)
+
+        events, _ = await feed.poll()
+        assert [(e.origin, e.ticket.title) for e in events] == [
+            ("me", "mine"),
+            ("other", "theirs"),
+        ]
+        assert events[1].ticket.priority == Priority.LOW
+        assert feed.stats()["received"] == 1  # only the other's
+    finally:
+        await feed.aclose()
+
+
+@pytest.mark.asyncio
+async def test_every_feed_on_a_database_shares_its_epoch(sqlite_engine):
+    feeds = [ChangeFeed(sqlite_engine, o) for o in ("a", "b")]
+    for feed in feeds:
+        await feed.start()
+    try:
+        assert feeds[0].epoch and feeds[0].epoch == feeds[1].epoch
+    finally:
+        for feed in feeds:
+            await feed.aclose()
+
+
+@pytest.mark.asyncio
+async def test_prunes_entries_past_retention(sqlite_engine):
+    now = [1_000_000.0]
+    writer = SQLiteTicketRepository(sqlite_engine, change_origin="a")
+    await writer.add(Ticket(title="t", description="d"))
+    feed = ChangeFeed(sqlite_engine, "b", retention_s=60, clock=lambda: now[0])
+    await feed.start()
+    try:
+        now[0] = 2_000_000_000.0  # far past the first entry's timestamp
+        await writer.add(Ticket(title="t2", description="d"))
+        events, reset = await feed.poll()
+        assert len(events) == 1 and not reset
+        async with sqlite_engine.connect() as conn:
+            rows = await conn.exec_driver_sql(
+                "SELECT COUNT(*) FROM ticket_changes"
+            )
+            assert rows.scalar_one() == 0
+    finally:
+        await feed.aclose()
+
+
+@pytest.mark.asyncio
+async def test_entries_pruned_before_they_were_read_ask_for_a_reset(
+    sqlite_engine,
+):
+    writer = SQLiteTicketRepository(sqlite_engine, change_origin="a")
+    feed = ChangeFeed(sqlite_engine, "b")
+    await feed.start()
+    try:
+        for i in range(3):
+            await writer.add(Ticket(title=f"t{i}", description="d"))
+        async with sqlite_engine.begin() as conn:  # another worker pruned
+            await conn.exec_driver_sql(
+                "DELETE FROM ticket_changes WHERE seq < 3"
+            )
+        events, reset = await feed.poll()
+        assert reset and [e.ticket.title for e in events] == ["t2"]
+        assert feed.stats()["resets"] == 1
+
+        await writer.add(Ticket(title="t3", description="d"))
+        async with sqlite_engine.begin() as conn:  # all of it, this time
+            await conn.exec_driver_sql("DELETE FROM ticket_changes")
+        assert await feed.poll() == ([], True)
+        assert await feed.poll() == ([], False)
+    finally:
+        await feed.aclose()
+
+
+@pytest.mark.asyncio
+async def test_a_log_pruned_before_start_is_not_a_gap(sqlite_engine):
+    writer = SQLiteTicketRepository(sqlite_engine, change_origin="a")
+    await writer.add(Ticket(title="old", description="d"))
+    async with sqlite_engine.begin() as conn:
+        await conn.exec_driver_sql("DELETE FROM ticket_changes")
+    feed = ChangeFeed(sqlite_engine, "b")
+    await feed.start()
+    try:
+        await writer.add(Ticket(title="new", description="d"))
+        events, reset = await feed.poll()
+        assert len(events) == 1 and not reset
+    finally:
+        await feed.aclose()
+
+
+@pytest.mark.asyncio
+async def test_prune_without_polling(sqlite_engine):
+    now = [1_000_000.0]
+    writer = SQLiteTicketRepository(sqlite_engine, change_origin="worker")
+    feed = ChangeFeed(sqlite_engine, "worker", clock=lambda: now[0])
+    await writer.add(Ticket(title="t", description="d"))
+    assert await feed.prune() == 0  # recent (the log uses the wall clock)
+    now[0] = 2_000_000_000.0
+    assert await feed.prune() == 1
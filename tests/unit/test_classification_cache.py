@@ -0,0 +1,106 @@
+"""CachingPriorityClassifier: keys, eviction, TBD handling and persistence."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.llm.cached_classifier import (
+    CachingPriorityClassifier,
+    SQLiteClassificationCacheStore,
+    cache_key,
+)
+from app.core.models import Priority
+from app.core.ports import PriorityClassifierPort
+
+
+class CountingClassifier(PriorityClassifierPort):
+    def __init__(self, answer: Priority = Priority.HIGH) -> None:
+        self.answer = answer
+        self.calls = 0
+
+    async def classify(self, title: str, description: str) -> Priority:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.answer
+
+
+def test_key_ignores_case_punctuation_and_whitespace_but_not_version():
+    k = cache_key("v1", "Checkout is DOWN!!", "  500\n errors ")
+    assert k == cache_key("v1", "checkout is down", "500 errors")
+    assert k != cache_key("v2", "checkout is down", "500 errors")
+
+
+@pytest.mark.asyncio
+async def test_duplicates_hit_the_cache_and_storms_share_one_call():
+    inner = CountingClassifier()
+    cached = CachingPriorityClassifier(inner)
+
+    results = await asyncio.gather(
+        *(cached.classify("Checkout is down", "help") for _ in range(20))
+    )
+    await cached.classify("checkout is DOWN", "help!")
+
+    assert set(results) == {Priority.HIGH}
+    assert inner.calls == 1
+    assert cached.stats()["misses"] == 1 and cached.stats()["hits"] == 20
+
+
+@pytest.mark.asyncio
+async def test_tbd_fallback_is_never_cached():
+    inner = CountingClassifier(Priority.TBD)
+    cached = CachingPriorityClassifier(inner)
+
+    await cached.classify("a", "b")
+    await cached.classify("a", "b")
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_bound_evicts_oldest_entry():
+    inner = CountingClassifier()
+    cached = CachingPriorityClassifier(inner, max_entries=2)
+
+    for title in ("a", "b", "c", "a"):
+        await cached.classify(title, "x")
+    assert inner.calls == 4  # "a" was evicted by "c"
+
+
+@pytest.mark.asyncio
+async def test_persistent_store_survives_a_restart(sqlite_engine):
+    store = SQLiteClassificationCacheStore(sqlite_engine)
+    first = CountingClassifier(Priority.MEDIUM)
+    await CachingPriorityClassifier(first, store=store).classify("slow", "x")
+
+    second = CountingClassifier(Priority.LOW)
+    restarted = CachingPriorityClassifier(second, store=store)
+    assert await restarted.classify("slow", "x") == Priority.MEDIUM
+    assert second.calls == 0
+    assert restarted.stats()["persistent_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_fail_the_others():
+    inner = CountingClassifier()
+    cached = CachingPriorityClassifier(inner)
+
+    leader = asyncio.create_task(cached.classify("Checkout down", "x"))
+    await asyncio.sleep(0)  # the leader's call is in flight
+    follower = asyncio.create_task(cached.classify("checkout DOWN", "x"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.wait_for(follower, 5) == Priority.HIGH
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert inner.calls == 1
+    assert await cached.classify("Checkout down", "x") == Priority.HIGH
+    assert inner.calls == 1  # the shared call still filled the cache
+
+
+@pytest.mark.asyncio
+async def test_expired_rows_are_purged(sqlite_engine):
+    store = SQLiteClassificationCacheStore(sqlite_engine)
+    await store.put("old", Priority.LOW, ttl_s=-1)
+    await store.put("new", Priority.HIGH, ttl_s=60)
+    assert await store.purge_expired() == 1
+    assert await store.get("new") == Priority.HIGH
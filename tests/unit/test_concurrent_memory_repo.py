@@ -0,0 +1,215 @@
+import asyncio
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.adapters.repos import concurrent_memory_repo
+from app.adapters.repos.concurrent_memory_repo import (
+    ConcurrentInMemoryTicketRepository,
+)
+from app.core.models import PageCursor, Status, Ticket
+
+THREADS = 4
+TASKS_PER_THREAD = 8
+INCREMENTS = 50
+
+
+@pytest.fixture(name="repo")
+def repo(monkeypatch):
+    # tiny chunks so the stress run splits and drops many of them
+    monkeypatch.setattr(concurrent_memory_repo, "CHUNK_SIZE", 4)
+    return ConcurrentInMemoryTicketRepository()
+
+
+@pytest.fixture(name="eager_switching")
+def eager_switching():
+    """Switch threads far more often than every 5 ms: races show up."""
+    default = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    yield
+    sys.setswitchinterval(default)
+
+
+async def _increment(repo, ticket_id, times):
+    """Compare-and-set increments of the title counter; retries on races."""
+    for _ in range(times):
+        while True:
+            current = await repo.get(ticket_id)
+            updated = await repo.update_fields(
+                ticket_id,
+                {"title": str(int(current.title) + 1)},
+                expected_version=current.version,
+            )
+            if updated is not None:
+                break
+
+
+async def _churn(repo, tag, rounds):
+    """Create, close and delete tickets of our own."""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(rounds):
+        ticket = Ticket(
+            title=f"{tag}-{i}",
+            description="churn",
+            created_at=base + timedelta(seconds=i % 7),
+        )
+        await repo.add(ticket)
+        await repo.update_fields(ticket.id, {"status": Status.CLOSED})
+        if i % 2:
+            await repo.delete(ticket.id)
+
+
+def _consistent(page, status=None):
+    keys = [(t.created_at, str(t.id)) for t in page]
+    assert keys == sorted(keys, reverse=True)
+    assert len(set(keys)) == len(keys)
+    if status is not None:
+        assert all(t.status == status for t in page)
+
+
+@pytest.mark.asyncio
+async def test_threads_and_tasks_lose_no_updates(repo, eager_switching):
+    counter = Ticket(title="0", description="shared")
+    await repo.add(counter)
+    stop = threading.Event()
+    reads = []
+
+    async def _writers(tag):
+        await asyncio.gather(
+            _increment(repo, counter.id, INCREMENTS),
+            *(
+                _churn(repo, f"{tag}/{n}", INCREMENTS)
+                for n in range(TASKS_PER_THREAD - 1)
+            ),
+        )
+
+    def _reader():
+        async def _loop():
+            while not stop.is_set():
+                _consistent(await repo.list(limit=50))
+                _consistent(
+                    await repo.list(status=Status.CLOSED), Status.CLOSED
+                )
+                reads.append(1)
+                await asyncio.sleep(0)
+
+        asyncio.run(_loop())
+
+    reader = threading.Thread(target=_reader)
+    reader.start()
+    try:
+        threads = [
+            threading.Thread(target=asyncio.run, args=(_writers(f"t{i}"),))
+            for i in range(THREADS)
+        ]
+        for t in threads:
+            t.start()
+        # and a few more writers on this event loop
+        await _writers("loop")
+        for t in threads:
+            t.join()
+    finally:
+        stop.set()
+        reader.join()
+
+    writers = THREADS + 1
+    final = await repo.get(counter.id)
+    assert int(final.title) == writers * INCREMENTS
+    assert final.version == 1 + writers * INCREMENTS
+
+    # every churn task keeps its even-numbered tickets, all CLOSED
+    kept = writers * (TASKS_PER_THREAD - 1) * (INCREMENTS // 2)
+    closed = await repo.list(status=Status.CLOSED)
+    assert len(closed) == kept
+    assert len(await repo.list()) == kept + 1
+    stats = await repo.aggregate()
+    assert sum(stats.counts.values()) == kept + 1
+    assert len(await repo.search("churn", limit=10_000)) == kept
+
+    assert reads
+
+
+@pytest.mark.asyncio
+async def test_a_lock_held_elsewhere_never_blocks_the_event_loop(repo):
+    ticket = Ticket(title="t", description="d")
+    await repo.add(ticket)
+
+    repo._write_lock.acquire()  # another thread is mid-write
+    try:
+        # reads don't need it
+        assert [t.id for t in await repo.list()] == [ticket.id]
+        assert (await repo.get(ticket.id)).version == 1
+        write = asyncio.create_task(
+            repo.update_fields(ticket.id, {"title": "x"})
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)  # the loop keeps running
+        assert not write.done()
+    finally:
+        repo._write_lock.release()
+    assert (await asyncio.wait_for(write, 5)).title == "x"
+
+
+@pytest.mark.asyncio
+async def test_large_batches_are_written_off_the_event_loop(repo, monkeypatch):
+    monkeypatch.setattr(concurrent_memory_repo, "OFFLOAD_THRESHOLD", 10)
+    monkeypatch.setattr(concurrent_memory_repo, "INDEX_CHUNK_SIZE", 7)
+    order = []
+
+    async def _tick():
+        order.append("tick")
+
+    tick = asyncio.create_task(_tick())
+    await repo.add_many(
+        [Ticket(title=f"bulk {i}", description="d") for i in range(50)]
+    )
+    order.append("written")
+    await tick
+    assert order == ["tick", "written"]
+    assert len(await repo.search("bulk", limit=100)) == 50
+
+    [shared] = await repo.list(limit=1)  # may still be read elsewhere
+    deleted = await repo.delete(shared.id)
+    assert deleted == shared and deleted is not shared
+    assert len(await repo.search("bulk", limit=100)) == 49
+
+
+@pytest.mark.asyncio
+async def test_readers_keep_their_snapshot_while_writers_continue(repo):
+    tickets = [Ticket(title=f"t{i}", description="d") for i in range(20)]
+    await repo.add_many(tickets)
+
+    batches = repo.iter_batches(batch_size=5)
+    first = await anext(batches)
+    # writes after the export started are not seen by it
+    await repo.add(Ticket(title="late", description="d"))
+    for t in tickets[:10]:
+        await repo.delete(t.id)
+    rest = [t async for batch in batches for t in batch]
+    assert len(first) + len(rest) == 20
+
+    # a page walk on the live repository sees the new state
+    page = await repo.list(limit=100, after=None)
+    assert len(page) == 11
+    cursor = PageCursor(page[4].created_at, page[4].id)
+    assert [t.id for t in await repo.list(after=cursor)] == [
+        t.id for t in page[5:]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mutating_returned_tickets_does_not_touch_the_store(repo):
+    ticket = Ticket(title="t", description="d")
+    await repo.add(ticket)
+    ticket.status = Status.CLOSED  # the caller's object, not ours
+
+    fetched = await repo.get(ticket.id)
+    fetched.status = Status.IN_PROGRESS
+    assert await repo.list(status=Status.IN_PROGRESS) == []
+    assert (await repo.get(ticket.id)).status == Status.OPEN
+
+    await repo.update(fetched)
+    moved = await repo.list(status=Status.IN_PROGRESS)
+    assert [t.id for t in moved] == [ticket.id] and fetched.version == 2
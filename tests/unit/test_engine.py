@@ -0,0 +1,75 @@
+"""Engine factory: pragmas on every connection and config validation."""
+
+from dataclasses import replace
+
+import pytest
+from sqlalchemy import text
+
+from app.config import Settings
+from app.db.engine import build_engine, sqlite_pragmas
+
+
+@pytest.mark.asyncio
+async def test_every_connection_gets_the_configured_pragmas(sqlite_engine):
+    async with sqlite_engine.connect() as conn:
+        journal = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+        sync = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+        busy = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+    assert journal == "wal"
+    assert sync == 1  # NORMAL
+    assert busy == Settings.sqlite_busy_timeout_ms
+
+
+def test_pool_is_sized_for_file_databases_only(tmp_path):
+    settings = Settings(db_pool_size=3, db_max_overflow=2)
+    file_engine = build_engine(
+        f"sqlite+aiosqlite:///{tmp_path}/x.db", settings
+    )
+    memory_engine = build_engine("sqlite+aiosqlite:///:memory:", settings)
+
+    assert file_engine.pool.size() == 3
+    assert type(memory_engine.pool).__name__ == "StaticPool"
+
+
+def test_unknown_pragma_values_are_rejected():
+    with pytest.raises(ValueError):
+        sqlite_pragmas(replace(Settings(), sqlite_synchronous="FAST; DROP"))
+
+
+@pytest.mark.asyncio
+async def test_create_schema_upgrades_old_tables(tmp_path):
+    from app.db.init_db import create_schema
+
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path}/old.db")
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "CREATE TABLE tickets (id VARCHAR PRIMARY KEY, "
+                "title VARCHAR(255) NOT NULL, description TEXT NOT NULL, "
+                "priority VARCHAR(10) NOT NULL, status VARCHAR(15) NOT NULL, "
+                "created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL)"
+            )
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO tickets VALUES ('x', 't', 'd', 'LOW', 'OPEN', "
+                "'2025-01-01 00:00:00', '2025-01-01 00:00:00')"
+            )
+        )
+
+    await create_schema(engine)
+    async with engine.connect() as conn:
+        version, closed_at = (
+            await conn.execute(text("SELECT version, closed_at FROM tickets"))
+        ).one()
+        # rows that predate the search index were indexed too
+        found = (
+            await conn.execute(
+                text(
+                    "SELECT rowid FROM tickets_fts WHERE tickets_fts MATCH 'd'"
+                )
+            )
+        ).fetchall()
+    await engine.dispose()
+    assert version == 1 and closed_at is None  # the old row is OPEN
+    assert len(found) == 1
@@ -0,0 +1,150 @@
+"""SQLiteJobQueue: dedup, leasing, backoff, dead letters, stats."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from app.adapters.repos.job_queue import SQLiteJobQueue
+
+
+@pytest.fixture(name="clock")
+def clock():
+    now = [1_000.0]
+    return now
+
+
+@pytest.fixture(name="jobs")
+def jobs(sqlite_engine, clock):
+    return SQLiteJobQueue(
+        sqlite_engine,
+        max_attempts=2,
+        backoff_s=10,
+        clock=lambda: clock[0],
+        rand=lambda: 1.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_one_pending_job_per_ticket(jobs):
+    ids = [uuid4() for _ in range(3)]
+    assert await jobs.enqueue_many(ids) == 3
+    assert await jobs.enqueue_many(ids[:2] + [uuid4()]) == 1
+
+    leased = await jobs.lease("w1", 10, lease_s=30)
+    assert len(leased) == 4 and {j.attempts for j in leased} == {1}
+    # still pending while leased
+    assert await jobs.enqueue_many([ids[0]], kind="reclassify") == 0
+    assert await jobs.lease("w2", 10, lease_s=30) == []
+
+    assert await jobs.complete(leased[0], "w1")
+    # finished: the ticket can get a new job
+    assert await jobs.enqueue_many([ids[0]], kind="reclassify") == 1
+    stats = await jobs.stats()
+    assert (stats["queued"], stats["leased"], stats["done"]) == (1, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_failures_back_off_then_go_dead(jobs, clock):
+    await jobs.enqueue(uuid4())
+    [job] = await jobs.lease("w1", 10, lease_s=30)
+    assert await jobs.fail(job, "w1", "boom")
+
+    clock[0] += 9.9  # backoff is 10 s × 2^0 here (jitter pinned to max)
+    assert await jobs.lease("w1", 10, lease_s=30) == []
+    clock[0] += 0.2
+    [job] = await jobs.lease("w1", 10, lease_s=30)
+    assert job.attempts == 2
+
+    assert await jobs.fail(job, "w1", "boom again")
+    clock[0] += 3600
+    assert await jobs.lease("w1", 10, lease_s=30) == []
+    assert (await jobs.stats())["dead"] == 1
+
+    assert await jobs.retry_dead() == 1
+    [job] = await jobs.lease("w1", 10, lease_s=30)
+    assert job.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_leases_are_taken_over(jobs, clock):
+    await jobs.enqueue(uuid4())
+    [job] = await jobs.lease("crashed", 10, lease_s=30)
+    clock[0] += 31
+    [again] = await jobs.lease("w2", 10, lease_s=30)
+    assert again.id == job.id and again.attempts == 2
+    # the first owner lost it
+    assert not await jobs.complete(job, "crashed")
+
+    # last attempt's lease expires too: dead-lettered, not leased again
+    clock[0] += 31
+    assert await jobs.lease("w3", 10, lease_s=30) == []
+    assert (await jobs.stats())["dead"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stats_and_prune(jobs, clock):
+    await jobs.enqueue_many([uuid4() for _ in range(3)])
+    clock[0] += 5
+    assert (await jobs.stats())["oldest_due_age_s"] == 5.0
+
+    for job in await jobs.lease("w1", 2, lease_s=30):
+        await jobs.complete(job, "w1")
+    stats = await jobs.stats()
+    assert stats["done"] == 2 and stats["done_per_s"] == pytest.approx(
+        2 / 60, abs=1e-3
+    )
+
+    clock[0] += 100
+    assert await jobs.prune(retention_s=50) == 2
+    assert (await jobs.stats())["done"] == 0
+
+
+@pytest.mark.asyncio
+async def test_oldest_due_first_and_dead_tickets_stay_dead(jobs, clock):
+    first, second, third = uuid4(), uuid4(), uuid4()
+    await jobs.enqueue(first)
+    clock[0] += 1
+    await jobs.enqueue_many([second, third])
+    [job] = await jobs.lease("w1", 1, lease_s=30)
+    assert job.ticket_id == first
+    assert await jobs.fail(job, "w1", "boom")  # due again in 10 s
+    clock[0] += 20
+    leased = await jobs.lease("w1", 10, lease_s=30)
+    assert [j.ticket_id for j in leased] == [first, second, third]
+
+    assert await jobs.fail(leased[0], "w1", "boom again")  # dead
+    assert await jobs.enqueue(first) is None
+    assert (await jobs.stats())["queued"] == 0
+    # an explicit reclassification still goes through
+    assert await jobs.enqueue_many([first], kind="reclassify") == 1
+
+
+@pytest.mark.asyncio
+async def test_extended_leases_are_not_taken_over(jobs, clock):
+    await jobs.enqueue_many([uuid4(), uuid4()])
+    held = await jobs.lease("w1", 10, lease_s=30)
+    clock[0] += 20
+    assert await jobs.extend(held[:1], "w1", lease_s=30) == 1
+    assert await jobs.extend(held, "someone else", lease_s=30) == 0
+    clock[0] += 20
+    [taken] = await jobs.lease("w2", 10, lease_s=30)
+    assert taken.id == held[1].id
+    assert await jobs.complete(held[0], "w1")
+    assert not await jobs.complete(held[1], "w1")
+
+
+@pytest.mark.asyncio
+async def test_an_idle_lease_needs_no_write_lock(jobs, sqlite_engine, clock):
+    await jobs.enqueue_many([uuid4()])
+    [job] = await jobs.lease("w1", 10, lease_s=30)
+    async with sqlite_engine.begin() as writer:  # e.g. an API request
+        await writer.execute(
+            text("INSERT INTO classification_cache VALUES ('k', 'LOW', 0)")
+        )
+        # nothing due: answered without waiting for the writer
+        assert await asyncio.wait_for(jobs.lease("w2", 10, 30), 1) == []
+
+    clock[0] += 31  # the lease expired: now there is work
+    assert [j.id for j in await jobs.lease("w2", 10, 30)] == [job.id]
@@ -0,0 +1,139 @@
+"""Single-pass keyword engine, rules files and hot reload."""
+
+import json
+import os
+
+import pytest
+
+from app.adapters.llm.fake_classifier import FakePriorityClassifier
+from app.adapters.llm.rules import (
+    KeywordRules,
+    ReloadingKeywordRules,
+    parse_rules,
+)
+from app.core.models import Priority
+from tests.conftest import FakeClock
+
+
+def _write(path, rules) -> None:
+    path.write_text(json.dumps(rules))
+    # make the edit visible even within the filesystem's mtime resolution
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_one_pass_scores_every_tier_and_prefers_longest_keywords():
+    rules = KeywordRules(
+        {
+            Priority.HIGH: [("fail", 1.0), ("data loss", 2.0)],
+            Priority.MEDIUM: [("failover", 1.5)],
+            Priority.LOW: [("data", 0.5)],
+        }
+    )
+    scores = rules.scores("Failover slow", "possible DATA\n  LOSS, data gone")
+    # "failover" is not also counted as "fail"; "data loss" beats "data"
+    assert scores == {
+        Priority.HIGH: 2.0,
+        Priority.MEDIUM: 1.5,
+        Priority.LOW: 0.5,
+    }
+    assert list(scores) == [Priority.HIGH, Priority.MEDIUM, Priority.LOW]
+    assert rules.scores("unfailing", "metadata") == {}
+
+
+def test_large_rule_sets_match_like_a_word_prefix_scan():
+    keywords = [f"kw{i:04d}x" for i in range(3000)]
+    rules = KeywordRules(
+        {
+            Priority.HIGH: [(k, 1.0) for k in keywords[:1000]],
+            Priority.MEDIUM: [(k, 1.0) for k in keywords[1000:2000]],
+            Priority.LOW: [(k, 1.0) for k in keywords[2000:]],
+        }
+    )
+    assert len(rules) == 3000
+    text = "kw0007xyz and kw1500x, not akw2999x"
+    assert rules.scores(text, "") == {
+        Priority.HIGH: 1.0,
+        Priority.MEDIUM: 1.0,
+    }
+
+
+def test_a_trailing_dollar_matches_whole_words_only():
+    rules = KeywordRules(
+        {
+            Priority.HIGH: [("down$", 1.0), ("down time", 2.0)],
+            Priority.LOW: [("download", 1.0), ("cost$", 1.0)],
+        }
+    )
+    assert rules.scores("Site is down", "") == {Priority.HIGH: 1.0}
+    assert rules.scores("Site down.", "") == {Priority.HIGH: 1.0}
+    assert rules.scores("Slow download", "") == {Priority.LOW: 1.0}
+    assert rules.scores("Downtime", "no down time") == {Priority.HIGH: 2.0}
+    assert rules.scores("Costs", "costume") == {}
+    # the built-in "down" rule is whole-word too
+    assert KeywordRules().scores("Download page", "") == {}
+
+
+def test_the_most_severe_match_wins_with_low_confidence():
+    rules = KeywordRules()
+    priority, confidence = rules.predict("Search slow", "an error, then slow")
+    assert priority == Priority.HIGH and confidence < 0.5
+
+
+@pytest.mark.asyncio
+async def test_fake_classifier_picks_the_most_severe_tier():
+    fake = FakePriorityClassifier()
+    cases = {
+        ("Checkout", "error 500"): Priority.HIGH,
+        ("Search slow", "an error once, then slow"): Priority.HIGH,
+        ("Search slow", "since the last deploy"): Priority.MEDIUM,
+        ("Download link", "points to the old file"): Priority.LOW,
+        ("Typo", "cosmetic"): Priority.LOW,
+        ("Question", "about invoices"): Priority.LOW,  # no keyword
+    }
+    for (title, description), expected in cases.items():
+        assert await fake.classify(title, description) == expected
+
+
+def test_rules_file_format_is_validated():
+    rules = parse_rules({"high": {"outage": 2}, "LOW": ["typo", "wording"]})
+    assert rules == {
+        Priority.HIGH: [("outage", 2.0)],
+        Priority.LOW: [("typo", 1.0), ("wording", 1.0)],
+    }
+    for bad in (
+        {"URGENT": ["x"]},
+        {"TBD": ["x"]},
+        {"HIGH": "x"},
+        ["x"],
+        {"HIGH": {"outage": None}},
+        {"HIGH": {"outage": [2]}},
+        {"HIGH": {"outage": "2"}},
+    ):
+        with pytest.raises(ValueError):
+            parse_rules(bad)
+
+
+def test_rules_file_is_hot_reloaded_and_bad_edits_are_ignored(tmp_path):
+    path = tmp_path / "rules.json"
+    _write(path, {"HIGH": {"outage": 2}})
+    clock = FakeClock()
+    rules = ReloadingKeywordRules(path, check_interval_s=5, clock=clock)
+    assert rules.predict("Outage", "") == (Priority.HIGH, 1.0)
+
+    _write(path, {"HIGH": {"outage": 2}, "LOW": {"typo": 2}})
+    assert rules.predict("Typo", "") is None  # not re-checked yet
+    clock.now = 5
+    assert rules.predict("Typo", "") == (Priority.LOW, 1.0)
+    assert rules.reloads == 1
+
+    path.write_text("{not json")
+    clock.now = 10
+    assert rules.predict("Typo", "") == (Priority.LOW, 1.0)
+    _write(path, {"HIGH": {"outage": None}, "LOW": {"typo": [2]}})
+    clock.now = 15
+    assert rules.predict("Typo", "") == (Priority.LOW, 1.0)
+    path.unlink()
+    clock.now = 20
+    assert rules.predict("Outage", "") == (Priority.HIGH, 1.0)
+    assert rules.reloads == 1
@@ -0,0 +1,65 @@
+"""Lazy classifier construction and config-driven selection."""
+
+import asyncio
+import dataclasses
+
+import pytest
+
+from app.adapters.llm.factory import build_classifier, is_remote
+from app.adapters.llm.fake_classifier import FakePriorityClassifier
+from app.adapters.llm.lazy import LazyPriorityClassifier
+from app.adapters.llm.prompts import prompt_version
+from app.adapters.llm.tbd_classifier import TbdPriorityClassifier
+from app.config import Settings
+from app.core.models import Priority
+from tests.conftest import StubPriorityClassifier
+
+
+@pytest.mark.asyncio
+async def test_built_once_on_first_use():
+    builds = []
+
+    def factory():
+        builds.append(1)
+        return StubPriorityClassifier()
+
+    lazy = LazyPriorityClassifier(factory, cache_version="v1")
+    assert not lazy.loaded and builds == []
+    assert lazy.cache_version == "v1"
+
+    results = await asyncio.gather(
+        *(lazy.classify("button", "d") for _ in range(5))
+    )
+    assert results == [Priority.LOW] * 5
+    assert builds == [1] and lazy.loaded
+    await lazy.warm_up()
+    assert builds == [1]
+
+
+@pytest.mark.asyncio
+async def test_failed_build_falls_back_to_tbd():
+    def factory():
+        raise RuntimeError("no credentials")
+
+    lazy = LazyPriorityClassifier(factory)
+    assert await lazy.classify("outage", "all down") == Priority.TBD
+    assert isinstance(await lazy.warm_up(), TbdPriorityClassifier)
+
+
+def test_selection_follows_settings(monkeypatch):
+    base = Settings()
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    tbd = build_classifier(base)
+    assert isinstance(tbd, TbdPriorityClassifier) and not is_remote(tbd)
+
+    fake = build_classifier(dataclasses.replace(base, classifier="fake"))
+    assert isinstance(fake, FakePriorityClassifier) and not is_remote(fake)
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    llm = build_classifier(dataclasses.replace(base, llm_model="m"))
+    assert isinstance(llm, LazyPriorityClassifier) and not llm.loaded
+    assert is_remote(llm)
+    assert llm.cache_version == prompt_version("m")
+
+    with pytest.raises(ValueError):
+        build_classifier(dataclasses.replace(base, classifier="gpt"))
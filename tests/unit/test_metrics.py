@@ -0,0 +1,57 @@
+"""Prometheus exposition and the timing decorators around the ports."""
+
+import pytest
+
+from app.adapters.instrumented import (
+    InstrumentedPriorityClassifier,
+    InstrumentedTicketRepository,
+)
+from app.adapters.llm.tbd_classifier import TbdPriorityClassifier
+from app.adapters.repos.in_memory_repo import InMemoryTicketRepository
+from app.core.models import Ticket
+from app.observability.metrics import (
+    CLASSIFIER_OUTCOMES,
+    REPO_LATENCY,
+    Counter,
+    Histogram,
+    Registry,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    hist = registry.register(
+        Histogram("lat_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    )
+    for value in (0.05, 0.1, 0.5, 3.0):
+        hist.observe(value, route="/x")
+
+    text = registry.render()
+    assert "# TYPE lat_seconds histogram" in text
+    assert 'lat_seconds_bucket{route="/x",le="0.1"} 2' in text
+    assert 'lat_seconds_bucket{route="/x",le="1"} 3' in text
+    assert 'lat_seconds_bucket{route="/x",le="+Inf"} 4' in text
+    assert 'lat_seconds_count{route="/x"} 4' in text
+
+
+def test_label_values_are_escaped_and_checked():
+    registry = Registry()
+    counter = registry.register(Counter("c_total", "C.", ("path",)))
+    counter.inc(path='a"b')
+    assert 'c_total{path="a\\"b"} 1' in registry.render()
+    with pytest.raises(ValueError):
+        counter.inc(other="x")
+
+
+@pytest.mark.asyncio
+async def test_wrappers_time_repository_and_count_classifier_outcomes():
+    repo = InstrumentedTicketRepository(InMemoryTicketRepository())
+    before = REPO_LATENCY.count(method="add", outcome="ok")
+    await repo.add(Ticket(title="t", description="d"))
+    assert REPO_LATENCY.count(method="add", outcome="ok") == before + 1
+
+    classifier = InstrumentedPriorityClassifier(
+        TbdPriorityClassifier(), layer="test"
+    )
+    await classifier.classify("a", "b")
+    assert CLASSIFIER_OUTCOMES.value(classifier="test", outcome="TBD") == 1
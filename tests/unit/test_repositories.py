@@ -0,0 +1,192 @@
+"""Contract tests that both repository adapters must pass identically."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.adapters.repos.concurrent_memory_repo import (
+    ConcurrentInMemoryTicketRepository,
+)
+from app.adapters.repos.in_memory_repo import InMemoryTicketRepository
+from app.adapters.repos.sqlite_repo import SQLiteTicketRepository
+from app.core.models import PageCursor, Priority, Status, Ticket
+
+
+@pytest.fixture(name="repo", params=["memory", "concurrent", "sqlite"])
+def repo(request):
+    if request.param == "memory":
+        return InMemoryTicketRepository()
+    if request.param == "concurrent":
+        return ConcurrentInMemoryTicketRepository()
+    return SQLiteTicketRepository(request.getfixturevalue("sqlite_engine"))
+
+
+async def _seed(repo, n: int = 7):
+    base = datetime(2025, 7, 1, tzinfo=timezone.utc)
+    tickets = []
+    for i in range(n):
+        # pairs of identical timestamps → the id tie-breaker matters
+        t = Ticket(
+            title=f"t{i}",
+            description="d",
+            status=Status.CLOSED if i % 3 == 0 else Status.OPEN,
+            created_at=base + timedelta(seconds=i // 2),
+        )
+        await repo.add(t)
+        tickets.append(t)
+    return sorted(
+        tickets, key=lambda t: (t.created_at, str(t.id)), reverse=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_walking_pages_yields_every_ticket_once_in_order(repo):
+    expected = await _seed(repo)
+
+    seen, after = [], None
+    while True:
+        page = await repo.list(limit=3, after=after)
+        seen.extend(page)
+        if len(page) < 3:
+            break
+        after = PageCursor(created_at=page[-1].created_at, id=page[-1].id)
+
+    assert [t.id for t in seen] == [t.id for t in expected]
+
+
+@pytest.mark.asyncio
+async def test_filters_combine_with_limit(repo):
+    expected = [t for t in await _seed(repo) if t.status == Status.OPEN]
+
+    page = await repo.list(status=Status.OPEN, limit=2)
+    assert [t.id for t in page] == [t.id for t in expected[:2]]
+
+
+@pytest.mark.asyncio
+async def test_add_many_spans_several_chunks(repo, monkeypatch):
+    monkeypatch.setattr(
+        "app.adapters.repos.sqlite_repo.BULK_CHUNK_SIZE", 4, raising=True
+    )
+    tickets = [Ticket(title=f"t{i}", description="d") for i in range(10)]
+    await repo.add_many(tickets)
+
+    stored = await repo.list()
+    assert {t.id for t in stored} == {t.id for t in tickets}
+
+
+@pytest.mark.asyncio
+async def test_status_change_moves_ticket_between_filters(repo):
+    tickets = await _seed(repo, 4)
+    target = next(t for t in tickets if t.status == Status.OPEN)
+
+    # the service mutates the object it got from get() before update()
+    fetched = await repo.get(target.id)
+    fetched.status = Status.IN_PROGRESS
+    fetched.priority = Priority.HIGH
+    await repo.update(fetched)
+
+    open_ids = {t.id for t in await repo.list(status=Status.OPEN)}
+    moved = await repo.list(status=Status.IN_PROGRESS, priority=Priority.HIGH)
+    assert target.id not in open_ids
+    assert [t.id for t in moved] == [target.id]
+
+    await repo.delete(target.id)
+    assert not await repo.list(status=Status.IN_PROGRESS)
+    assert len(await repo.list()) == 3
+
+
+@pytest.mark.asyncio
+async def test_update_fields_is_partial_versioned_and_conditional(repo):
+    ticket = Ticket(title="old", description="keep me")
+    await repo.add(ticket)
+
+    updated = await repo.update_fields(
+        ticket.id,
+        {"title": "new", "status": Status.CLOSED},
+        expected_version=1,
+    )
+    assert (updated.title, updated.description) == ("new", "keep me")
+    assert updated.status == Status.CLOSED and updated.version == 2
+    assert updated.created_at == ticket.created_at
+
+    stale = await repo.update_fields(
+        ticket.id, {"title": "lost"}, expected_version=1
+    )
+    assert stale is None
+    assert (await repo.get(ticket.id)).title == "new"
+
+
+@pytest.mark.asyncio
+async def test_delete_returns_the_row_and_honours_the_version(repo):
+    ticket = Ticket(title="t", description="d")
+    await repo.add(ticket)
+
+    assert await repo.delete(ticket.id, expected_version=7) is None
+    deleted = await repo.delete(ticket.id, expected_version=1)
+    assert deleted is not None and deleted.id == ticket.id
+    assert await repo.delete(ticket.id) is None
+
+
+@pytest.mark.asyncio
+async def test_iter_batches_streams_everything_in_list_order(repo):
+    expected = await _seed(repo, n=11)
+
+    batches = [b async for b in repo.iter_batches(batch_size=4)]
+    assert [len(b) for b in batches] == [4, 4, 3]
+    assert [t.id for b in batches for t in b] == [t.id for t in expected]
+
+    closed = [
+        t
+        async for b in repo.iter_batches(Status.CLOSED, batch_size=2)
+        for t in b
+    ]
+    assert [t.id for t in closed] == [
+        t.id for t in expected if t.status == Status.CLOSED
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_title_hits_first_and_tracks_writes(repo):
+    in_desc = Ticket(title="Login page", description="printer offline again")
+    in_title = Ticket(title="Printer is on fire", description="smoke")
+    other = Ticket(title="Typo", description="on the pricing page")
+    for t in (in_desc, in_title, other):
+        await repo.add(t)
+
+    hits = await repo.search("printer")
+    assert [t.id for t in hits] == [in_title.id, in_desc.id]
+    # every word must match; `word*` is a prefix; case and accents fold
+    assert [t.id for t in await repo.search("PRINTER offl*")] == [in_desc.id]
+    assert await repo.search("printer offl") == []
+    assert [t.id for t in await repo.search("prícing pag*")] == [other.id]
+    assert await repo.search("pricing pa*") == []  # prefix too short
+    # FTS5 operators and quotes in the input are plain words
+    assert [t.id for t in await repo.search('printer" -(ON')] == [in_title.id]
+    assert await repo.search("!!!") == []
+
+    assert await repo.search("printer", status=Status.CLOSED) == []
+    assert len(await repo.search("printer", limit=1, offset=1)) == 1
+
+    await repo.update_fields(in_title.id, {"title": "Scanner"})
+    await repo.delete(in_desc.id)
+    assert await repo.search("printer") == []
+    assert [t.id for t in await repo.search("scanner")] == [in_title.id]
+
+
+@pytest.mark.asyncio
+async def test_aggregate_counts_by_bucket_and_day(repo):
+    tickets = await _seed(repo)
+    closed_at = datetime(2025, 7, 3, 23, 30, tzinfo=timezone.utc)
+    still_open = next(t for t in tickets if t.status == Status.OPEN)
+    await repo.update_fields(
+        still_open.id, {"status": Status.CLOSED, "closed_at": closed_at}
+    )
+
+    stats = await repo.aggregate()
+    assert stats.counts == {
+        (Status.OPEN, Priority.TBD): 3,
+        (Status.CLOSED, Priority.TBD): 4,
+    }
+    assert stats.created_per_day == {datetime(2025, 7, 1).date(): 7}
+    # tickets without a closed_at only count in the status buckets
+    assert stats.closed_per_day == {closed_at.date(): 1}
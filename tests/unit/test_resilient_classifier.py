@@ -0,0 +1,153 @@
+import asyncio
+import time
+
+import pytest
+
+from app.adapters.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from app.adapters.llm.cached_classifier import CachingPriorityClassifier
+from app.adapters.llm.fake_classifier import FakePriorityClassifier
+from app.adapters.llm.resilient import (
+    FallbackPriorityClassifier,
+    ResilientPriorityClassifier,
+)
+from app.core.models import Priority
+from tests.conftest import FakeClock, StubPriorityClassifier
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_a_hanging_provider():
+    model = StubPriorityClassifier(latencies=[5.0])
+    guarded = ResilientPriorityClassifier(model, timeout_s=0.05)
+
+    start = time.perf_counter()
+    assert await guarded.classify("t", "d") == Priority.TBD
+    assert time.perf_counter() - start < 1.0
+    await asyncio.sleep(0)  # the abandoned call is cancelled, not awaited
+    assert guarded.timeouts == 1 and model.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_provider_calls_are_capped():
+    model = StubPriorityClassifier([Priority.HIGH], [0.02])
+    guarded = ResilientPriorityClassifier(model, max_concurrency=3)
+
+    results = await asyncio.gather(
+        *(guarded.classify(f"t{i}", "d") for i in range(20))
+    )
+    assert results == [Priority.HIGH] * 20
+    assert model.max_active == 3 and guarded.in_flight == 0
+
+
+def test_breaker_opens_half_opens_and_closes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(3, reset_timeout_s=10, clock=clock)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CLOSED and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN and not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() and not breaker.allow()  # one trial at a time
+    breaker.record_failure()  # failed trial: open again, full wait
+    clock.now = 19
+    assert not breaker.allow()
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.opened == 1
+
+
+def test_reports_from_before_a_trip_are_ignored():
+    clock = FakeClock()
+    breaker = CircuitBreaker(2, reset_timeout_s=10, clock=clock)
+    early = breaker.generation  # a slow call starts
+    breaker.record_failure(breaker.generation)
+    breaker.record_failure(breaker.generation)
+    assert breaker.state == OPEN and breaker.generation != early
+
+    clock.now = 10
+    assert breaker.allow()  # the half-open trial
+    trial = breaker.generation
+    breaker.record_success(early)  # the slow call finally succeeds
+    assert breaker.state == HALF_OPEN
+    breaker.record_failure(early)  # ...or fails: no new wait either
+    assert breaker.state == HALF_OPEN and breaker.opened == 1
+    breaker.record_success(trial)
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_a_late_success_does_not_close_a_tripped_breaker():
+    clock = FakeClock()
+    breaker = CircuitBreaker(2, reset_timeout_s=30, clock=clock)
+    model = StubPriorityClassifier(
+        [Priority.HIGH, Priority.TBD, Priority.TBD], [0.2, 0.0]
+    )
+    guarded = ResilientPriorityClassifier(model, breaker=breaker)
+
+    slow = asyncio.create_task(guarded.classify("slow", "d"))
+    await asyncio.sleep(0)
+    for _ in range(2):
+        assert await guarded.classify("t", "d") == Priority.TBD
+    assert breaker.state == OPEN
+    assert await asyncio.wait_for(slow, 5) == Priority.HIGH
+    assert breaker.state == OPEN
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_short_circuits_to_the_local_fallback():
+    clock = FakeClock()
+    model = StubPriorityClassifier(
+        [Priority.TBD, RuntimeError("502"), Priority.TBD]
+    )
+    guarded = ResilientPriorityClassifier(
+        model, breaker=CircuitBreaker(3, reset_timeout_s=30, clock=clock)
+    )
+    cache = CachingPriorityClassifier(guarded, version="v1")
+    classifier = FallbackPriorityClassifier(cache, FakePriorityClassifier())
+
+    for _ in range(3):
+        assert await classifier.classify("Checkout", "error 500") == (
+            Priority.HIGH
+        )
+    assert model.calls == 3 and guarded.failures == 3
+    # open: answered locally without touching the provider
+    assert await classifier.classify("Docs", "typo") == Priority.LOW
+    assert model.calls == 3 and guarded.short_circuits == 1
+    assert guarded.stats()["breaker_open"] == 1.0
+    # fallback answers are never cached as if the LLM had said so
+    assert cache.stats()["entries"] == 0 and classifier.fallbacks == 4
+
+    clock.now = 30  # half-open trial reaches the (recovered) provider
+    model.script(Priority.MEDIUM)
+    assert await classifier.classify("Docs", "typo") == Priority.MEDIUM
+    assert guarded.stats()["breaker_open"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_hedge_beats_a_slow_first_attempt():
+    model = StubPriorityClassifier([Priority.LOW], [5.0, 0.01])
+    guarded = ResilientPriorityClassifier(
+        model, timeout_s=2.0, hedge_after_s=0.05
+    )
+
+    start = time.perf_counter()
+    assert await guarded.classify("t", "d") == Priority.LOW
+    assert time.perf_counter() - start < 1.0
+    await asyncio.sleep(0)  # let the losing attempt see its cancellation
+    assert guarded.hedges == 1 and model.calls == 2 and model.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_attempt_is_retried_within_the_hedge_budget():
+    model = StubPriorityClassifier([RuntimeError("reset"), Priority.HIGH])
+    guarded = ResilientPriorityClassifier(model, hedge_after_s=1.0)
+    assert await guarded.classify("t", "d") == Priority.HIGH
+    assert model.calls == 2
+
+    no_hedging = ResilientPriorityClassifier(
+        StubPriorityClassifier([RuntimeError("reset"), Priority.HIGH])
+    )
+    assert await no_hedging.classify("t", "d") == Priority.TBD
@@ -0,0 +1,214 @@
+"""Near-duplicate index and priority reuse in the service."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.adapters.repos.in_memory_repo import InMemoryTicketRepository
+from app.adapters.similarity import SimilarityIndex, embed
+from app.core import service as service_module
+from app.core.models import Priority, Ticket
+from app.core.service import TicketService
+from app.workers.pool import WorkerPool
+from tests.conftest import FakeClock, StubPriorityClassifier
+
+
+def _cosine(a, b) -> float:
+    return float(np.dot(embed(*a), embed(*b)))
+
+
+def test_embedding_scores_near_duplicates_above_unrelated_text():
+    base = ("Checkout fails", "Payment page returns error 500 on submit")
+    assert _cosine(base, base) == pytest.approx(1.0, abs=1e-5)
+    assert _cosine(base, ("checkout FAILS!", base[1].lower())) > 0.99
+    reworded = ("Checkout failing", "payment page returns a 500 error")
+    unrelated = ("Typo on about screen", "'teh' in paragraph two")
+    assert _cosine(base, reworded) > 0.6
+    assert _cosine(base, unrelated) < 0.2
+    assert not embed("", "").any()
+
+
+def test_nearest_ranks_excludes_and_evicts_least_recently_written():
+    index = SimilarityIndex(3)
+    tickets = [
+        Ticket(title="VPN drops", description="after the update"),
+        Ticket(title="VPN drops often", description="after update"),
+        Ticket(title="Printer jammed", description="third floor"),
+    ]
+    for t in tickets:
+        index.upsert(t)
+    ids = [i for i, _ in index.nearest("VPN drops", "after the update")]
+    assert ids[:2] == [tickets[0].id, tickets[1].id]
+    assert tickets[2].id not in ids  # nothing in common: not a neighbour
+    ids = [
+        i
+        for i, _ in index.nearest(
+            "VPN drops", "after the update", exclude=tickets[0].id
+        )
+    ]
+    assert ids == [tickets[1].id]
+
+    index.upsert(tickets[0])  # rewritten: now the most recent
+    index.upsert(Ticket(title="Laptop fan", description="loud"))
+    assert len(index) == 3
+    assert index.nearest("VPN drops often", "after update")[0][0] == (
+        tickets[0].id  # tickets[1] was the oldest write and got evicted
+    )
+
+
+def test_reuse_needs_a_classified_recent_close_match():
+    clock = FakeClock(datetime.now(timezone.utc))
+    index = SimilarityIndex(
+        10, reuse_threshold=0.8, reuse_window_s=60, clock=clock
+    )
+    tbd = Ticket(title="Disk full", description="server db1 out of space")
+    index.upsert(tbd)
+    assert index.reusable_priority(tbd.title, tbd.description) is None
+
+    tbd.priority, tbd.version = Priority.HIGH, 2
+    index.upsert(tbd)
+    assert index.reusable_priority("disk full", "Server db1 out of space")
+    assert index.reusable_priority("Disk slow", "laptop fan noise") is None
+
+    clock.now += timedelta(seconds=61)
+    assert index.reusable_priority(tbd.title, tbd.description) is None
+    assert index.stats() == {"entries": 1, "reuses": 1}
+
+    stale = Ticket(id=tbd.id, title="x", description="y", version=1)
+    index.upsert(stale)  # older version (e.g. read by a rebuild): ignored
+    assert index.nearest(tbd.title, tbd.description)[0][0] == tbd.id
+    index.remove(tbd.id)
+    assert len(index) == 0 and index.nearest("disk", "full") == []
+
+
+def test_a_reused_priority_expires_with_the_verdict_it_copied():
+    clock = FakeClock(datetime.now(timezone.utc))
+    index = SimilarityIndex(
+        10, reuse_threshold=0.8, reuse_window_s=60, clock=clock
+    )
+
+    def _write(title, priority, **kwargs):
+        ticket = Ticket(
+            title=title,
+            description="server db1 out of space",
+            priority=priority,
+            updated_at=clock.now,
+            **kwargs,
+        )
+        index.upsert(ticket)
+        return ticket
+
+    _write("Disk full", Priority.HIGH)
+    for _ in range(3):  # each near-duplicate copies the one before
+        clock.now += timedelta(seconds=25)
+        reused = index.reusable_priority(
+            "Disk full", "server db1 out of space"
+        )
+        if reused is None:
+            break
+        _write("Disk full", reused)
+    assert index.stats()["reuses"] == 2  # the copies don't renew it
+
+    edited = _write("Disk full!", Priority.LOW)  # a new verdict does
+    assert index.reusable_priority("Disk full", "server db1 out of space")
+    clock.now += timedelta(seconds=40)
+    _write("Disk full", Priority.LOW, id=edited.id, version=2)
+    clock.now += timedelta(seconds=40)  # an edit doesn't renew it
+    assert index.reusable_priority("Disk full", "server db1 out of space") is (
+        None
+    )
+
+
+@pytest.mark.asyncio
+async def test_rebuild_skips_tickets_deleted_while_it_reads(monkeypatch):
+    monkeypatch.setattr(service_module, "SIMILARITY_REBUILD_PAGE_SIZE", 1)
+    repo, index = InMemoryTicketRepository(), SimilarityIndex(100)
+    for i in range(3):
+        await repo.add(Ticket(title=f"t{i}", description="d"))
+    service = TicketService(
+        repo, StubPriorityClassifier([Priority.HIGH]), similarity_index=index
+    )
+    read, deleted = repo.list, []
+
+    async def _list(**kwargs):
+        page = await read(**kwargs)
+        if not deleted:  # deleted after its page was read
+            deleted.append((await service.delete_ticket(page[0].id)).id)
+        return page
+
+    monkeypatch.setattr(repo, "list", _list)
+    assert await service.rebuild_similarity_index(10) == 2
+    ids = {i for i, _ in index.nearest("t0 t1 t2", "d", limit=10)}
+    assert len(ids) == 2 and deleted[0] not in ids
+
+
+@pytest.mark.asyncio
+async def test_service_reuses_priority_and_maintains_the_index():
+    repo = InMemoryTicketRepository()
+    classifier = StubPriorityClassifier([Priority.HIGH])
+    index = SimilarityIndex(100)
+    service = TicketService(repo, classifier, similarity_index=index)
+
+    first = await service.create_ticket("Login broken", "SSO loop on login")
+    again = await service.create_ticket("login broken", "SSO loop on login!")
+    assert again.priority == first.priority == Priority.HIGH
+    assert classifier.calls == 1
+
+    other = await service.create_ticket("Dark mode", "please add it")
+    assert classifier.calls == 2
+    similar = await service.similar_tickets(first.id)
+    assert [t.id for t, _ in similar][0] == again.id
+    assert all(t.id != first.id for t, _ in similar)
+
+    await service.update_ticket(other.id, title="Login broken")
+    await service.delete_ticket(again.id)
+    ids = [t.id for t, _ in await service.similar_tickets(first.id)]
+    assert ids == [other.id]
+    with pytest.raises(TicketService.NotFoundError):
+        await service.similar_tickets(again.id)
+
+    rebuilt = SimilarityIndex(100)
+    service = TicketService(repo, classifier, similarity_index=rebuilt)
+    assert await service.rebuild_similarity_index(1000) == 2
+    assert len(rebuilt) == 2
+
+
+@pytest.mark.asyncio
+async def test_background_mode_skips_the_queue_for_reused_priorities():
+    repo = InMemoryTicketRepository()
+    classifier = StubPriorityClassifier([Priority.HIGH])
+    services = {}
+    pool = WorkerPool(lambda tid: services["svc"].classify_ticket(tid))
+    services["svc"] = service = TicketService(
+        repo,
+        classifier,
+        classification_queue=pool,
+        similarity_index=SimilarityIndex(100),
+    )
+    await pool.start()
+
+    first = await service.create_ticket("Prod down", "checkout fails")
+
+    async def _first_classified():
+        while (await repo.get(first.id)).priority == Priority.TBD:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_first_classified(), 5)
+    dupes = await service.create_tickets(
+        [("Prod down", "checkout fails"), ("New logo", "for the footer")]
+    )
+
+    async def _second_call():  # the bulk enqueue runs in the background
+        while classifier.calls < 2:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_second_call(), 5)
+    await pool.drain(timeout=1)
+
+    assert first.priority == Priority.TBD
+    assert dupes[0].priority == Priority.HIGH  # reused, never queued
+    assert dupes[1].priority == Priority.TBD
+    assert classifier.calls == 2
+    assert (await repo.get(dupes[1].id)).priority == Priority.HIGH
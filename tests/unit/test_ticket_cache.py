@@ -0,0 +1,70 @@
+"""CachingTicketRepository: hits, invalidation and negative lookups."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.adapters.repos.cached_repo import CachingTicketRepository
+from app.adapters.repos.in_memory_repo import InMemoryTicketRepository
+from app.core.models import Status, Ticket
+
+
+class CountingRepo(InMemoryTicketRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets = 0
+
+    async def get(self, ticket_id):
+        self.gets += 1
+        return await super().get(ticket_id)
+
+
+@pytest.mark.asyncio
+async def test_repeated_gets_are_served_from_cache():
+    inner = CountingRepo()
+    repo = CachingTicketRepository(inner)
+    ticket = Ticket(title="t", description="d")
+    await repo.add(ticket)
+
+    for _ in range(5):
+        assert (await repo.get(ticket.id)).id == ticket.id
+    assert inner.gets == 1
+    assert repo.stats()["hits"] == 4
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_invalidate():
+    inner = CountingRepo()
+    repo = CachingTicketRepository(inner)
+    ticket = Ticket(title="t", description="d")
+    await repo.add(ticket)
+
+    cached = await repo.get(ticket.id)
+    cached.status = Status.CLOSED  # caller mutation must not leak in
+    assert (await repo.get(ticket.id)).status == Status.OPEN
+
+    await repo.update(cached)
+    assert (await repo.get(ticket.id)).status == Status.CLOSED
+
+    await repo.delete(ticket.id)
+    assert await repo.get(ticket.id) is None
+
+
+@pytest.mark.asyncio
+async def test_negative_lookups_expire_quickly_and_add_clears_them():
+    inner = CountingRepo()
+    repo = CachingTicketRepository(inner, negative_ttl_s=0.05)
+    missing = uuid4()
+
+    assert await repo.get(missing) is None
+    assert await repo.get(missing) is None
+    assert inner.gets == 1
+
+    await asyncio.sleep(0.06)
+    assert await repo.get(missing) is None
+    assert inner.gets == 2
+
+    ticket = Ticket(id=missing, title="late", description="d")
+    await repo.add(ticket)
+    assert (await repo.get(missing)).title == "late"
@@ -0,0 +1,61 @@
+"""Hydrating stored rows into Tickets and writing list bodies as JSON."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.adapters.repos.sqlite_repo import SQLiteTicketRepository
+from app.api import schemas as dto
+from app.core.models import Priority, Status, Ticket
+
+_AS_READ = TypeAdapter(List[dto.TicketRead])
+
+
+def _tickets() -> List[Ticket]:
+    utc = datetime(2025, 3, 1, 12, 30, 5, tzinfo=timezone.utc)
+    return [
+        Ticket(title="Login down", description='ü ✓ "quoted"'),
+        Ticket(
+            title="Typo",
+            description="",
+            priority=Priority.LOW,
+            status=Status.CLOSED,
+            created_at=utc.replace(microsecond=120000),
+            updated_at=utc.astimezone(timezone(timedelta(hours=2))),
+            version=7,
+            closed_at=utc,
+        ),
+        # naive values from rows written before times were tz-aware
+        Ticket(
+            created_at=datetime(2024, 1, 2), updated_at=datetime(2024, 1, 2)
+        ),
+    ]
+
+
+def test_dump_tickets_matches_ticket_read():
+    tickets = _tickets()
+    expected = _AS_READ.dump_json(_AS_READ.validate_python(tickets))
+    assert dto.dump_tickets(tickets) == expected
+    assert json.loads(dto.dump_tickets([])) == []
+
+
+def test_rows_hydrate_by_position():
+    row = (
+        "5f0c6a1e-8a3b-4a59-9b7e-1f2d3c4b5a69",
+        "Title",
+        "Body",
+        "HIGH",
+        "CLOSED",
+        "2025-03-01 12:30:05+00:00",
+        "2025-03-01 12:31:00+00:00",
+        3,
+        "2025-03-01 12:31:00+00:00",
+    )
+    ticket = SQLiteTicketRepository._row_to_ticket(row)
+    assert ticket.priority is Priority.HIGH
+    assert ticket.status is Status.CLOSED
+    assert ticket.closed_at == ticket.updated_at
+    assert str(ticket.id) == row[0] and ticket.version == 3
+    assert not hasattr(ticket, "__dict__")
@@ -0,0 +1,77 @@
+"""Incremental ticket counters stay equal to a full aggregate."""
+
+import pytest
+
+from app.adapters.repos.in_memory_repo import InMemoryTicketRepository
+from app.core.models import Priority, Status, Ticket
+from app.core.service import TicketService
+from app.core.stats import TicketCounters
+from app.workers.pool import WorkerPool
+from tests.conftest import StubPriorityClassifier
+
+
+def _service(repo, **kw):
+    return TicketService(
+        repository=repo,
+        classifier=StubPriorityClassifier(),
+        counters=TicketCounters(),
+        **kw,
+    )
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_every_write_without_rescanning():
+    repo = InMemoryTicketRepository()
+    svc = _service(repo)
+    await svc.reconcile_stats()
+
+    a = await svc.create_ticket("Button typo", "cosmetic")  # LOW
+    b = await svc.create_ticket("Crash", "app down")  # MEDIUM
+    await svc.create_tickets([("x", "y"), ("button", "z")])
+
+    closed = await svc.update_ticket(a.id, status=Status.CLOSED)
+    assert closed.closed_at is not None
+    await svc.update_ticket(a.id, title="renamed")  # no status change
+    await svc.update_ticket(b.id, status=Status.IN_PROGRESS)
+    await svc.delete_ticket(b.id)
+
+    stats = await svc.get_stats()
+    assert stats == await repo.aggregate()
+    assert stats.counts[(Status.CLOSED, Priority.LOW)] == 1
+    assert sum(stats.closed_per_day.values()) == 1
+    assert sum(stats.created_per_day.values()) == 3
+
+    reopened = await svc.update_ticket(a.id, status=Status.OPEN)
+    assert reopened.closed_at is None
+    assert (await svc.get_stats()).closed_per_day == {}
+    assert not await svc.reconcile_stats()  # nothing drifted
+
+
+@pytest.mark.asyncio
+async def test_background_classification_moves_the_priority_bucket():
+    repo = InMemoryTicketRepository()
+    services = {}
+    pool = WorkerPool(lambda tid: services["svc"].classify_ticket(tid))
+    svc = services["svc"] = _service(repo, classification_queue=pool)
+    await pool.start()
+
+    ticket = await svc.create_ticket("Crash", "down")
+    assert (await svc.get_stats()).counts == {(Status.OPEN, Priority.TBD): 1}
+    await pool.drain(timeout=1)
+    assert (await svc.get_stats()).counts == {
+        (Status.OPEN, Priority.MEDIUM): 1
+    }
+    assert (await repo.get(ticket.id)).priority == Priority.MEDIUM
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_writes_made_behind_the_service():
+    repo = InMemoryTicketRepository()
+    svc = _service(repo)
+    await svc.create_ticket("t", "d")  # counters load lazily on first read
+    assert sum((await svc.get_stats()).counts.values()) == 1
+
+    await repo.add(Ticket(title="elsewhere", description="d"))
+    assert sum((await svc.get_stats()).counts.values()) == 1  # stale
+    assert await svc.reconcile_stats()
+    assert sum((await svc.get_stats()).counts.values()) == 2
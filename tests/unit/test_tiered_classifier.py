@@ -0,0 +1,137 @@
+"""Local pre-classification stages and the cascade in front of the LLM."""
+
+import asyncio
+
+import pytest
+
+from app.adapters.llm.local_model import NaiveBayesPriorityModel, evaluate
+from app.adapters.llm.rules import KeywordRules
+from app.adapters.llm.tiered import TieredPriorityClassifier
+from app.core.models import Priority
+from tests.conftest import StubPriorityClassifier
+
+SAMPLES = [
+    ("Checkout broken", "payment page returns 500", Priority.HIGH),
+    ("Checkout broken again", "payment gateway rejects cards", Priority.HIGH),
+    ("Payment gateway down", "no card payment goes through", Priority.HIGH),
+    ("Export is slow", "csv export takes minutes", Priority.MEDIUM),
+    ("Report export slow", "monthly report export lags", Priority.MEDIUM),
+    ("Footer colour", "footer colour slightly off", Priority.LOW),
+    ("Footer link colour", "footer links use old colour", Priority.LOW),
+    ("Left over", "never classified", Priority.TBD),
+]
+
+
+def test_keyword_rules_weigh_matches_and_conflicts():
+    rules = KeywordRules()
+    assert rules.predict("App crashed", "on login") == (Priority.HIGH, 1.0)
+    # prefix match at a word start only
+    assert rules.predict("Upload failed", "")[0] == Priority.HIGH
+    assert rules.predict("nofail", "") is None
+    priority, confidence = rules.predict("Error page", "")
+    assert priority == Priority.HIGH and confidence == 0.5
+    _, mixed = rules.predict("Urgent", "typo in the footer")
+    assert mixed <= 0.5
+    assert rules.predict("Data loss", "")[0] == Priority.HIGH
+
+
+def test_naive_bayes_model_round_trips_and_reports_coverage(tmp_path):
+    model = NaiveBayesPriorityModel.fit(SAMPLES, min_count=1)
+    priority, confidence = model.predict("Checkout broken", "payment 500")
+    assert priority == Priority.HIGH and confidence > 0.9
+    assert model.predict("zzz", "qqq") is None
+
+    model.save(tmp_path / "model.json")
+    loaded = NaiveBayesPriorityModel.load(tmp_path / "model.json")
+    assert len(loaded) == len(model)
+    assert loaded.predict("Footer colour", "off") == model.predict(
+        "Footer colour", "off"
+    )
+    report = evaluate(loaded, SAMPLES[:-1], min_confidence=0.9)
+    assert report["accuracy"] == 1.0 and 0 < report["coverage"] <= 1.0
+
+    with pytest.raises(ValueError):
+        NaiveBayesPriorityModel.fit(SAMPLES[-1:])
+
+
+@pytest.mark.asyncio
+async def test_confident_tickets_never_reach_the_llm():
+    llm = StubPriorityClassifier([Priority.HIGH])
+    tiered = TieredPriorityClassifier([KeywordRules()], llm)
+
+    assert await tiered.classify("Site outage", "all pages") == Priority.HIGH
+    assert await tiered.classify("Typo", "on the about page") == Priority.LOW
+    assert llm.calls == 0
+
+    # one weak keyword (0.5 confidence) and no keyword at all: escalated
+    assert await tiered.classify("Export problem", "csv") == Priority.HIGH
+    assert await tiered.classify("Question", "about invoices") == (
+        Priority.HIGH
+    )
+    assert llm.calls == 2
+    stats = tiered.stats()
+    assert stats["escalation_rate"] == 0.5
+    assert stats["agreement_escalated"] == 0.0  # rules guessed MEDIUM
+
+
+@pytest.mark.asyncio
+async def test_later_stage_settles_what_the_rules_cannot():
+    model = NaiveBayesPriorityModel.fit(SAMPLES, min_count=1)
+    llm = StubPriorityClassifier()
+    tiered = TieredPriorityClassifier(
+        [KeywordRules(), model], llm, min_confidence=0.9
+    )
+    assert await tiered.classify("Payment gateway", "cards rejected") == (
+        Priority.HIGH
+    )
+    assert llm.calls == 0 and tiered.local == 1
+
+
+@pytest.mark.asyncio
+async def test_audit_double_checks_local_answers_in_the_background():
+    llm = StubPriorityClassifier([Priority.MEDIUM])
+    tiered = TieredPriorityClassifier(
+        [KeywordRules()], llm, audit_rate=0.5, rand=lambda: 0.1
+    )
+    assert await tiered.classify("Crash", "on start") == Priority.HIGH
+    await asyncio.sleep(0)
+    assert llm.calls == 1
+    assert tiered.stats()["audited"] == 1
+    assert tiered.stats()["agreement_local"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_aclose_cancels_audits_still_waiting_on_the_llm():
+    llm = StubPriorityClassifier([Priority.MEDIUM], latencies=[5.0])
+    tiered = TieredPriorityClassifier(
+        [KeywordRules()], llm, audit_rate=1.0, rand=lambda: 0.0
+    )
+    assert await tiered.classify("Crash", "on start") == Priority.HIGH
+    await asyncio.sleep(0)  # the audit is waiting on the LLM
+    assert llm.active == 1
+
+    await asyncio.wait_for(tiered.aclose(), 1)
+    assert llm.cancelled == 1 and tiered.stats()["audited"] == 0
+
+
+@pytest.mark.asyncio
+async def test_container_puts_the_cascade_in_front_of_the_llm_chain():
+    from app.adaptors_stub import build_container
+    from app.config import Settings
+
+    container = build_container(
+        Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            classifier="tbd",
+            classify_local=True,
+            metrics_enabled=False,
+        )
+    )
+    try:
+        classifier = container.classifier
+        assert await classifier.classify("Site outage", "") == Priority.HIGH
+        assert await classifier.classify("Question", "") == Priority.TBD
+        assert "classifier_tiers" in container.metric_names
+        assert container.tiered is classifier  # its audits closed with it
+    finally:
+        await container.aclose()